@@ -0,0 +1,76 @@
+"""
+Consumer throughput of one subscriber: per-arrival ``async for`` versus batched receive.
+
+A producer task delivers prebuilt arrivals into the subscriber in bursts, yielding to the event loop after each burst
+like a transport reading a socket would; the node-side dispatch is left out to isolate the delivery machinery.
+The consumer either iterates the subscriber one arrival at a time or drains it with receive_batch(), optionally
+lingering to coalesce several bursts into one wakeup. Reported are the messages consumed per second and the
+consumer loop iterations per message.
+
+Run from the repository root:  python -m benchmarks.batch_receive
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from pycyphal2 import Arrival, Instant, Priority
+from pycyphal2._subscriber import BreadcrumbImpl
+from tests.mock_transport import MockTransport
+from tests.typing_helpers import new_node, subscribe_impl
+
+MESSAGES = 50_000
+BURSTS = [1, 16, 256]
+MODES: dict[str, tuple[int, float] | None] = {"anext": None, "batch": (256, 0.0), "linger": (256, 0.0005)}
+REPEAT = 5
+
+
+async def run(burst: int, batch: tuple[int, float] | None) -> tuple[float, float]:
+    node = new_node(MockTransport(node_id=1), home="bench")
+    sub = subscribe_impl(node, "/bench/topic")
+    topic = node.topics_by_name["bench/topic"]
+    breadcrumb = BreadcrumbImpl(node, 42, topic, 0, Priority.NOMINAL)
+    arrivals = [Arrival(Instant(ns=1), breadcrumb, b"") for _ in range(MESSAGES)]
+
+    async def produce() -> None:
+        for i in range(0, MESSAGES, burst):
+            for tag in range(i, min(i + burst, MESSAGES)):
+                sub.deliver(arrivals[tag], tag, 42)
+            await asyncio.sleep(0)
+
+    iterations = 0
+    received = 0
+    started = time.perf_counter()
+    producer = asyncio.create_task(produce())
+    if batch is None:
+        async for _ in sub:
+            iterations += 1
+            received += 1
+            if received == MESSAGES:
+                break
+    else:
+        async for items in sub.batches(*batch):
+            iterations += 1
+            received += len(items)
+            if received == MESSAGES:
+                break
+    elapsed = time.perf_counter() - started
+    await producer
+
+    sub.close()
+    node.close()
+    return MESSAGES / elapsed, iterations / MESSAGES
+
+
+def main() -> None:
+    print(f"{'burst':>6} {'mode':<8} {'msg/s':>10} {'iterations/msg':>15}")
+    for burst in BURSTS:
+        for label, batch in MODES.items():
+            runs = [asyncio.run(run(burst, batch)) for _ in range(REPEAT)]
+            rate = max(r[0] for r in runs)
+            print(f"{burst:>6} {label:<8} {rate:>10.0f} {min(r[1] for r in runs):>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Subject-ID allocation under collision storms.
+
+A node subscribes to N topics on a mock transport whose subject-ID modulus is barely larger than N, so most
+allocations evict another topic and many evictions cascade. Then every topic in turn learns from a remote that
+it has lost its subject-ID, which triggers another cascade of reallocations.
+Reported are the transport listeners opened per topic and the best wall time of both phases.
+
+Run from the repository root:  python -m benchmarks.collision_storm
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+
+from pycyphal2._node import GossipScope
+from tests.mock_transport import MockTransport
+from tests.typing_helpers import new_node
+
+TOPIC_COUNTS = [1000, 3000, 6000]
+MODULUS_SLACK = 1.05
+REPEAT = 3
+
+
+async def run(topic_count: int) -> tuple[float, float, float, float]:
+    tr = MockTransport(node_id=1, modulus=int(topic_count * MODULUS_SLACK))
+    node = new_node(tr, home="bench")
+
+    started = time.monotonic()
+    subs = [node.subscribe(f"/bench/{i}") for i in range(topic_count)]
+    subscribe_time = time.monotonic() - started
+    subscribe_opens = sum(tr.subject_listener_creations.values())
+
+    now = time.monotonic()
+    rng = random.Random(topic_count)
+    for topic in node.topics_by_name.values():
+        topic.ts_origin = now - rng.uniform(0.0, 1e6)  # Mixed ages, so that evicted topics win and lose in turn.
+    started = time.monotonic()
+    for topic in list(node.topics_by_name.values()):
+        node.on_gossip_known(topic, topic.evictions + 1, topic.lage(now) + 1, now, GossipScope.SHARDED)
+    storm_time = time.monotonic() - started
+    storm_opens = sum(tr.subject_listener_creations.values()) - subscribe_opens
+
+    for s in subs:
+        s.close()
+    node.close()
+    return subscribe_opens / topic_count, subscribe_time, storm_opens / topic_count, storm_time
+
+
+def main() -> None:
+    print(f"{'topics':>8} {'opens/topic':>12} {'subscribe':>10} {'opens/topic':>12} {'storm':>10}")
+    for n in TOPIC_COUNTS:
+        runs = [asyncio.run(run(n)) for _ in range(REPEAT)]
+        sub_opens, storm_opens = runs[0][0], runs[0][2]
+        sub_time, storm_time = min(r[1] for r in runs), min(r[3] for r in runs)
+        print(f"{n:>8} {sub_opens:>12.2f} {sub_time:>9.3f}s {storm_opens:>12.2f} {storm_time:>9.3f}s")
+
+
+if __name__ == "__main__":
+    main()
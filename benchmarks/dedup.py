@@ -0,0 +1,107 @@
+"""
+Reliable-message throughput and deduplication memory with many publishers on one topic.
+
+Pre-built transport arrivals carrying reliable messages from PUBLISHERS distinct remotes are injected straight into
+the node round-robin, bypassing the transport; every tenth one is a retransmission of an earlier message,
+which the node must recognize as a duplicate. The subscriber queue is drained as it fills, and the outgoing ACKs
+are sent to a mock transport. Reported are the messages per second (untraced run), the memory retained by the node
+per remote as seen by tracemalloc (traced run), and the size of one remote's deduplication state.
+Finally, DedupState.check_and_record() alone is timed on a long sequential stream with occasional duplicates and
+gaps, which keeps the history saturated.
+
+Run from the repository root:  python -m benchmarks.dedup
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import sys
+import time
+import tracemalloc
+
+from pycyphal2 import Instant, Priority, TransportArrival
+from pycyphal2._header import MsgRelHeader
+from pycyphal2._node import DedupState
+from tests.mock_transport import MockTransport
+from tests.typing_helpers import new_node, subscribe_impl
+
+PUBLISHERS = 1000
+ROUNDS = 50
+DUPLICATE_EVERY = 10
+REPEAT = 3
+
+
+def deep_size(obj: object) -> int:
+    slots = getattr(type(obj), "__slots__", ())
+    fields = [getattr(obj, name) for name in slots] + list(getattr(obj, "__dict__", {}).values())
+    size = sys.getsizeof(obj) + (sys.getsizeof(obj.__dict__) if hasattr(obj, "__dict__") else 0)
+    return size + sum(sys.getsizeof(f) for f in fields if isinstance(f, (int, float, bytes, bytearray)))
+
+
+async def run(traced: bool) -> tuple[float, float, float]:
+    node = new_node(MockTransport(node_id=1), home="bench")
+    sub = subscribe_impl(node, "/bench/topic")
+    topic = node.topics_by_name["bench/topic"]
+    sid = topic.subject_id(node.transport.subject_id_modulus)
+    lage = topic.lage(time.monotonic())
+    now = Instant.now()
+    arrivals = []
+    for rnd in range(ROUNDS):
+        for remote_id in range(1, PUBLISHERS + 1):
+            tag = rnd if (remote_id % DUPLICATE_EVERY) or (rnd == 0) else rnd - 1
+            header = MsgRelHeader(lage, topic.evictions, topic.hash, (remote_id << 20) + tag)
+            arrivals.append(TransportArrival(now, Priority.NOMINAL, remote_id, header.serialize()))
+
+    gc.collect()
+    if traced:
+        tracemalloc.start()
+    started = time.perf_counter()
+    for i, arrival in enumerate(arrivals):
+        node.dispatch_arrival(arrival, subject_id=sid, unicast=False)
+        if i % PUBLISHERS == 0:
+            while not sub.queue.empty():
+                sub.queue.get_nowait()
+            await asyncio.sleep(0)  # Let the ACKs go out.
+    elapsed = time.perf_counter() - started
+    while not sub.queue.empty():
+        sub.queue.get_nowait()
+    for _ in range(3):
+        await asyncio.sleep(0)
+    gc.collect()
+    retained = 0
+    if traced:
+        retained = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    assert len(topic.dedup) == PUBLISHERS
+    state_size = deep_size(next(iter(topic.dedup.values())))
+
+    sub.close()
+    node.close()
+    return len(arrivals) / elapsed, retained / PUBLISHERS, state_size
+
+
+def run_state() -> float:
+    tags = []
+    for tag in range(200_000):
+        tags.append(tag)
+        if tag % DUPLICATE_EVERY == 0:
+            tags.append(tag - 3)
+        if tag % 1000 == 0:
+            tags.append(tag + 100)
+    state = DedupState()
+    started = time.perf_counter()
+    for tag in tags:
+        state.check_and_record(tag, 1.0)
+    return (time.perf_counter() - started) / len(tags)
+
+
+def main() -> None:
+    rate = max(asyncio.run(run(False))[0] for _ in range(REPEAT))
+    _, memory, state_size = asyncio.run(run(True))
+    print(f"{PUBLISHERS} publishers: {rate:.0f} msg/s; {memory:.0f} bytes/remote retained; {state_size} bytes/state")
+    print(f"check_and_record: {min(run_state() for _ in range(REPEAT)) * 1e9:.0f} ns/tag")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Received-message throughput of the session layer: messages per second through NodeImpl.dispatch_arrival().
+
+Pre-built transport arrivals carrying best-effort messages are injected straight into the node, bypassing the
+transport, and the subscriber queue is drained as it fills. Both a verbatim subscription (explicit topic) and
+a pattern subscription (implicit topic) are measured.
+
+Run from the repository root:  python -m benchmarks.dispatch
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from pycyphal2 import Instant, Priority, TransportArrival
+from pycyphal2._header import MsgBeHeader
+from pycyphal2._subscriber import SubscriberImpl
+from tests.mock_transport import MockTransport
+from tests.typing_helpers import new_node, subscribe_impl
+
+MESSAGES = 200_000
+PAYLOAD_SIZE = 64
+DRAIN_EVERY = 1000
+
+
+def drain(sub: SubscriberImpl) -> None:
+    while not sub.queue.empty():
+        sub.queue.get_nowait()
+
+
+async def run(subscription: str) -> float:
+    node = new_node(MockTransport(node_id=1), home="bench")
+    sub = subscribe_impl(node, subscription)
+    pub = node.advertise("/bench/topic")
+    topic = node.topics_by_name["bench/topic"]
+    pub.close()
+    sid = topic.subject_id(node.transport.subject_id_modulus)
+    arrivals = [
+        TransportArrival(
+            timestamp=Instant.now(),
+            priority=Priority.NOMINAL,
+            remote_id=42,
+            message=MsgBeHeader(topic.lage(time.monotonic()), topic.evictions, topic.hash, tag).serialize()
+            + bytes(PAYLOAD_SIZE),
+        )
+        for tag in range(DRAIN_EVERY)
+    ]
+
+    started = time.perf_counter()
+    for _ in range(MESSAGES // DRAIN_EVERY):
+        for arrival in arrivals:
+            node.dispatch_arrival(arrival, subject_id=sid, unicast=False)
+        drain(sub)
+    elapsed = time.perf_counter() - started
+
+    sub.close()
+    node.close()
+    return MESSAGES / elapsed
+
+
+def main() -> None:
+    for subscription in ["/bench/topic", "/bench/>"]:
+        rate = asyncio.run(run(subscription))
+        print(f"{subscription:<16} {rate:>10.0f} msg/s")
+
+
+if __name__ == "__main__":
+    main()
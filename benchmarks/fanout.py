@@ -0,0 +1,93 @@
+"""
+Per-message cost of delivering one topic to many local subscribers.
+
+Pre-built best-effort transport arrivals are injected straight into the node in bursts, bypassing the transport,
+while SUBSCRIBERS consumer tasks iterate over their subscribers with ``async for``. The subscribers either have
+private queues or read the shared ring of their root. Reported is the time per message, the consumers included,
+and the time spent in the node's delivery alone with nobody waiting.
+
+Run from the repository root:  python -m benchmarks.fanout
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from pycyphal2 import Instant, Priority, TransportArrival
+from pycyphal2._header import MsgBeHeader
+from pycyphal2._subscriber import SubscriberImpl
+from tests.mock_transport import MockTransport
+from tests.typing_helpers import new_node, subscribe_impl
+
+SUBSCRIBERS = 30
+MESSAGES = 10_000
+BURSTS = [1, 16]
+REPEAT = 3
+
+
+def setup(shared: bool) -> tuple[object, list[SubscriberImpl], list[TransportArrival], int]:
+    node = new_node(MockTransport(node_id=1), home="bench")
+    subs = [subscribe_impl(node, "/bench/topic", shared=shared) for _ in range(SUBSCRIBERS)]
+    topic = node.topics_by_name["bench/topic"]
+    sid = topic.subject_id(node.transport.subject_id_modulus)
+    lage = topic.lage(time.monotonic())
+    now = Instant.now()
+    arrivals = [
+        TransportArrival(now, Priority.NOMINAL, 42, MsgBeHeader(lage, topic.evictions, topic.hash, tag).serialize())
+        for tag in range(MESSAGES)
+    ]
+    return node, subs, arrivals, sid
+
+
+async def run_consumers(shared: bool, burst: int) -> float:
+    node, subs, arrivals, sid = setup(shared)
+
+    async def consume(sub: SubscriberImpl) -> None:
+        received = 0
+        async for _ in sub:
+            received += 1
+            if received == MESSAGES:
+                break
+
+    consumers = [asyncio.create_task(consume(sub)) for sub in subs]
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    for i in range(0, MESSAGES, burst):
+        for arrival in arrivals[i : i + burst]:
+            node.dispatch_arrival(arrival, subject_id=sid, unicast=False)  # type: ignore[attr-defined]
+        await asyncio.sleep(0)
+    await asyncio.gather(*consumers)
+    elapsed = time.perf_counter() - started
+    for sub in subs:
+        sub.close()
+    node.close()  # type: ignore[attr-defined]
+    return elapsed / MESSAGES
+
+
+async def run_dispatch(shared: bool) -> float:
+    node, subs, arrivals, sid = setup(shared)
+    started = time.perf_counter()
+    for arrival in arrivals:
+        node.dispatch_arrival(arrival, subject_id=sid, unicast=False)  # type: ignore[attr-defined]
+    elapsed = time.perf_counter() - started
+    for sub in subs:
+        sub.close()
+    node.close()  # type: ignore[attr-defined]
+    return elapsed / MESSAGES
+
+
+def main() -> None:
+    print(f"{SUBSCRIBERS} subscribers on one topic")
+    print(f"{'queues':<8} {'burst':>6} {'us/msg':>8}")
+    for shared in [False, True]:
+        label = "shared" if shared else "private"
+        for burst in BURSTS:
+            cost = min(asyncio.run(run_consumers(shared, burst)) for _ in range(REPEAT))
+            print(f"{label:<8} {burst:>6} {cost * 1e6:>8.2f}")
+        cost = min(asyncio.run(run_dispatch(shared)) for _ in range(REPEAT))
+        print(f"{label:<8} {'idle':>6} {cost * 1e6:>8.2f}  (delivery only)")
+
+
+if __name__ == "__main__":
+    main()
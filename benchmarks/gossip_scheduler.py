@@ -0,0 +1,67 @@
+"""
+Gossip scheduling overhead versus the number of explicit topics.
+
+A node advertises N topics on a mock transport and runs for a few seconds while broadcast gossip for random
+local topics arrives at a fixed rate, each arrival suppressing (postponing) that topic's next gossip.
+Reported are the asyncio tasks created per second and the share of wall time the process spends on CPU.
+
+Run from the repository root:  python -m benchmarks.gossip_scheduler
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from typing import Any
+
+from pycyphal2._node import GossipScope
+from tests.mock_transport import MockTransport
+from tests.typing_helpers import new_node
+
+DURATION = 3.0
+SUPPRESSIONS_PER_SECOND = 5000
+TOPIC_COUNTS = [100, 1000, 10000]
+
+
+async def run(topic_count: int) -> tuple[float, float]:
+    loop = asyncio.get_running_loop()
+    created = 0
+
+    def factory(lp: asyncio.AbstractEventLoop, coro: Any, **kwargs: Any) -> asyncio.Task[Any]:
+        nonlocal created
+        created += 1
+        return asyncio.Task(coro, loop=lp, **kwargs)
+
+    node = new_node(MockTransport(node_id=1), home="bench")
+    pubs = [node.advertise(f"/bench/{i}") for i in range(topic_count)]
+    topics = list(node.topics_by_name.values())
+    await asyncio.sleep(0.5)  # Let the creation-time urgent gossip settle.
+
+    loop.set_task_factory(factory)
+    created = 0
+    cpu_start, wall_start = time.process_time(), time.monotonic()
+    batch = SUPPRESSIONS_PER_SECOND // 100
+    while (time.monotonic() - wall_start) < DURATION:
+        now = time.monotonic()
+        for topic in random.choices(topics, k=batch):
+            node.on_gossip_known(topic, topic.evictions, topic.lage(now), now, GossipScope.BROADCAST)
+        await asyncio.sleep(0.01)
+    cpu, wall = time.process_time() - cpu_start, time.monotonic() - wall_start
+    loop.set_task_factory(None)
+
+    for p in pubs:
+        p.close()
+    node.close()
+    return created / wall, cpu / wall
+
+
+def main() -> None:
+    print(f"{'topics':>8} {'tasks/s':>12} {'cpu load':>10}")
+    for n in TOPIC_COUNTS:
+        tasks_per_second, load = asyncio.run(run(n))
+        print(f"{n:>8} {tasks_per_second:>12.0f} {load:>9.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Session-layer header codec cost per header type, in nanoseconds per operation.
+
+Measured are serialize(), pack_into() a preallocated buffer (where available), and deserialize_header() of a
+serialized header, which includes the dispatch on the type byte.
+
+Run from the repository root:  python -m benchmarks.header_codec
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import Any, Callable
+
+from pycyphal2._header import (
+    HEADER_SIZE,
+    GossipHeader,
+    MsgAckHeader,
+    MsgBeHeader,
+    MsgNackHeader,
+    MsgRelHeader,
+    RspAckHeader,
+    RspBeHeader,
+    RspNackHeader,
+    RspRelHeader,
+    ScoutHeader,
+    deserialize_header,
+)
+
+NUMBER = 200_000
+REPEAT = 5
+
+HEADERS: list[Any] = [
+    MsgBeHeader(topic_log_age=12, topic_evictions=3, topic_hash=0xDEADBEEFCAFEBABE, tag=0x0123456789ABCDEF),
+    MsgRelHeader(topic_log_age=12, topic_evictions=3, topic_hash=0xDEADBEEFCAFEBABE, tag=0x0123456789ABCDEF),
+    MsgAckHeader(topic_hash=0xDEADBEEFCAFEBABE, tag=0x0123456789ABCDEF),
+    MsgNackHeader(topic_hash=0xDEADBEEFCAFEBABE, tag=0x0123456789ABCDEF),
+    RspBeHeader(tag=7, seqno=123456, topic_hash=0xDEADBEEFCAFEBABE, message_tag=0x0123456789ABCDEF),
+    RspRelHeader(tag=7, seqno=123456, topic_hash=0xDEADBEEFCAFEBABE, message_tag=0x0123456789ABCDEF),
+    RspAckHeader(tag=7, seqno=123456, topic_hash=0xDEADBEEFCAFEBABE, message_tag=0x0123456789ABCDEF),
+    RspNackHeader(tag=7, seqno=123456, topic_hash=0xDEADBEEFCAFEBABE, message_tag=0x0123456789ABCDEF),
+    GossipHeader(topic_log_age=12, topic_hash=0xDEADBEEFCAFEBABE, topic_evictions=3, name_len=40),
+    ScoutHeader(pattern_len=40),
+]
+
+
+def ns_per_op(fn: Callable[[], object]) -> float:
+    return min(timeit.repeat(fn, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e9
+
+
+def main() -> None:
+    print(f"{'header':<14} {'serialize':>10} {'pack_into':>10} {'deserialize':>12}")
+    buf = bytearray(HEADER_SIZE)
+    for hdr in HEADERS:
+        wire = hdr.serialize()
+        ser = ns_per_op(hdr.serialize)
+        pack = f"{ns_per_op(lambda: hdr.pack_into(buf)):>10.0f}" if hasattr(hdr, "pack_into") else f"{'-':>10}"
+        de = ns_per_op(lambda: deserialize_header(wire))
+        print(f"{type(hdr).__name__:<14} {ser:>10.0f} {pack} {de:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Callback delivery throughput: Subscriber.listen() through the queue and a task versus Subscriber.listen_inline().
+
+Transport arrivals are dispatched into the node in bursts, yielding to the event loop after each burst like a
+transport reading a socket would. The callback is a trivial synchronous function that records the latest payload
+per remote. Reported are the messages handled per second including the node-side dispatch, and the per-message
+overhead of the queue path over the inline path.
+
+Run from the repository root:  python -m benchmarks.inline_callback
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from pycyphal2 import Arrival, Instant, Priority, TransportArrival
+from pycyphal2._header import MsgBeHeader
+from tests.mock_transport import MockTransport
+from tests.typing_helpers import new_node, subscribe_impl
+
+MESSAGES = 50_000
+BURSTS = [1, 16, 256]
+REPEAT = 5
+
+
+async def run(burst: int, inline: bool) -> float:
+    node = new_node(MockTransport(node_id=1), home="bench")
+    sub = subscribe_impl(node, "/bench/topic")
+    topic = node.topics_by_name["bench/topic"]
+    sid = topic.subject_id(node.transport.subject_id_modulus)
+    lage = topic.lage(topic.ts_animated)
+    arrivals = [
+        TransportArrival(
+            Instant(ns=1), Priority.NOMINAL, 42, MsgBeHeader(lage, topic.evictions, topic.hash, tag).serialize()
+        )
+        for tag in range(MESSAGES)
+    ]
+    latest: dict[int, memoryview] = {}
+    done = asyncio.Event()
+
+    def callback(item: Arrival | Exception) -> None:
+        assert isinstance(item, Arrival)
+        latest[item.breadcrumb.remote_id] = item.view
+        if item.breadcrumb.tag == MESSAGES - 1:
+            done.set()
+
+    handle = sub.listen_inline(callback) if inline else sub.listen(callback)
+    started = time.perf_counter()
+    for i in range(0, MESSAGES, burst):
+        for arrival in arrivals[i : i + burst]:
+            node.dispatch_arrival(arrival, subject_id=sid, unicast=False)
+        await asyncio.sleep(0)
+    await done.wait()
+    elapsed = time.perf_counter() - started
+
+    if isinstance(handle, asyncio.Task):
+        handle.cancel()
+    else:
+        handle.close()
+    sub.close()
+    node.close()
+    return elapsed / MESSAGES
+
+
+def main() -> None:
+    print(f"{'burst':>6} {'queued msg/s':>13} {'inline msg/s':>13} {'overhead':>10}")
+    for burst in BURSTS:
+        queued = min(asyncio.run(run(burst, False)) for _ in range(REPEAT))
+        inline = min(asyncio.run(run(burst, True)) for _ in range(REPEAT))
+        print(f"{burst:>6} {1 / queued:>13.0f} {1 / inline:>13.0f} {(queued - inline) * 1e6:>8.2f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Per-message cost of the receive queues when the consumer keeps up with the producer and waits for every message.
+
+A producer task delivers prebuilt arrivals into one subscriber, or responses into one response stream, in bursts,
+yielding to the event loop after each burst; the node-side dispatch is left out to isolate the queue machinery.
+The consumer iterates with ``async for``, with and without a liveness timeout. Reported is the time per message.
+
+Run from the repository root:  python -m benchmarks.liveness_queue
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import AsyncIterator, Callable
+
+from pycyphal2 import Arrival, Instant, Priority, TransportArrival
+from pycyphal2._header import RspBeHeader
+from pycyphal2._publisher import ResponseStreamImpl
+from pycyphal2._subscriber import BreadcrumbImpl
+from tests.mock_transport import MockTransport
+from tests.typing_helpers import new_node, subscribe_impl
+
+MESSAGES = 50_000
+BURSTS = [1, 16]
+TIMEOUTS = [float("inf"), 10.0]
+REPEAT = 5
+
+
+async def consume(source: AsyncIterator[object], produce: Callable[[int], None], burst: int) -> float:
+    async def producer() -> None:
+        for i in range(0, MESSAGES, burst):
+            for k in range(i, min(i + burst, MESSAGES)):
+                produce(k)
+            await asyncio.sleep(0)
+
+    received = 0
+    started = time.perf_counter()
+    task = asyncio.create_task(producer())
+    async for _ in source:
+        received += 1
+        if received == MESSAGES:
+            break
+    elapsed = time.perf_counter() - started
+    await task
+    return elapsed / MESSAGES
+
+
+async def run_subscriber(burst: int, timeout: float) -> float:
+    node = new_node(MockTransport(node_id=1), home="bench")
+    sub = subscribe_impl(node, "/bench/topic")
+    sub.timeout = timeout
+    topic = node.topics_by_name["bench/topic"]
+    arrival = Arrival(Instant(ns=1), BreadcrumbImpl(node, 42, topic, 0, Priority.NOMINAL), b"")
+    out = await consume(sub, lambda tag: sub.deliver(arrival, tag, 42), burst)
+    sub.close()
+    node.close()
+    return out
+
+
+async def run_response_stream(burst: int, timeout: float) -> float:
+    node = new_node(MockTransport(node_id=1), home="bench")
+    pub = node.advertise("/bench/topic")
+    topic = node.topics_by_name["bench/topic"]
+    stream = ResponseStreamImpl(node, topic, 0, timeout)
+    arrival = TransportArrival(Instant(ns=1), Priority.NOMINAL, 42, b"")
+    headers = [RspBeHeader(tag=0xFF, seqno=seqno, topic_hash=topic.hash, message_tag=0) for seqno in range(MESSAGES)]
+    out = await consume(stream, lambda seqno: stream.on_response(arrival, headers[seqno], b""), burst)
+    stream.close()
+    pub.close()
+    node.close()
+    return out
+
+
+def main() -> None:
+    print(f"{'source':<16} {'burst':>6} {'timeout':>8} {'us/msg':>8}")
+    for label, run in [("subscriber", run_subscriber), ("response stream", run_response_stream)]:
+        for burst in BURSTS:
+            for timeout in TIMEOUTS:
+                cost = min(asyncio.run(run(burst, timeout)) for _ in range(REPEAT))
+                print(f"{label:<16} {burst:>6} {timeout:>8} {cost * 1e6:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
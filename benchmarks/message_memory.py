@@ -0,0 +1,102 @@
+"""
+Memory footprint of the per-message objects on the receive path.
+
+First, the memory taken by one instance of each per-message record.
+Then N transport arrivals (each with its own Instant and payload) are created and dispatched into a subscriber whose
+queue retains the resulting Arrival objects. For each stage, reported are the memory blocks allocated and the bytes
+retained per message, as seen by sys.getallocatedblocks() and tracemalloc.
+
+Run from the repository root:  python -m benchmarks.message_memory
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Callable, TypeVar
+
+from pycyphal2 import Instant, Priority, TransportArrival
+from pycyphal2._header import GossipHeader, MsgBeHeader
+from pycyphal2.can import TimestampedFrame
+from pycyphal2.can._wire import ParsedFrame, TransferKind
+from pycyphal2.udp import _Fragment, _FrameHeader
+from tests.mock_transport import MockTransport
+from tests.typing_helpers import new_node, subscribe_impl
+
+MESSAGES = 20_000
+PAYLOAD_SIZE = 64
+
+T = TypeVar("T")
+
+
+def measure(stage: Callable[[], T]) -> tuple[float, float, T]:
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    result = stage()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    gc.collect()
+    return (sys.getallocatedblocks() - blocks) / MESSAGES, size / MESSAGES, result
+
+
+def report_records() -> None:
+    now = Instant.now()
+    factories: list[Callable[[], object]] = [
+        lambda: Instant(ns=time.monotonic_ns()),
+        lambda: TransportArrival(now, Priority.NOMINAL, 42, b""),
+        lambda: MsgBeHeader(0, 0, 0, 0),
+        lambda: GossipHeader(0, 0, 0, 0),
+        lambda: TimestampedFrame(id=0, data=b"", timestamp=now),
+        lambda: ParsedFrame(TransferKind.MESSAGE_16, 4, 100, 1, None, 0, True, True, True, b""),
+        lambda: _FrameHeader(4, 0, 0, 0, 0, 0),
+        lambda: _Fragment(0, b""),
+    ]
+    print(f"{'record':<20} {'blocks':>10} {'bytes':>10}")
+    for factory in factories:
+        blocks, size, records = measure(lambda: [factory() for _ in range(MESSAGES)])
+        pointer = sys.getsizeof(records) / MESSAGES  # The list holding the records is not part of the record.
+        print(f"{type(records[0]).__name__:<20} {blocks:>10.2f} {size - pointer:>10.0f}")
+    print()
+
+
+async def run() -> None:
+    node = new_node(MockTransport(node_id=1), home="bench")
+    sub = subscribe_impl(node, "/bench/topic")
+    topic = node.topics_by_name["bench/topic"]
+    sid = topic.subject_id(node.transport.subject_id_modulus)
+    lage = topic.lage(time.monotonic())
+    payload = bytes(PAYLOAD_SIZE)
+
+    def make_arrivals() -> list[TransportArrival]:
+        return [
+            TransportArrival(
+                timestamp=Instant.now(),
+                priority=Priority.NOMINAL,
+                remote_id=42,
+                message=MsgBeHeader(lage, topic.evictions, topic.hash, tag).serialize() + payload,
+            )
+            for tag in range(MESSAGES)
+        ]
+
+    def dispatch() -> None:
+        for arrival in arrivals:
+            node.dispatch_arrival(arrival, subject_id=sid, unicast=False)
+
+    blocks, size, arrivals = measure(make_arrivals)
+    print(f"{'stage':<20} {'blocks/msg':>10} {'bytes/msg':>10}")
+    print(f"{'TransportArrival':<20} {blocks:>10.2f} {size:>10.0f}")
+    blocks, size, _ = measure(dispatch)
+    print(f"{'queued Arrival':<20} {blocks:>10.2f} {size:>10.0f}")
+    assert sub.queue.qsize() == MESSAGES
+
+    sub.close()
+    node.close()
+
+
+if __name__ == "__main__":
+    report_records()
+    asyncio.run(run())
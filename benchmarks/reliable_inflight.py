@@ -0,0 +1,76 @@
+"""
+Event loop cost of many reliable publications in flight at once.
+
+IN_FLIGHT reliable publications are started together on a topic with one known subscriber, whose ACKs arrive
+ACK_DELAY seconds after each publication started, so every publication waits through several retransmission windows
+(and retransmits) before it is acknowledged. The transport is a mock that discards the frames; ACKs are injected
+straight into the node by a single responder task. Reported is the CPU time per publication, everything included,
+and the resulting number of publications a fully loaded core could keep in flight with this ACK delay,
+by Little's law: ACK_DELAY / (CPU time per publication).
+The in-flight window of the publisher is disabled, since it would take the late ACKs for congestion and hold
+the publications back.
+
+Run from the repository root:  python -m benchmarks.reliable_inflight
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from pycyphal2 import Instant, Priority, TransportArrival
+from pycyphal2._header import MsgAckHeader
+from pycyphal2._node import Association
+from tests.mock_transport import MockTransport
+from tests.typing_helpers import new_node
+
+IN_FLIGHT = [500, 2000, 8000]
+ACK_DELAY = 0.1
+RESPONDER_PERIOD = 0.005
+REMOTE_ID = 42
+REPEAT = 3
+
+
+async def run(in_flight: int) -> float:
+    node = new_node(MockTransport(node_id=1), home="bench")
+    pub = node.advertise("/bench/topic")
+    pub.max_in_flight = None
+    topic = node.topics_by_name["bench/topic"]
+    topic.associations[REMOTE_ID] = Association(remote_id=REMOTE_ID, last_seen=time.monotonic())
+    started_at: dict[int, float] = {}
+    finished = False
+
+    async def respond() -> None:
+        while not finished:
+            await asyncio.sleep(RESPONDER_PERIOD)
+            now = time.monotonic()
+            for tag in [tag for tag in topic.publish_futures if tag not in started_at]:
+                started_at[tag] = now
+            for tag, at in list(started_at.items()):
+                if now - at >= ACK_DELAY:
+                    del started_at[tag]
+                    ack = MsgAckHeader(topic_hash=topic.hash, tag=tag).serialize()
+                    node.on_unicast_arrival(TransportArrival(Instant.now(), Priority.NOMINAL, REMOTE_ID, ack))
+
+    responder = asyncio.create_task(respond())
+    cpu = time.process_time()
+    deadline = Instant.now() + 10.0
+    await asyncio.gather(*(pub(deadline, b"data", reliable=True) for _ in range(in_flight)))
+    cpu = time.process_time() - cpu
+    finished = True
+    await responder
+    pub.close()
+    node.close()
+    return cpu / in_flight
+
+
+def main() -> None:
+    print(f"ACK delay {ACK_DELAY * 1e3:.0f} ms")
+    print(f"{'in flight':>10} {'us/pub':>8} {'max in flight/core':>19}")
+    for in_flight in IN_FLIGHT:
+        cost = min(asyncio.run(run(in_flight)) for _ in range(REPEAT))
+        print(f"{in_flight:>10} {cost * 1e6:>8.1f} {ACK_DELAY / cost:>19.0f}")
+
+
+if __name__ == "__main__":
+    main()
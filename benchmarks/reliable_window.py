@@ -0,0 +1,116 @@
+"""
+Sustained reliable throughput through a congested link, with and without the in-flight window of the publisher.
+
+WORKERS tasks publish reliably back to back on one topic, so that up to WORKERS publications are in flight.
+The frames reach the subscribing node, multicast and unicast alike, through a bottleneck that forwards LINK_RATE
+messages per second and holds at most LINK_BUFFER of them, dropping the rest, like a slow bus behind a short queue.
+ACKs return unimpeded.
+Reported is the acknowledged publication rate, the failed ones, and the frames sent per acknowledged publication.
+
+Run from the repository root:  python -m benchmarks.reliable_window
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import time
+
+from pycyphal2 import DeliveryError, Instant, SendError, TransportArrival
+from tests.mock_transport import MockNetwork, MockTransport
+from tests.typing_helpers import advertise_impl, new_node
+
+WORKERS = [64, 1024]
+LINK_RATE = 2000.0
+LINK_BUFFER = 64
+LINK_TICK = 0.002
+DURATION = 3.0
+DEADLINE = 2.0
+PAYLOAD = bytes(64)
+
+
+class Bottleneck:
+    def __init__(self, transport: MockTransport) -> None:
+        self._transport = transport
+        self._queue: deque[tuple[int | None, TransportArrival]] = deque()  # Subject-ID, or None for unicast.
+        self.frames = 0
+
+    def deliver_unicast(self, arrival: TransportArrival) -> None:
+        self.deliver_subject(None, arrival)
+
+    def deliver_subject(self, subject_id: int | None, arrival: TransportArrival) -> None:
+        self.frames += 1
+        if len(self._queue) < LINK_BUFFER:
+            self._queue.append((subject_id, arrival))
+
+    async def run(self) -> None:
+        credit = 0.0
+        last = time.monotonic()
+        while True:
+            await asyncio.sleep(LINK_TICK)
+            now = time.monotonic()
+            credit = min(credit + (now - last) * LINK_RATE, float(LINK_BUFFER))
+            last = now
+            while self._queue and credit >= 1.0:
+                credit -= 1.0
+                subject_id, arrival = self._queue.popleft()
+                if subject_id is None:
+                    MockTransport.deliver_unicast(self._transport, arrival)
+                else:
+                    MockTransport.deliver_subject(self._transport, subject_id, arrival)
+
+
+async def run(workers: int, windowed: bool) -> tuple[float, int, float]:
+    net = MockNetwork()
+    tr_pub = MockTransport(node_id=1, network=net)
+    tr_sub = MockTransport(node_id=2, network=net)
+    link = Bottleneck(tr_sub)
+    tr_sub.deliver_subject = link.deliver_subject  # type: ignore[method-assign]
+    tr_sub.deliver_unicast = link.deliver_unicast  # type: ignore[method-assign]
+    node_pub = new_node(tr_pub, home="pub")
+    node_sub = new_node(tr_sub, home="sub")
+    sub = node_sub.subscribe("bench/topic")
+    pub = advertise_impl(node_pub, "bench/topic")
+    if not windowed:
+        pub.max_in_flight = None
+    acked = 0
+    failed = 0
+    stop_at = time.monotonic() + DURATION
+
+    async def consume() -> None:
+        async for _ in sub:
+            pass
+
+    async def work() -> None:
+        nonlocal acked, failed
+        while time.monotonic() < stop_at:
+            try:
+                await pub(Instant.now() + DEADLINE, PAYLOAD, reliable=True)
+                acked += 1
+            except (DeliveryError, SendError):
+                failed += 1
+
+    background = [asyncio.create_task(link.run()), asyncio.create_task(consume())]
+    started = time.monotonic()
+    await asyncio.gather(*(work() for _ in range(workers)))
+    elapsed = time.monotonic() - started
+    for task in background:
+        task.cancel()
+    pub.close()
+    sub.close()
+    node_pub.close()
+    node_sub.close()
+    return acked / elapsed, failed, link.frames / max(1, acked)
+
+
+def main() -> None:
+    print(f"link {LINK_RATE:.0f} msg/s, buffer {LINK_BUFFER}")
+    print(f"{'workers':>8} {'window':>7} {'acked/s':>8} {'failed':>7} {'frames/ack':>11}")
+    for workers in WORKERS:
+        for windowed in (False, True):
+            rate, failed, frames = asyncio.run(run(workers, windowed))
+            print(f"{workers:>8} {'on' if windowed else 'off':>7} {rate:>8.0f} {failed:>7} {frames:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Delivery cost of an ordered subscription at various publisher counts and loss rates.
+
+Each publisher emits a sequence of tags; a fraction of them is lost and a further fraction arrives swapped with
+its successor, so that the reordering engine has to intern messages and eject them later. The publishers are
+interleaved round-robin into one subscriber with a reordering window, calling deliver() directly to isolate the
+reordering machinery from the node-side dispatch. The queue is drained after every round. Reported is the
+delivery time per message.
+
+Run from the repository root:  python -m benchmarks.reordering
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+
+from pycyphal2 import Arrival, Instant, Priority
+from pycyphal2._subscriber import BreadcrumbImpl
+from tests.mock_transport import MockTransport
+from tests.typing_helpers import new_node, subscribe_impl
+
+MESSAGES = 50_000
+PUBLISHERS = [1, 20, 200]
+LOSS = [0.0, 0.01, 0.1]
+SWAP = 0.05
+REPEAT = 3
+
+
+def make_sequence(count: int, loss: float, rng: random.Random) -> list[int]:
+    tags = [tag for tag in range(count) if rng.random() >= loss]
+    for i in range(len(tags) - 1):
+        if rng.random() < SWAP:
+            tags[i], tags[i + 1] = tags[i + 1], tags[i]
+    return tags
+
+
+async def run(publishers: int, loss: float) -> float:
+    node = new_node(MockTransport(node_id=1), home="bench")
+    sub = subscribe_impl(node, "/bench/topic", reordering_window=1.0)
+    topic = node.topics_by_name["bench/topic"]
+    breadcrumb = BreadcrumbImpl(node, 0, topic, 0, Priority.NOMINAL)
+    arrival = Arrival(Instant.now(), breadcrumb, b"")
+    rng = random.Random(publishers)
+    per_publisher = MESSAGES // publishers
+    sequences = [make_sequence(per_publisher, loss, rng) for _ in range(publishers)]
+    rounds = max(len(seq) for seq in sequences)
+    schedule = [
+        (remote_id, seq[i]) for i in range(rounds) for remote_id, seq in enumerate(sequences, 1) if i < len(seq)
+    ]
+
+    deliver = sub.deliver
+    topic_hash = topic.hash
+    started = time.perf_counter()
+    for index, (remote_id, tag) in enumerate(schedule):
+        deliver(arrival, tag, remote_id, topic_hash)
+        if index % publishers == 0:
+            while not sub.queue.empty():
+                sub.queue.get_nowait()
+    elapsed = time.perf_counter() - started
+
+    sub.close()
+    node.close()
+    return elapsed / len(schedule)
+
+
+def main() -> None:
+    print(f"{'publishers':>10} {'loss':>6} {'us/msg':>8}")
+    for publishers in PUBLISHERS:
+        for loss in LOSS:
+            cost = min(asyncio.run(run(publishers, loss)) for _ in range(REPEAT))
+            print(f"{publishers:>10} {loss:>6.2f} {cost * 1e6:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
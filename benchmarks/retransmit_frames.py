@@ -0,0 +1,42 @@
+"""
+CPU cost of turning a reliable message into UDP frames, for the first transmission and for each retransmission.
+
+The first transmission segments the message and computes the CRC of the whole payload. A retransmission of the same
+message object reuses that segmentation from the transport's cache and only rebuilds the frame headers, which differ
+in the transfer-ID. Reported is the time per transfer for messages of several sizes at the usual Ethernet MTU,
+and the speedup of a retransmission.
+
+Run from the repository root:  python -m benchmarks.retransmit_frames
+"""
+
+from __future__ import annotations
+
+import os
+import timeit
+
+from pycyphal2.udp import _segment_transfer, _TxSegmentCache
+
+SIZES = [256, 8 * 1024, 64 * 1024]
+MTU = 1408
+NUMBER = 20
+REPEAT = 5
+
+
+def us_per_op(fn: object) -> float:
+    return min(timeit.repeat(fn, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e6  # type: ignore[arg-type]
+
+
+def main() -> None:
+    print(f"MTU {MTU}")
+    print(f"{'bytes':>7} {'frames':>7} {'first, us':>10} {'retransmit, us':>15} {'speedup':>8}")
+    for size in SIZES:
+        message = os.urandom(size)
+        cache = _TxSegmentCache()
+        frames = len(cache.segment(0, 0, 0, message, MTU))
+        first = us_per_op(lambda: _segment_transfer(0, 1, 0, message, MTU))
+        again = us_per_op(lambda: cache.segment(0, 1, 0, message, MTU))
+        print(f"{size:>7} {frames:>7} {first:>10.1f} {again:>15.1f} {first / again:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Cost of reliable retransmissions on a topic with many subscribers, a few of which are behind lossy links.
+
+One publisher sends MESSAGES reliable messages, CONCURRENCY at a time, to SUBSCRIBERS subscribing nodes;
+LOSSY of them lose LOSS_RATE of the frames sent to them. The retransmissions are either unicast to the subscribers
+still missing a message while they are at most the given fraction of all, or multicast to all of them
+(ratio 0 is the former behavior: unicast only to a single laggard). Reported is the number of retransmissions
+of each kind, the frames received by all subscribers together, and the CPU time per message, everything included.
+
+Run from the repository root:  python -m benchmarks.selective_retransmit
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+
+from pycyphal2 import Instant, TransportArrival
+from tests.mock_transport import MockNetwork, MockTransport
+from tests.typing_helpers import advertise_impl, new_node
+
+SUBSCRIBERS = 40
+LOSSY = 4
+LOSS_RATE = 0.2
+MESSAGES = 300
+CONCURRENCY = 8
+RATIOS = [0.0, 0.25]
+
+
+class Inbox:
+    """Counts the frames a subscriber's transport receives, dropping some of them if lossy."""
+
+    def __init__(self, transport: MockTransport, loss_rate: float) -> None:
+        self._transport = transport
+        self._loss_rate = loss_rate
+        self.frames = 0
+        transport.deliver_subject = self.deliver_subject  # type: ignore[method-assign]
+        transport.deliver_unicast = self.deliver_unicast  # type: ignore[method-assign]
+
+    def deliver_subject(self, subject_id: int, arrival: TransportArrival) -> None:
+        if random.random() >= self._loss_rate:
+            self.frames += 1
+            MockTransport.deliver_subject(self._transport, subject_id, arrival)
+
+    def deliver_unicast(self, arrival: TransportArrival) -> None:
+        if random.random() >= self._loss_rate:
+            self.frames += 1
+            MockTransport.deliver_unicast(self._transport, arrival)
+
+
+async def run(ratio: float) -> tuple[int, int, int, float]:
+    random.seed(0)
+    net = MockNetwork()
+    node_pub = new_node(MockTransport(node_id=1, network=net), home="pub")
+    inboxes: list[Inbox] = []
+    nodes = []
+    subs = []
+    for i in range(SUBSCRIBERS):
+        tr = MockTransport(node_id=100 + i, network=net)
+        inboxes.append(Inbox(tr, LOSS_RATE if i < LOSSY else 0.0))
+        node = new_node(tr, home=f"sub{i}")
+        nodes.append(node)
+        subs.append(node.subscribe("bench/topic", capacity=1))
+    pub = advertise_impl(node_pub, "bench/topic")
+    pub.unicast_retransmit_ratio = ratio
+    await pub(Instant.now() + 5.0, b"warmup", reliable=True)  # Learn the associations.
+    for inbox in inboxes:
+        inbox.frames = 0
+
+    async def work(count: int) -> None:
+        for _ in range(count):
+            await pub(Instant.now() + 5.0, bytes(256), reliable=True)
+
+    cpu = time.process_time()
+    await asyncio.gather(*(work(MESSAGES // CONCURRENCY) for _ in range(CONCURRENCY)))
+    cpu = time.process_time() - cpu
+    result = (
+        pub.retransmissions_multicast,
+        pub.retransmissions_unicast,
+        sum(inbox.frames for inbox in inboxes),
+        cpu / MESSAGES,
+    )
+    pub.close()
+    for sub in subs:
+        sub.close()
+    for node in nodes:
+        node.close()
+    node_pub.close()
+    return result
+
+
+def main() -> None:
+    print(f"{SUBSCRIBERS} subscribers, {LOSSY} of them losing {LOSS_RATE:.0%}; {MESSAGES} messages")
+    print(f"{'ratio':>6} {'multicast':>10} {'unicast':>8} {'frames received':>16} {'us/msg':>8}")
+    for ratio in RATIOS:
+        multicast, unicast, frames, cost = asyncio.run(run(ratio))
+        print(f"{ratio:>6.2f} {multicast:>10} {unicast:>8} {frames:>16} {cost * 1e6:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Payload copies on the receive path: UDP datagrams through reassembly and NodeImpl.dispatch_arrival() to Arrival.
+
+Large messages are segmented into datagrams that are fed to the UDP transport's datagram handler, which hands the
+reassembled transfer to a node subscribed to the topic. The application only reads Arrival.view.
+Reported are the bytes allocated per delivered message in excess of what the datagrams already hold
+(peak traced allocation, i.e., the payload copies), also expressed in payload sizes.
+Throughput is not reported because it is dominated by the CRC computation on this path.
+
+Run from the repository root:  python -m benchmarks.zero_copy
+"""
+
+from __future__ import annotations
+
+import asyncio
+import tracemalloc
+from ipaddress import IPv4Address
+
+from pycyphal2 import Arrival, Instant, TransportArrival
+from pycyphal2._header import MsgBeHeader
+from pycyphal2._subscriber import SubscriberImpl
+from pycyphal2.udp import HEADER_SIZE, Interface, UDPTransport, _segment_transfer, _UDPTransportImpl
+from tests.mock_transport import MockTransport
+from tests.typing_helpers import new_node, subscribe_impl
+
+MESSAGES = 50
+PAYLOAD_SIZE = 60_000
+FRAME_MTUS = {"single-frame": 65_000, "multi-frame": 1_408}
+
+
+def consume(sub: SubscriberImpl) -> int:
+    total = 0
+    while not sub.queue.empty():
+        arrival = sub.queue.get_nowait()
+        assert isinstance(arrival, Arrival)
+        total += len(arrival.view)
+    return total
+
+
+async def run(mtu: int) -> float:
+    node = new_node(MockTransport(node_id=1), home="bench")
+    sub = subscribe_impl(node, "/bench/cloud")
+    topic = node.topics_by_name["bench/cloud"]
+    sid = topic.subject_id(node.transport.subject_id_modulus)
+    udp = UDPTransport.new([Interface(IPv4Address("127.0.0.1"), mtu_link=1500)])
+    assert isinstance(udp, _UDPTransportImpl)
+
+    def handler(arrival: TransportArrival) -> None:
+        node.dispatch_arrival(arrival, subject_id=sid, unicast=False)
+
+    listener = udp.subject_listen(sid, handler)
+    header = MsgBeHeader(topic.lage(topic.ts_animated), topic.evictions, topic.hash, 0).serialize()
+    message = header + bytes(PAYLOAD_SIZE - len(header))
+    transfers = [_segment_transfer(4, tid, 42, message, mtu - HEADER_SIZE) for tid in range(MESSAGES)]
+
+    tracemalloc.start()
+    extra = 0
+    for datagrams in transfers:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        for dg in datagrams:
+            udp._process_subject_datagram(dg, "127.0.0.2", 9382, sid, 0, Instant(ns=1))
+        extra += tracemalloc.get_traced_memory()[1] - base
+        assert consume(sub) == PAYLOAD_SIZE - len(header)
+    tracemalloc.stop()
+
+    listener.close()
+    udp.close()
+    sub.close()
+    node.close()
+    return extra / MESSAGES
+
+
+def main() -> None:
+    print(f"{'transfer':<14} {'bytes/msg':>10} {'copies':>7}")
+    for label, mtu in FRAME_MTUS.items():
+        extra = asyncio.run(run(mtu))
+        print(f"{label:<14} {extra:>10.0f} {extra / PAYLOAD_SIZE:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -42,13 +42,13 @@ def mypy(session: nox.Session) -> None:
 @nox.session(python=PYTHONS[0])
 def lint(session: nox.Session) -> None:
     session.install("ruff")
-    session.run("ruff", "check", "src", "tests", "examples")
+    session.run("ruff", "check", "src", "tests", "examples", "benchmarks")
 
 
 @nox.session(python=PYTHONS[0])
 def format(session: nox.Session) -> None:
     session.install("black")
-    session.run("black", "--check", "--diff", "src", "tests", "examples")
+    session.run("black", "--check", "--diff", "src", "tests", "examples", "benchmarks")
 
 
 @nox.session(python=PYTHONS[0], reuse_venv=True)
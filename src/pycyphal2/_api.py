@@ -13,11 +13,11 @@ import logging
 import time
 import os
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from enum import IntEnum
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum
 import random
 import platform
-from typing import Any, Awaitable, Callable, TYPE_CHECKING
+from typing import Any, AsyncIterator, Awaitable, Callable, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ._transport import Transport as Transport
@@ -51,7 +51,7 @@ class NackError(Error):
     """The remote node was reached, but it explicitly rejected the message."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Instant:
     """
     Monotonic time elapsed from an unspecified origin instant; used to represent a point in time.
@@ -61,7 +61,7 @@ class Instant:
     ns: int
 
     def __init__(self, *, ns: int) -> None:
-        object.__setattr__(self, "ns", int(ns))
+        object.__setattr__(self, "ns", ns if type(ns) is int else int(ns))
 
     @property
     def us(self) -> float:
@@ -122,6 +122,23 @@ class Priority(IntEnum):
     OPTIONAL = 7
 
 
+class Overflow(Enum):
+    """
+    What a bounded receive queue does with a new item when it is full; see :meth:`Node.subscribe` and
+    :meth:`Publisher.request`. Discarded items are counted by the ``dropped`` property of the receiver.
+
+    - ``DROP_OLDEST``: discard the oldest queued item to make room for the new one.
+    - ``DROP_NEWEST``: discard the new item.
+    - ``REJECT``: discard the new item; if it is reliable, NACK it, so that the sender sees the backpressure.
+
+    Reliable items discarded by the drop policies are still acknowledged, since retransmission would not help.
+    """
+
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    REJECT = "reject"
+
+
 class Closable(ABC):
     @abstractmethod
     def close(self) -> None:
@@ -169,7 +186,7 @@ class Topic(ABC):
         return f"Topic({self.name!r}, hash=0x{self.hash:016x})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Response:
     """
     One response yielded by :class:`ResponseStream`.
@@ -197,6 +214,14 @@ class ResponseStream(Closable, ABC):
     Library-level errors are reported through iteration and do not automatically close the stream.
     """
 
+    @property
+    @abstractmethod
+    def dropped(self) -> int:
+        """
+        The number of responses discarded so far because the queue was at capacity; see :class:`Overflow`.
+        """
+        raise NotImplementedError
+
     def __aiter__(self) -> ResponseStream:
         return self
 
@@ -247,6 +272,10 @@ class Publisher(Closable, ABC):
         """
         The effective initial ACK timeout at the current priority; retries back off exponentially.
         The deadline limits the entire reliable publication, not just one attempt.
+
+        Once the round-trip time to every known subscriber has been measured (see :attr:`round_trip_times`),
+        the initial timeout is derived from those measurements instead, so that lost messages are recovered
+        as quickly as the network allows without retransmitting needlessly on slow links.
         """
         raise NotImplementedError
 
@@ -255,6 +284,85 @@ class Publisher(Closable, ABC):
     def ack_timeout(self, duration: float) -> None:
         raise NotImplementedError
 
+    @property
+    @abstractmethod
+    def max_in_flight(self) -> int | None:
+        """
+        The maximum number of reliable publications and requests of this publisher that may await ACKs at once.
+        Further reliable calls wait until one completes, but not past their deadline.
+        Within this limit, the number allowed adapts to the observed losses like a TCP congestion window:
+        it grows while publications are acknowledged in time and is halved when they have to be retransmitted,
+        so that sustained reliable traffic slows down instead of collapsing under congestion;
+        see :attr:`in_flight_window`. None removes the limit along with the adaptation.
+        """
+        raise NotImplementedError
+
+    @max_in_flight.setter
+    @abstractmethod
+    def max_in_flight(self, limit: int | None) -> None:
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def in_flight_window(self) -> int:
+        """
+        *Diagnostic utility.*
+
+        The number of reliable publications currently allowed in flight; at most :attr:`max_in_flight`.
+        """
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def unicast_retransmit_ratio(self) -> float:
+        """
+        Reliable publications are retransmitted by unicast to each known subscriber that has not acknowledged them yet
+        if there are at most this fraction of all known subscribers (and always if only one is left);
+        otherwise, the retransmission is multicast to all subscribers. A multicast costs one send, but every subscriber
+        receives and deduplicates it, so with many subscribers and a few lossy ones, unicasts are much cheaper.
+        Zero leaves only the single-laggard case to unicast; one always unicasts.
+        See :attr:`retransmissions_multicast` and :attr:`retransmissions_unicast`.
+        """
+        raise NotImplementedError
+
+    @unicast_retransmit_ratio.setter
+    @abstractmethod
+    def unicast_retransmit_ratio(self, ratio: float) -> None:
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def retransmissions_multicast(self) -> int:
+        """
+        *Diagnostic utility.*
+
+        The number of reliable publication retransmissions multicast to all subscribers so far.
+        """
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def retransmissions_unicast(self) -> int:
+        """
+        *Diagnostic utility.*
+
+        The number of reliable publication retransmissions unicast to individual subscribers so far;
+        a retransmission unicast to several subscribers counts once for each.
+        """
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def round_trip_times(self) -> dict[int, tuple[float, float]]:
+        """
+        *Diagnostic utility.*
+
+        The smoothed round-trip time and its mean deviation, in seconds, keyed by the remote-ID of each known
+        subscriber of the topic, as measured from the ACKs to reliable publications. Subscribers not measured yet
+        are absent.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def __call__(self, deadline: Instant, message: memoryview | bytes, *, reliable: bool = False) -> None:
         """
@@ -264,12 +372,20 @@ class Publisher(Closable, ABC):
 
         If ``reliable`` is false, the message is sent once.
         If ``reliable`` is true, the library retransmits until ``deadline`` leveraging :attr:`ack_timeout`.
+        A reliable message may have to wait before it is sent if too many are already in flight;
+        see :attr:`max_in_flight`.
         """
         raise NotImplementedError
 
     @abstractmethod
     async def request(
-        self, delivery_deadline: Instant, response_timeout: float, message: memoryview | bytes
+        self,
+        delivery_deadline: Instant,
+        response_timeout: float,
+        message: memoryview | bytes,
+        *,
+        capacity: int | None = None,
+        overflow: Overflow = Overflow.DROP_OLDEST,
     ) -> ResponseStream:
         """
         Publish a request and return a stream of responses.
@@ -280,6 +396,9 @@ class Publisher(Closable, ABC):
 
         ``response_timeout`` is the maximum idle gap (liveness timeout) between accepted responses,
         so it applies both to one-off RPC and to streaming.
+
+        ``capacity`` bounds the number of responses queued in the stream; ``overflow`` decides what happens to the
+        responses that do not fit. Unbounded by default.
         """
         raise NotImplementedError
 
@@ -319,6 +438,18 @@ class Breadcrumb(ABC):
     def tag(self) -> int:
         raise NotImplementedError
 
+    @property
+    @abstractmethod
+    def round_trip_time(self) -> tuple[float, float] | None:
+        """
+        *Diagnostic utility.*
+
+        The smoothed round-trip time and its mean deviation, in seconds, to the original publisher, as measured
+        from the ACKs to reliable responses sent to it from this node. None if not measured yet.
+        The initial ACK timeout of reliable responses is derived from it when available.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def __call__(self, deadline: Instant, message: memoryview | bytes, *, reliable: bool = False) -> None:
         """
@@ -337,17 +468,82 @@ class Breadcrumb(ABC):
         return f"Breadcrumb(remote_id={self.remote_id:016x}, tag={self.tag:016x}, topic={self.topic})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, init=False, repr=False, slots=True)
 class Arrival:
     """
     Represents one message received from a topic.
     ``breadcrumb`` captures the responder context for this arrival.
     Calling it sends a unicast response back to the original publisher, enabling RPC and streaming.
+
+    The payload is available as ``message`` (bytes) and as ``view`` (a read-only memoryview).
+    The view shares memory with the received transfer, which makes it the cheaper option for large messages;
+    ``message`` is copied from it on first access.
     """
 
     timestamp: Instant
-    breadcrumb: Breadcrumb
-    message: bytes
+    view: memoryview
+    _message: bytes | None = field(compare=False)
+    _breadcrumb: Breadcrumb | None = field(compare=False)
+    _responder: tuple[Any, ...] | None = field(compare=False)  # (factory, *args) building the breadcrumb on demand.
+
+    def __init__(self, timestamp: Instant, breadcrumb: Breadcrumb, message: bytes | memoryview) -> None:
+        _init_arrival(self, timestamp, message, breadcrumb, None)
+
+    @property
+    def breadcrumb(self) -> Breadcrumb:
+        # Built at most once per arrival. The arrival is shared by all subscribers of the message,
+        # so they all get the same breadcrumb and hence the same response seqno sequence.
+        breadcrumb = self._breadcrumb
+        if breadcrumb is None:
+            assert self._responder is not None
+            factory, *args = self._responder
+            breadcrumb = factory(*args)
+            object.__setattr__(self, "_breadcrumb", breadcrumb)
+            object.__setattr__(self, "_responder", None)
+        return breadcrumb
+
+    @property
+    def message(self) -> bytes:
+        message = self._message
+        if message is None:
+            message = bytes(self.view)
+            object.__setattr__(self, "_message", message)
+        return message
+
+    def __repr__(self) -> str:
+        return f"Arrival(timestamp={self.timestamp!r}, breadcrumb={self.breadcrumb!r}, message={self.message!r})"
+
+
+def _deferred_arrival(
+    timestamp: Instant,
+    message: bytes | memoryview,
+    factory: Callable[..., Breadcrumb],
+    *args: Any,
+) -> Arrival:
+    """
+    Like the :class:`Arrival` constructor, but the breadcrumb is built by ``factory(*args)`` when first accessed.
+    Most subscribers never respond, so this saves the responder object on the receive path.
+    Used by the session layer; a function rather than a method so that the public class gets no second constructor.
+    """
+    arrival = Arrival.__new__(Arrival)
+    _init_arrival(arrival, timestamp, message, None, (factory, *args))
+    return arrival
+
+
+def _init_arrival(
+    arrival: Arrival,
+    timestamp: Instant,
+    message: bytes | memoryview,
+    breadcrumb: Breadcrumb | None,
+    responder: tuple[Any, ...] | None,
+) -> None:
+    """The construction shared by :meth:`Arrival.__init__` and :func:`_deferred_arrival`."""
+    object.__setattr__(arrival, "timestamp", timestamp)
+    view = message if isinstance(message, memoryview) else memoryview(message)
+    object.__setattr__(arrival, "view", view if view.readonly else view.toreadonly())
+    object.__setattr__(arrival, "_message", message if isinstance(message, bytes) else None)
+    object.__setattr__(arrival, "_breadcrumb", breadcrumb)
+    object.__setattr__(arrival, "_responder", responder)
 
 
 class Subscriber(Closable, ABC):
@@ -389,6 +585,26 @@ class Subscriber(Closable, ABC):
     def timeout(self, duration: float) -> None:
         raise NotImplementedError
 
+    @property
+    @abstractmethod
+    def dropped(self) -> int:
+        """
+        The number of arrivals discarded so far because the queue was at capacity; see :class:`Overflow`.
+        """
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def reordering_windows(self) -> dict[tuple[int, int], float]:
+        """
+        *Diagnostic utility.*
+
+        The reordering window currently in effect for each ``(remote_id, topic_hash)`` stream of an ordered
+        subscription, in seconds. With adaptive reordering, these vary per stream up to the configured maximum;
+        otherwise, they all equal the configured window. Empty for unordered subscriptions.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def substitutions(self, topic: Topic) -> list[tuple[str, int]] | None:
         """
@@ -412,6 +628,39 @@ class Subscriber(Closable, ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def receive_batch(self, max_count: int, max_wait: float = 0.0) -> list[Arrival]:
+        """
+        Wait for at least one deliverable arrival and return up to ``max_count`` of them in delivery order.
+        This is equivalent to awaiting :meth:`__anext__` repeatedly, but the consumer is woken up once per batch.
+
+        Once the first arrival is available, the call lingers for up to ``max_wait`` seconds collecting more,
+        returning early when ``max_count`` is reached. The default zero linger returns whatever is already queued.
+
+        Raises :class:`LivenessError` if no message arrives within :attr:`timeout`; the linger does not count towards
+        the timeout. Raises :class:`StopAsyncIteration` once the subscriber is closed; if it is closed while a batch
+        is being collected, the arrivals collected so far are returned first.
+        """
+        raise NotImplementedError
+
+    async def batches(self, max_count: int, max_wait: float = 0.0) -> AsyncIterator[list[Arrival]]:
+        """
+        Iterate over :meth:`receive_batch` until the subscriber is closed::
+
+            async for batch in sub.batches(64, 0.005):
+                for arrival in batch:
+                    ...
+
+        :class:`LivenessError` propagates out of the loop like with the plain ``async for``;
+        the iteration can be resumed afterwards by calling this method again.
+        """
+        while True:
+            try:
+                batch = await self.receive_batch(max_count, max_wait)
+            except StopAsyncIteration:
+                return
+            yield batch
+
     def listen(
         self,
         callback: Callable[[Arrival | Error], Awaitable[None] | None],
@@ -454,6 +703,25 @@ class Subscriber(Closable, ABC):
         task.add_done_callback(on_done)
         return task
 
+    @abstractmethod
+    def listen_inline(self, callback: Callable[[Arrival], None], *, budget: float = 0.001) -> Closable:
+        """
+        Invoke a synchronous ``callback`` directly from the dispatch path for every deliverable arrival,
+        bypassing the queue, the background task, and the iteration protocol entirely.
+        Arrivals that are already queued are passed to the callback first.
+        While installed, the subscriber does not yield anything via iteration or :meth:`receive_batch`;
+        the liveness timeout is not enforced either.
+
+        This is meant for trivial handlers, like updating the latest known state, on high-rate topics.
+        The callback runs on the event loop inside the transport's receive handler, so it must not block.
+        A callback that takes longer than ``budget`` seconds is reported via logging, and any exception it raises
+        is logged and suppressed, so a faulty handler cannot break the reception of other messages.
+
+        Only one inline callback can be installed per subscriber; close the returned :class:`Closable` to remove it.
+        Later arrivals are then queued as usual.
+        """
+        raise NotImplementedError
+
     def __repr__(self) -> str:
         return f"Subscriber(pattern={self.pattern!r}, verbatim={self.verbatim}, timeout={self.timeout})"
 
@@ -521,13 +789,38 @@ class Node(Closable, ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def subscribe(self, name: str, *, reordering_window: float | None = None) -> Subscriber:
+    def subscribe(
+        self,
+        name: str,
+        *,
+        reordering_window: float | None = None,
+        adaptive_reordering: bool = False,
+        capacity: int | None = None,
+        overflow: Overflow = Overflow.DROP_OLDEST,
+        shared: bool = False,
+    ) -> Subscriber:
         """
         Receive messages from one topic or from several if ``name`` is a pattern.
 
         If ``reordering_window`` is ``None``, messages are yielded in arrival order.
         Otherwise, each ``(remote_id, topic)`` stream is reordered independently to ensure that the application
         sees a monotonically increasing tag sequence; this is useful for sensor feeds, state estimators, etc.
+
+        With ``adaptive_reordering``, ``reordering_window`` is only the upper bound. Each stream then waits for a
+        missing message only as long as its own observed arrival jitter and reordering suggest, so that
+        well-behaved publishers are not held back by a window sized for the worst one on the same pattern.
+        New streams start at the upper bound. See :attr:`Subscriber.reordering_windows`.
+
+        ``capacity`` bounds the number of arrivals queued for the application, which protects the process from
+        a consumer that cannot keep up with a high-rate topic; ``overflow`` decides what happens to the arrivals
+        that do not fit. Unbounded by default.
+
+        ``shared`` subscribers created with the same ``name`` read one common queue of arrivals, each at its own pace,
+        instead of having every arrival queued for each of them separately. This makes delivery cost independent of
+        the number of such subscribers, which helps when many local consumers watch the same topic.
+        A shared subscriber that falls behind by more than its ``capacity`` skips the oldest arrivals,
+        so only :attr:`Overflow.DROP_OLDEST` is supported, and it cannot be ordered.
+        Installing an inline callback (see :meth:`Subscriber.listen_inline`) makes the subscriber private again.
         """
         raise NotImplementedError
 
@@ -535,7 +828,14 @@ class Node(Closable, ABC):
         return f"Node(home={self.home!r}, namespace={self.namespace!r})"
 
     @staticmethod
-    def new(transport: Transport, home: str = "", namespace: str = "") -> Node:
+    def new(
+        transport: Transport,
+        home: str = "",
+        namespace: str = "",
+        *,
+        gossip_bandwidth: float | None = None,
+        timer_resolution: float | None = None,
+    ) -> Node:
         """
         Construct a new node using the specified transport. This is the main entry point of the library.
 
@@ -549,6 +849,18 @@ class Node(Closable, ABC):
 
         If the namespace is not set, it is read from the CYPHAL_NAMESPACE environment variable,
         which is the main intended use case. Direct assignment might be considered an anti-pattern in most cases.
+
+        ``gossip_bandwidth`` caps the total rate of topic gossip emitted by the node, in bytes per second
+        (header and name included). When many topics are due at once, periodic gossip is spread out to fit the budget,
+        which stretches the effective gossip period; urgent gossip that resolves subject-ID collisions is never held
+        back. Responses to scout queries from other nodes are streamed within the same budget.
+        Useful on low-bandwidth buses like Classic CAN when the node has many topics. Unlimited by default.
+
+        ``timer_resolution`` is the granularity, in seconds, of the timer that closes the reordering windows
+        of ordered subscriptions (see ``reordering_window`` in :meth:`subscribe`) and enforces the liveness timeouts
+        of subscribers and response streams. These durations are rounded up to it, so a coarser resolution delays
+        lost-message recovery and timeout reporting slightly in exchange for fewer event loop wakeups.
+        Defaults to a few milliseconds.
         """
         from ._node import NodeImpl
 
@@ -563,7 +875,13 @@ class Node(Closable, ABC):
         namespace = namespace.strip() or os.getenv("CYPHAL_NAMESPACE", "").strip()
 
         # Construct the node.
-        node = NodeImpl(transport, home=home, namespace=namespace)
+        node = NodeImpl(
+            transport,
+            home=home,
+            namespace=namespace,
+            gossip_bandwidth=gossip_bandwidth,
+            timer_resolution=timer_resolution,
+        )
         _logger.info("Constructed %s", node)
 
         # Set up default name remapping.
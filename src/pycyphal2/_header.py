@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import struct
+from collections.abc import Callable
 from dataclasses import dataclass
 
 U64_MASK = 0xFFFFFFFFFFFFFFFF
@@ -10,23 +11,60 @@ SEQNO48_MASK = (1 << 48) - 1
 LAGE_MIN = -1
 LAGE_MAX = 35
 
+# One precompiled layout per header kind. Pad bytes ("x") are ignored by the receiver and zeroed by the sender.
+_MSG = struct.Struct("<BxBbIQQ")  # type, -, incompatibility, lage, evictions, hash, tag
+_MSG_ACK = struct.Struct("<B3xIQQ")  # type, -, incompatibility, hash, tag
+_RSP = struct.Struct("<QQQ")  # type | tag << 8 | seqno << 16, hash, message tag
+_GOSSIP = struct.Struct("<BxxbIQI3xB")  # type, -, lage, incompatibility, hash, evictions, -, name length
+_SCOUT = struct.Struct("<B3xIQ7xB")  # type, -, incompatibility, incompatibility, pattern length
+
+
+def _s8(value: int) -> int:
+    """Wrap to the signed byte range the same way as the lage byte is truncated on the wire."""
+    return ((value & 0xFF) ^ 0x80) - 0x80
+
+
+class _Codec:
+    """
+    Serialization shared by all header types: the values from _wire() are packed with the layout of the type.
+    A plain base rather than an ABC, which would slow down the isinstance() dispatch of received headers;
+    the subclasses are checked for _LAYOUT and _wire() when they are defined instead.
+    """
+
+    __slots__ = ()
+    _LAYOUT: struct.Struct
+    _wire: Callable[[], tuple[int, ...]]  # The field values in the order of the layout.
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        if not (isinstance(getattr(cls, "_LAYOUT", None), struct.Struct) and callable(getattr(cls, "_wire", None))):
+            raise TypeError(f"Header type {cls.__name__} must define _LAYOUT and _wire()")
+
+    def serialize(self) -> bytes:
+        return self._LAYOUT.pack(*self._wire())
+
+    def pack_into(self, buf: bytearray | memoryview, offset: int = 0) -> None:
+        """Serialize into a caller-supplied buffer at the given offset, avoiding an intermediate bytes object."""
+        self._LAYOUT.pack_into(buf, offset, *self._wire())
+
 
 # =====================================================================================================================
 # MSG headers
 # =====================================================================================================================
 
 
-@dataclass(frozen=True)
-class MsgBeHeader:
+@dataclass(frozen=True, slots=True)
+class MsgBeHeader(_Codec):
     TYPE = 0
+    _LAYOUT = _MSG
 
     topic_log_age: int
     topic_evictions: int
     topic_hash: int
     tag: int
 
-    def serialize(self) -> bytes:
-        return _serialize_msg(self.TYPE, self.topic_log_age, self.topic_evictions, self.topic_hash, self.tag)
+    def _wire(self) -> tuple[int, ...]:
+        return _wire_msg(self.TYPE, self.topic_log_age, self.topic_evictions, self.topic_hash, self.tag)
 
     @staticmethod
     def deserialize(buf: bytes | memoryview) -> MsgBeHeader | None:
@@ -34,17 +72,18 @@ class MsgBeHeader:
         return MsgBeHeader(*r) if r is not None else None
 
 
-@dataclass(frozen=True)
-class MsgRelHeader:
+@dataclass(frozen=True, slots=True)
+class MsgRelHeader(_Codec):
     TYPE = 1
+    _LAYOUT = _MSG
 
     topic_log_age: int
     topic_evictions: int
     topic_hash: int
     tag: int
 
-    def serialize(self) -> bytes:
-        return _serialize_msg(self.TYPE, self.topic_log_age, self.topic_evictions, self.topic_hash, self.tag)
+    def _wire(self) -> tuple[int, ...]:
+        return _wire_msg(self.TYPE, self.topic_log_age, self.topic_evictions, self.topic_hash, self.tag)
 
     @staticmethod
     def deserialize(buf: bytes | memoryview) -> MsgRelHeader | None:
@@ -52,27 +91,18 @@ class MsgRelHeader:
         return MsgRelHeader(*r) if r is not None else None
 
 
-def _serialize_msg(ty: int, lage: int, evictions: int, topic_hash: int, tag: int) -> bytes:
-    buf = bytearray(HEADER_SIZE)
-    buf[0] = ty
-    buf[3] = lage & 0xFF
-    struct.pack_into("<I", buf, 4, evictions & 0xFFFFFFFF)
-    struct.pack_into("<Q", buf, 8, topic_hash & U64_MASK)
-    struct.pack_into("<Q", buf, 16, tag & U64_MASK)
-    return bytes(buf)
+def _wire_msg(ty: int, lage: int, evictions: int, topic_hash: int, tag: int) -> tuple[int, ...]:
+    return (ty, 0, _s8(lage), evictions & 0xFFFFFFFF, topic_hash & U64_MASK, tag & U64_MASK)
 
 
 def _deserialize_msg(buf: bytes | memoryview) -> tuple[int, int, int, int] | None:
     if len(buf) < HEADER_SIZE:
         return None
-    if buf[2] != 0:  # incompatibility
+    _, incompatibility, lage, evictions, topic_hash, tag = _MSG.unpack_from(buf)
+    if incompatibility != 0:
         return None
-    lage = struct.unpack_from("<b", buf, 3)[0]
     if not (LAGE_MIN <= lage <= LAGE_MAX):
         return None
-    evictions = struct.unpack_from("<I", buf, 4)[0]
-    topic_hash = struct.unpack_from("<Q", buf, 8)[0]
-    tag = struct.unpack_from("<Q", buf, 16)[0]
     return (lage, evictions, topic_hash, tag)
 
 
@@ -81,15 +111,16 @@ def _deserialize_msg(buf: bytes | memoryview) -> tuple[int, int, int, int] | Non
 # =====================================================================================================================
 
 
-@dataclass(frozen=True)
-class MsgAckHeader:
+@dataclass(frozen=True, slots=True)
+class MsgAckHeader(_Codec):
     TYPE = 2
+    _LAYOUT = _MSG_ACK
 
     topic_hash: int
     tag: int
 
-    def serialize(self) -> bytes:
-        return _serialize_msg_ack(self.TYPE, self.topic_hash, self.tag)
+    def _wire(self) -> tuple[int, ...]:
+        return (self.TYPE, 0, self.topic_hash & U64_MASK, self.tag & U64_MASK)
 
     @staticmethod
     def deserialize(buf: bytes | memoryview) -> MsgAckHeader | None:
@@ -97,15 +128,16 @@ class MsgAckHeader:
         return MsgAckHeader(*r) if r is not None else None
 
 
-@dataclass(frozen=True)
-class MsgNackHeader:
+@dataclass(frozen=True, slots=True)
+class MsgNackHeader(_Codec):
     TYPE = 3
+    _LAYOUT = _MSG_ACK
 
     topic_hash: int
     tag: int
 
-    def serialize(self) -> bytes:
-        return _serialize_msg_ack(self.TYPE, self.topic_hash, self.tag)
+    def _wire(self) -> tuple[int, ...]:
+        return (self.TYPE, 0, self.topic_hash & U64_MASK, self.tag & U64_MASK)
 
     @staticmethod
     def deserialize(buf: bytes | memoryview) -> MsgNackHeader | None:
@@ -113,21 +145,12 @@ class MsgNackHeader:
         return MsgNackHeader(*r) if r is not None else None
 
 
-def _serialize_msg_ack(ty: int, topic_hash: int, tag: int) -> bytes:
-    buf = bytearray(HEADER_SIZE)
-    buf[0] = ty
-    struct.pack_into("<Q", buf, 8, topic_hash & U64_MASK)
-    struct.pack_into("<Q", buf, 16, tag & U64_MASK)
-    return bytes(buf)
-
-
 def _deserialize_msg_ack(buf: bytes | memoryview) -> tuple[int, int] | None:
     if len(buf) < HEADER_SIZE:
         return None
-    if struct.unpack_from("<I", buf, 4)[0] != 0:  # incompatibility
+    _, incompatibility, topic_hash, tag = _MSG_ACK.unpack_from(buf)
+    if incompatibility != 0:
         return None
-    topic_hash = struct.unpack_from("<Q", buf, 8)[0]
-    tag = struct.unpack_from("<Q", buf, 16)[0]
     return (topic_hash, tag)
 
 
@@ -136,17 +159,18 @@ def _deserialize_msg_ack(buf: bytes | memoryview) -> tuple[int, int] | None:
 # =====================================================================================================================
 
 
-@dataclass(frozen=True)
-class RspBeHeader:
+@dataclass(frozen=True, slots=True)
+class RspBeHeader(_Codec):
     TYPE = 4
+    _LAYOUT = _RSP
 
     tag: int  # u8
     seqno: int  # u48
     topic_hash: int
     message_tag: int
 
-    def serialize(self) -> bytes:
-        return _serialize_rsp(self.TYPE, self.tag, self.seqno, self.topic_hash, self.message_tag)
+    def _wire(self) -> tuple[int, ...]:
+        return _wire_rsp(self.TYPE, self.tag, self.seqno, self.topic_hash, self.message_tag)
 
     @staticmethod
     def deserialize(buf: bytes | memoryview) -> RspBeHeader | None:
@@ -154,17 +178,18 @@ class RspBeHeader:
         return RspBeHeader(*r) if r is not None else None
 
 
-@dataclass(frozen=True)
-class RspRelHeader:
+@dataclass(frozen=True, slots=True)
+class RspRelHeader(_Codec):
     TYPE = 5
+    _LAYOUT = _RSP
 
     tag: int
     seqno: int
     topic_hash: int
     message_tag: int
 
-    def serialize(self) -> bytes:
-        return _serialize_rsp(self.TYPE, self.tag, self.seqno, self.topic_hash, self.message_tag)
+    def _wire(self) -> tuple[int, ...]:
+        return _wire_rsp(self.TYPE, self.tag, self.seqno, self.topic_hash, self.message_tag)
 
     @staticmethod
     def deserialize(buf: bytes | memoryview) -> RspRelHeader | None:
@@ -177,17 +202,18 @@ class RspRelHeader:
 # =====================================================================================================================
 
 
-@dataclass(frozen=True)
-class RspAckHeader:
+@dataclass(frozen=True, slots=True)
+class RspAckHeader(_Codec):
     TYPE = 6
+    _LAYOUT = _RSP
 
     tag: int
     seqno: int
     topic_hash: int
     message_tag: int
 
-    def serialize(self) -> bytes:
-        return _serialize_rsp(self.TYPE, self.tag, self.seqno, self.topic_hash, self.message_tag)
+    def _wire(self) -> tuple[int, ...]:
+        return _wire_rsp(self.TYPE, self.tag, self.seqno, self.topic_hash, self.message_tag)
 
     @staticmethod
     def deserialize(buf: bytes | memoryview) -> RspAckHeader | None:
@@ -195,17 +221,18 @@ class RspAckHeader:
         return RspAckHeader(*r) if r is not None else None
 
 
-@dataclass(frozen=True)
-class RspNackHeader:
+@dataclass(frozen=True, slots=True)
+class RspNackHeader(_Codec):
     TYPE = 7
+    _LAYOUT = _RSP
 
     tag: int
     seqno: int
     topic_hash: int
     message_tag: int
 
-    def serialize(self) -> bytes:
-        return _serialize_rsp(self.TYPE, self.tag, self.seqno, self.topic_hash, self.message_tag)
+    def _wire(self) -> tuple[int, ...]:
+        return _wire_rsp(self.TYPE, self.tag, self.seqno, self.topic_hash, self.message_tag)
 
     @staticmethod
     def deserialize(buf: bytes | memoryview) -> RspNackHeader | None:
@@ -213,28 +240,15 @@ class RspNackHeader:
         return RspNackHeader(*r) if r is not None else None
 
 
-def _serialize_rsp(ty: int, tag: int, seqno: int, topic_hash: int, message_tag: int) -> bytes:
-    buf = bytearray(HEADER_SIZE)
-    buf[0] = ty
-    buf[1] = tag & 0xFF
-    seqno48 = seqno & SEQNO48_MASK
-    for i in range(6):
-        buf[2 + i] = (seqno48 >> (i * 8)) & 0xFF
-    struct.pack_into("<Q", buf, 8, topic_hash & U64_MASK)
-    struct.pack_into("<Q", buf, 16, message_tag & U64_MASK)
-    return bytes(buf)
+def _wire_rsp(ty: int, tag: int, seqno: int, topic_hash: int, message_tag: int) -> tuple[int, ...]:
+    return (ty | ((tag & 0xFF) << 8) | ((seqno & SEQNO48_MASK) << 16), topic_hash & U64_MASK, message_tag & U64_MASK)
 
 
 def _deserialize_rsp(buf: bytes | memoryview) -> tuple[int, int, int, int] | None:
     if len(buf) < HEADER_SIZE:
         return None
-    tag = buf[1]
-    seqno = 0
-    for i in range(6):
-        seqno |= buf[2 + i] << (i * 8)
-    topic_hash = struct.unpack_from("<Q", buf, 8)[0]
-    message_tag = struct.unpack_from("<Q", buf, 16)[0]
-    return (tag, seqno, topic_hash, message_tag)
+    head, topic_hash, message_tag = _RSP.unpack_from(buf)
+    return ((head >> 8) & 0xFF, head >> 16, topic_hash, message_tag)
 
 
 # =====================================================================================================================
@@ -242,36 +256,35 @@ def _deserialize_rsp(buf: bytes | memoryview) -> tuple[int, int, int, int] | Non
 # =====================================================================================================================
 
 
-@dataclass(frozen=True)
-class GossipHeader:
+@dataclass(frozen=True, slots=True)
+class GossipHeader(_Codec):
     TYPE = 8
+    _LAYOUT = _GOSSIP
 
     topic_log_age: int
     topic_hash: int
     topic_evictions: int
     name_len: int
 
-    def serialize(self) -> bytes:
-        buf = bytearray(HEADER_SIZE)
-        buf[0] = self.TYPE
-        buf[3] = self.topic_log_age & 0xFF
-        struct.pack_into("<Q", buf, 8, self.topic_hash & U64_MASK)
-        struct.pack_into("<I", buf, 16, self.topic_evictions & 0xFFFFFFFF)
-        buf[23] = self.name_len & 0xFF
-        return bytes(buf)
+    def _wire(self) -> tuple[int, ...]:
+        return (
+            self.TYPE,
+            _s8(self.topic_log_age),
+            0,
+            self.topic_hash & U64_MASK,
+            self.topic_evictions & 0xFFFFFFFF,
+            self.name_len & 0xFF,
+        )
 
     @staticmethod
     def deserialize(buf: bytes | memoryview) -> GossipHeader | None:
         if len(buf) < HEADER_SIZE:
             return None
-        if struct.unpack_from("<I", buf, 4)[0] != 0:
+        _, lage, incompatibility, topic_hash, evictions, name_len = _GOSSIP.unpack_from(buf)
+        if incompatibility != 0:
             return None
-        lage = struct.unpack_from("<b", buf, 3)[0]
         if not (LAGE_MIN <= lage <= LAGE_MAX):
             return None
-        topic_hash = struct.unpack_from("<Q", buf, 8)[0]
-        evictions = struct.unpack_from("<I", buf, 16)[0]
-        name_len = buf[23]
         return GossipHeader(lage, topic_hash, evictions, name_len)
 
 
@@ -280,27 +293,24 @@ class GossipHeader:
 # =====================================================================================================================
 
 
-@dataclass(frozen=True)
-class ScoutHeader:
+@dataclass(frozen=True, slots=True)
+class ScoutHeader(_Codec):
     TYPE = 9
+    _LAYOUT = _SCOUT
 
     pattern_len: int
 
-    def serialize(self) -> bytes:
-        buf = bytearray(HEADER_SIZE)
-        buf[0] = self.TYPE
-        buf[23] = self.pattern_len & 0xFF
-        return bytes(buf)
+    def _wire(self) -> tuple[int, ...]:
+        return (self.TYPE, 0, 0, self.pattern_len & 0xFF)
 
     @staticmethod
     def deserialize(buf: bytes | memoryview) -> ScoutHeader | None:
         if len(buf) < HEADER_SIZE:
             return None
-        if struct.unpack_from("<I", buf, 4)[0] != 0:
-            return None
-        if struct.unpack_from("<Q", buf, 8)[0] != 0:
+        _, incompatibility_a, incompatibility_b, pattern_len = _SCOUT.unpack_from(buf)
+        if incompatibility_a != 0 or incompatibility_b != 0:
             return None
-        return ScoutHeader(buf[23])
+        return ScoutHeader(pattern_len)
 
 
 # =====================================================================================================================
@@ -321,29 +331,24 @@ HeaderType = (
 )
 
 
+# Indexed by the type byte of the header.
+_DESERIALIZERS: tuple[Callable[[bytes | memoryview], HeaderType | None], ...] = (
+    MsgBeHeader.deserialize,
+    MsgRelHeader.deserialize,
+    MsgAckHeader.deserialize,
+    MsgNackHeader.deserialize,
+    RspBeHeader.deserialize,
+    RspRelHeader.deserialize,
+    RspAckHeader.deserialize,
+    RspNackHeader.deserialize,
+    GossipHeader.deserialize,
+    ScoutHeader.deserialize,
+)
+
+
 def deserialize_header(buf: bytes | memoryview) -> HeaderType | None:
     """Deserialize a 24-byte session-layer header. Returns None on validation failure."""
     if len(buf) < 1:
         return None
     ty = buf[0]
-    if ty == 0:
-        return MsgBeHeader.deserialize(buf)
-    if ty == 1:
-        return MsgRelHeader.deserialize(buf)
-    if ty == 2:
-        return MsgAckHeader.deserialize(buf)
-    if ty == 3:
-        return MsgNackHeader.deserialize(buf)
-    if ty == 4:
-        return RspBeHeader.deserialize(buf)
-    if ty == 5:
-        return RspRelHeader.deserialize(buf)
-    if ty == 6:
-        return RspAckHeader.deserialize(buf)
-    if ty == 7:
-        return RspNackHeader.deserialize(buf)
-    if ty == 8:
-        return GossipHeader.deserialize(buf)
-    if ty == 9:
-        return ScoutHeader.deserialize(buf)
-    return None
+    return _DESERIALIZERS[ty](buf) if ty < len(_DESERIALIZERS) else None
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import asyncio
-from collections import OrderedDict
+from collections import OrderedDict, deque
+import heapq
 from collections.abc import Coroutine
 import logging
 import math
@@ -10,7 +11,7 @@ import random
 import time
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Generic, TypeVar
 
 from ._hash import rapidhash
 from ._header import (
@@ -29,7 +30,8 @@ from ._header import (
     deserialize_header,
 )
 from ._transport import SubjectWriter, Transport, TransportArrival
-from ._api import Topic, Node, Publisher, Subscriber, Breadcrumb, Closable, ClosedError, Instant, Priority, SendError
+from ._api import Topic, Node, Publisher, Subscriber, Closable, ClosedError, Instant, Priority, SendError
+from ._api import Overflow
 from ._api import SUBJECT_ID_PINNED_MAX
 
 if TYPE_CHECKING:
@@ -38,6 +40,8 @@ if TYPE_CHECKING:
 
 _logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # =====================================================================================================================
 # Constants
 # =====================================================================================================================
@@ -48,13 +52,18 @@ GOSSIP_PERIOD = 5.0
 GOSSIP_URGENT_DELAY_MAX = 0.01
 GOSSIP_BROADCAST_RATIO = 10
 GOSSIP_PERIOD_DITHER_RATIO = 8
+GOSSIP_PACER_BURST = 0.1
 ACK_BASELINE_DEFAULT_TIMEOUT = 0.016
 ACK_TX_TIMEOUT = 1.0
+ACK_RTT_TIMEOUT_MIN = 0.001
+ACK_RTT_TIMEOUT_MAX = 1.0
 SESSION_LIFETIME = 60.0
 IMPLICIT_TOPIC_TIMEOUT = 600.0
 REORDERING_CAPACITY = 16
+TIMER_RESOLUTION = 0.005
 ASSOC_SLACK_LIMIT = 2
 DEDUP_HISTORY = 512
+DEDUP_SWEEP_PERIOD = SESSION_LIFETIME / 4
 ACK_SEQNO_MAX_LAG = 100000
 U64_MASK = (1 << 64) - 1
 
@@ -75,6 +84,15 @@ def ack_window(deadline_ns: int, ack_timeout: float) -> tuple[int, bool] | None:
     return ack_deadline_ns, ack_is_last_attempt(ack_deadline_ns, ack_timeout, deadline_ns)
 
 
+def queue_capacity(capacity: int | None) -> int | None:
+    """Validate the capacity of a bounded receive queue; None means unbounded."""
+    if capacity is None:
+        return None
+    if capacity < 1:
+        raise ValueError("Queue capacity must be positive")
+    return int(capacity)
+
+
 class GossipScope(Enum):
     UNICAST = auto()
     BROADCAST = auto()
@@ -237,6 +255,116 @@ def match_pattern(pattern: str, name: str) -> list[tuple[str, int]] | None:
     return subs
 
 
+class _NameIndexNode(Generic[T]):
+    __slots__ = ("children", "entry")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _NameIndexNode[T]] = {}
+        self.entry: tuple[int, T] | None = None  # (insertion seqno, value)
+
+
+class NameIndex(Generic[T]):
+    """
+    Segment trie over '/'-separated keys; each key is split only once, on insertion.
+    It answers both directions of match_pattern() without scanning the whole table:
+    match_name() finds the values whose keys, taken as patterns, match the given name;
+    match_pattern() finds the values whose keys, taken as names, are matched by the given pattern.
+    The cost scales with the number of matches rather than the number of keys.
+    Results are ordered by insertion, same as iterating the dict that is being indexed.
+    """
+
+    def __init__(self) -> None:
+        self._root: _NameIndexNode[T] = _NameIndexNode()
+        self._seqno = 0
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def add(self, key: str, value: T) -> None:
+        node = self._root
+        for seg in key.split("/"):
+            child = node.children.get(seg)
+            if child is None:
+                child = _NameIndexNode()
+                node.children[seg] = child
+            node = child
+        if node.entry is None:
+            self._len += 1
+        node.entry = (self._seqno, value)
+        self._seqno += 1
+
+    def remove(self, key: str) -> None:
+        segs = key.split("/")
+        path = [self._root]
+        for seg in segs:
+            child = path[-1].children.get(seg)
+            if child is None:
+                return
+            path.append(child)
+        if path[-1].entry is None:
+            return
+        path[-1].entry = None
+        self._len -= 1
+        for i in range(len(segs) - 1, -1, -1):  # Prune the branch that no longer leads anywhere.
+            node = path[i + 1]
+            if node.entry is not None or node.children:
+                break
+            del path[i].children[segs[i]]
+
+    def match_name(self, name: str) -> list[T]:
+        """Values whose keys are patterns matching the name; see match_pattern() for the semantics."""
+        segs = name.split("/")
+        found: dict[int, T] = {}
+        stack = [(self._root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            tail = node.children.get(">")
+            if tail is not None and tail.entry is not None:  # Terminal '>' takes the rest, possibly nothing.
+                found[tail.entry[0]] = tail.entry[1]
+            if depth == len(segs):
+                if node.entry is not None:
+                    found[node.entry[0]] = node.entry[1]
+                continue
+            seg = segs[depth]
+            child = node.children.get(seg)
+            if child is not None:
+                stack.append((child, depth + 1))
+            if seg != "*" and (child := node.children.get("*")) is not None:
+                stack.append((child, depth + 1))
+        return [found[k] for k in sorted(found)]
+
+    def match_pattern(self, pattern: str) -> list[T]:
+        """Values whose keys are names matched by the pattern; see match_pattern() for the semantics."""
+        segs = pattern.split("/")
+        last = len(segs) - 1
+        found: dict[int, T] = {}
+        stack = [(self._root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if depth > last:
+                if node.entry is not None:
+                    found[node.entry[0]] = node.entry[1]
+                continue
+            seg = segs[depth]
+            if seg == ">" and depth == last:
+                self._collect(node, found)
+            elif seg == "*":
+                stack.extend((child, depth + 1) for child in node.children.values())
+            elif (child := node.children.get(seg)) is not None:
+                stack.append((child, depth + 1))
+        return [found[k] for k in sorted(found)]
+
+    @staticmethod
+    def _collect(node: _NameIndexNode[T], found: dict[int, T]) -> None:
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node.entry is not None:
+                found[node.entry[0]] = node.entry[1]
+            stack.extend(node.children.values())
+
+
 # =====================================================================================================================
 # Subject-ID Computation
 # =====================================================================================================================
@@ -254,6 +382,33 @@ def compute_subject_id(topic_hash: int, evictions: int, modulus: int) -> int:
 # =====================================================================================================================
 
 
+@dataclass(slots=True)
+class RttEstimator:
+    """
+    Smoothed round-trip time to one remote and its variation, as in RFC 6298, from which the initial ACK timeout
+    is derived. Only transfers that were sent once are sampled, since the ACK of a retransmitted one is ambiguous.
+    """
+
+    srtt: float = 0.0
+    rttvar: float = 0.0
+    samples: int = 0
+    last_sample: float = 0.0
+
+    def sample(self, rtt: float, now: float) -> None:
+        if self.samples == 0:
+            self.srtt = rtt
+            self.rttvar = rtt * 0.5
+        else:
+            self.rttvar += (abs(self.srtt - rtt) - self.rttvar) * 0.25
+            self.srtt += (rtt - self.srtt) * 0.125
+        self.samples += 1
+        self.last_sample = now
+
+    @property
+    def timeout(self) -> float:
+        return min(ACK_RTT_TIMEOUT_MAX, max(ACK_RTT_TIMEOUT_MIN, self.srtt + (4.0 * self.rttvar)))
+
+
 @dataclass
 class Association:
     """Tracks a known remote subscriber for reliable delivery ACK tracking."""
@@ -263,42 +418,83 @@ class Association:
     slack: int = 0
     seqno_witness: int = 0
     pending_count: int = 0
+    rtt: RttEstimator = field(default_factory=RttEstimator)
 
 
-@dataclass
+_DEDUP_EMPTY = bytes(DEDUP_HISTORY // 8)
+_DEDUP_INDEX_MASK = (DEDUP_HISTORY // 8) - 1  # DEDUP_HISTORY is a power of two.
+
+
+@dataclass(slots=True)
 class DedupState:
-    """Per-remote deduplication state for reliable messages."""
+    """
+    Per-remote deduplication state for reliable messages.
+    Remembers which of the DEDUP_HISTORY tags up to and including the frontier have been seen, as a ring of bits
+    indexed by the tag modulo the history length, so that advancing the frontier does not shift the whole history.
+    """
 
     tag_frontier: int = 0
-    bitmap: int = 0
     last_active: float = 0.0
+    seen: bytearray = field(default_factory=lambda: bytearray(DEDUP_HISTORY // 8))
 
     def check(self, tag: int) -> bool:
-        rev = (self.tag_frontier - tag) & U64_MASK
-        return rev < DEDUP_HISTORY and bool((self.bitmap >> rev) & 1)
+        if ((self.tag_frontier - tag) & U64_MASK) >= DEDUP_HISTORY:
+            return False
+        return bool(self.seen[(tag >> 3) & _DEDUP_INDEX_MASK] & (1 << (tag & 7)))
 
     def check_and_record(self, tag: int, now: float) -> bool:
         """Returns True if this is a new (non-duplicate) tag."""
+        seen = self.seen
         if (now - self.last_active) > SESSION_LIFETIME:
             self.tag_frontier = tag
-            self.bitmap = 0
+            seen[:] = _DEDUP_EMPTY
         self.last_active = now
-        fwd = (tag - self.tag_frontier) & U64_MASK
-        rev = (self.tag_frontier - tag) & U64_MASK
-        if rev < DEDUP_HISTORY:
-            mask = 1 << rev
-            if self.bitmap & mask:
+        frontier = self.tag_frontier
+        index = (tag >> 3) & _DEDUP_INDEX_MASK
+        mask = 1 << (tag & 7)
+        fwd = (tag - frontier) & U64_MASK
+        if fwd == 1:  # The common case of an in-order stream.
+            self.tag_frontier = tag
+            seen[index] |= mask
+            return True
+        if ((frontier - tag) & U64_MASK) < DEDUP_HISTORY:
+            if seen[index] & mask:
                 return False
-            self.bitmap |= mask
+            seen[index] |= mask
             return True
+        # Advance the frontier. The slots of the tags skipped over still hold tags that are now out of the history.
         if fwd < DEDUP_HISTORY:
-            self.bitmap = (self.bitmap << fwd) & ((1 << DEDUP_HISTORY) - 1)
+            self._clear(frontier + 1, fwd - 1)
         else:
-            self.bitmap = 0
+            seen[:] = _DEDUP_EMPTY
         self.tag_frontier = tag
-        self.bitmap |= 1
+        seen[index] |= mask
         return True
 
+    def _clear(self, start: int, count: int) -> None:
+        """Unrecord ``count`` < DEDUP_HISTORY consecutive tags from ``start`` on, whole bytes at a time."""
+        seen = self.seen
+        head = (-start) & 7  # Bits up to the next byte boundary.
+        if head:
+            if head > count:
+                head = count
+            seen[(start >> 3) & _DEDUP_INDEX_MASK] &= ~(((1 << head) - 1) << (start & 7))
+            start += head
+            count -= head
+        first = (start >> 3) & _DEDUP_INDEX_MASK
+        stop = first + (count >> 3)
+        if stop > len(seen):  # Wraps around the end of the ring.
+            seen[first:] = _DEDUP_EMPTY[first:]
+            seen[: stop - len(seen)] = _DEDUP_EMPTY[: stop - len(seen)]
+        elif stop > first:
+            seen[first:stop] = _DEDUP_EMPTY[first:stop]
+        if count & 7:
+            seen[stop & _DEDUP_INDEX_MASK] &= ~((1 << (count & 7)) - 1)
+
+    def forget(self, tag: int) -> None:
+        """Unrecord a tag, so that a retransmission of a message that could not be accepted is not a duplicate."""
+        self.seen[(tag >> 3) & _DEDUP_INDEX_MASK] &= ~(1 << (tag & 7))
+
 
 @dataclass
 class SubscriberRoot:
@@ -307,8 +503,22 @@ class SubscriberRoot:
     name: str
     is_pattern: bool
     subscribers: list[Any] = field(default_factory=list)  # list[SubscriberImpl]
+    topics: dict[TopicImpl, None] = field(default_factory=dict)  # Coupled topics; ordered set.
     needs_scouting: bool = False
     scout_task: asyncio.Task[None] | None = None
+    ring: FanoutRing[Any] | None = None  # Read by the shared subscribers; created with the first one.
+
+    def invalidate_delivery_plans(self) -> None:
+        for topic in self.topics:
+            topic.invalidate_delivery_plan()
+
+
+@dataclass(frozen=True)
+class DeliveryPlan:
+    """Flattened recipients of the messages of one topic; rebuilt when its couplings or their subscribers change."""
+
+    subscribers: tuple[Any, ...]  # tuple[SubscriberImpl, ...] that are delivered to individually.
+    rings: tuple[FanoutRing[Any], ...]  # Each one serves all shared subscribers of its root at once.
 
 
 @dataclass
@@ -335,6 +545,403 @@ class SharedSubjectWriter:
     owners: set[Topic] = field(default_factory=set)
 
 
+class GossipPacer:
+    """
+    Token bucket that caps the total gossip bandwidth of a node in bytes per second; no cap if the rate is None.
+    The burst allowance is small (GOSSIP_PACER_BURST seconds worth, but at least one full gossip),
+    so that a large number of topics becoming due at once is spread out evenly instead of going out in one storm.
+    """
+
+    def __init__(self, rate: float | None, now: float) -> None:
+        self.rate = rate
+        self.capacity = math.inf if rate is None else max(rate * GOSSIP_PACER_BURST, HEADER_SIZE + TOPIC_NAME_MAX)
+        self._tokens = self.capacity
+        self._updated_at = now
+
+    def _refill(self, now: float) -> None:
+        if self.rate is not None:
+            self._tokens = min(self.capacity, self._tokens + (max(0.0, now - self._updated_at) * self.rate))
+        self._updated_at = now
+
+    def delay(self, cost: int, now: float) -> float:
+        """Time until the budget allows sending ``cost`` bytes."""
+        if self.rate is None:
+            return 0.0
+        self._refill(now)
+        return max(0.0, (min(cost, self.capacity) - self._tokens) / self.rate)
+
+    def consume(self, cost: int, now: float, *, force: bool = False) -> bool:
+        """
+        Take ``cost`` bytes from the budget if available and return True; otherwise return False and take nothing.
+        Forced consumption always succeeds and may put the bucket into debt, delaying subsequent unforced sends.
+        """
+        if self.rate is None:
+            return True
+        self._refill(now)
+        if force:
+            self._tokens = max(-self.capacity, self._tokens - cost)
+            return True
+        if self._tokens < min(cost, self.capacity):
+            return False
+        self._tokens -= cost
+        return True
+
+
+class TimerWheel(Generic[T]):
+    """
+    Coarse timer serving many short deadlines, like reordering windows, from one event loop timer.
+    Deadlines are rounded up to the next multiple of ``resolution`` (so they never fire early) and bucketed per tick;
+    only the earliest nonempty tick has a loop timer armed. Scheduling, rescheduling, and cancelling an entry are
+    dict operations that only touch the event loop when the earliest tick moves closer.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, resolution: float) -> None:
+        resolution = float(resolution)
+        if (resolution <= 0.0) or (not math.isfinite(resolution)):
+            raise ValueError("Timer resolution must be a finite positive duration")
+        self.loop = loop
+        self.resolution = resolution
+        self._buckets: dict[int, dict[T, Callable[[T], None]]] = {}
+        self._tick_of: dict[T, int] = {}
+        self._ticks: list[int] = []  # Heap of bucket ticks; ticks whose buckets are gone are skipped lazily.
+        self._armed_tick: int | None = None
+        self._handle: asyncio.TimerHandle | None = None
+
+    def __len__(self) -> int:
+        return len(self._tick_of)
+
+    def __contains__(self, key: T) -> bool:
+        return key in self._tick_of
+
+    def schedule(self, key: T, deadline: float, callback: Callable[[T], None]) -> None:
+        """Invoke ``callback(key)`` once at ``deadline`` (loop time) or slightly later; replaces the entry of the key."""
+        self.cancel(key)
+        tick = math.ceil(deadline / self.resolution)
+        self._tick_of[key] = tick
+        bucket = self._buckets.get(tick)
+        if bucket is None:
+            bucket = self._buckets[tick] = {}
+            heapq.heappush(self._ticks, tick)
+        bucket[key] = callback
+        if (self._armed_tick is None) or (tick < self._armed_tick):
+            self._arm(tick)
+
+    def cancel(self, key: T) -> None:
+        tick = self._tick_of.pop(key, None)
+        if tick is None:
+            return
+        bucket = self._buckets.get(tick)
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del self._buckets[tick]
+        # The loop timer is left armed; it is cheaper to wake up once for nothing than to rearm on every cancel.
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._armed_tick = None
+        self._buckets.clear()
+        self._tick_of.clear()
+        self._ticks.clear()
+
+    def _arm(self, tick: int) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+        self._armed_tick = tick
+        self._handle = self.loop.call_at(tick * self.resolution, self._fire)
+
+    def _fire(self) -> None:
+        armed_tick = self._armed_tick
+        assert armed_tick is not None
+        self._handle = None
+        # Entries scheduled by the callbacks into due ticks are picked up by this loop rather than a new timer.
+        while self._ticks and self._ticks[0] <= armed_tick:
+            tick = heapq.heappop(self._ticks)
+            bucket = self._buckets.pop(tick, None)
+            for key, callback in (bucket or {}).items():
+                if self._tick_of.get(key) != tick:
+                    continue  # Cancelled or rescheduled by an earlier callback.
+                del self._tick_of[key]
+                try:
+                    callback(key)
+                except Exception as ex:
+                    _logger.exception("Timer wheel callback failed: %s", ex)
+        self._armed_tick = None
+        while self._ticks and (self._ticks[0] not in self._buckets):
+            heapq.heappop(self._ticks)
+        if self._ticks:
+            self._arm(self._ticks[0])
+
+
+class LivenessTimer:
+    """
+    Liveness deadline of one consumer, checked on the node's shared timer wheel.
+    Restarting the timer only moves the deadline; the wheel entry is left where it is and, when it fires early,
+    is moved to the current deadline. So a consumer that keeps receiving touches the wheel about once per timeout
+    rather than once per message.
+    """
+
+    def __init__(self, wheel: TimerWheel[Any], on_expiry: Callable[[], None]) -> None:
+        self._wheel = wheel
+        self._on_expiry = on_expiry
+        self._deadline = math.inf
+        self._scheduled: float | None = None  # Deadline the wheel entry is scheduled for, if any.
+
+    def start(self, timeout: float) -> None:
+        """Expire after ``timeout`` seconds unless stopped or restarted; non-finite timeouts never expire."""
+        if not math.isfinite(timeout):
+            self._deadline = math.inf
+            return
+        self._deadline = self._wheel.loop.time() + timeout
+        if (self._scheduled is None) or (self._deadline < self._scheduled):
+            self._scheduled = self._deadline
+            self._wheel.schedule(self, self._deadline, LivenessTimer._fire)
+
+    def stop(self) -> None:
+        self._deadline = math.inf
+
+    def close(self) -> None:
+        self._deadline = math.inf
+        self._scheduled = None
+        self._wheel.cancel(self)
+
+    def _fire(self) -> None:
+        scheduled, self._scheduled = self._scheduled, None
+        assert scheduled is not None
+        if self._deadline > scheduled:  # Restarted or stopped since the entry was scheduled.
+            if math.isfinite(self._deadline):
+                self._scheduled = self._deadline
+                self._wheel.schedule(self, self._deadline, LivenessTimer._fire)
+            return
+        self._deadline = math.inf
+        self._on_expiry()
+
+
+class DeliveryQueue(Generic[T]):
+    """
+    Unbounded FIFO read by at most one consumer at a time; replaces asyncio.Queue on the receive path.
+    A waiting consumer is woken by resolving its future, and its liveness timeout is a :class:`LivenessTimer`,
+    so no task or timer handle is created per message or per wait.
+    """
+
+    def __init__(self, wheel: TimerWheel[Any]) -> None:
+        self._items: deque[T] = deque()
+        self._waiter: asyncio.Future[None] | None = None
+        self._loop = wheel.loop
+        self._liveness = LivenessTimer(wheel, self.wake)
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def put_nowait(self, item: T) -> None:
+        self._items.append(item)
+        if self._waiter is not None:
+            self.wake()
+
+    def get_nowait(self) -> T:
+        if not self._items:
+            raise asyncio.QueueEmpty
+        return self._items.popleft()
+
+    def drop_oldest(self, kind: type) -> bool:
+        """Remove the oldest item of the given type, leaving the others in place; False if there is none."""
+        for index, item in enumerate(self._items):
+            if isinstance(item, kind):
+                del self._items[index]
+                return True
+        return False
+
+    async def get(self, timeout: float = math.inf) -> T:
+        """Raises asyncio.TimeoutError if nothing arrives within ``timeout``; non-finite timeouts wait forever."""
+        if not self._items:
+            if self._waiter is not None:
+                raise RuntimeError("The queue is already awaited by another consumer")
+            self._waiter = self._loop.create_future()
+            self._liveness.start(timeout)
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+                self._liveness.stop()
+            if not self._items:
+                raise asyncio.TimeoutError
+        return self._items.popleft()
+
+    def wake(self) -> None:
+        """Resume the waiting consumer, if any, even if the queue is still empty."""
+        if (self._waiter is not None) and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def close(self) -> None:
+        self._liveness.close()
+
+
+class FanoutRing(Generic[T]):
+    """
+    Append-only arrival queue shared by the subscribers of one root, each reading it through its own
+    :class:`FanoutCursor`. An item is stored once no matter how many cursors read it and is released once all of them
+    have passed it. A cursor that falls behind by more than its capacity skips the oldest items.
+    """
+
+    def __init__(self, wheel: TimerWheel[Any]) -> None:
+        self.wheel = wheel
+        self._items: deque[T] = deque()
+        self._unread: deque[int] = deque()  # Number of cursors yet to pass each item; nondecreasing.
+        self.head = 0  # Position of the oldest retained item.
+        self.tail = 0  # Position of the next item to be appended.
+        self.cursors: list[FanoutCursor[T]] = []
+        self.listeners: dict[FanoutCursor[T], Callable[[], None]] = {}  # Invoked on every append.
+        self._limit = math.inf  # Greatest capacity of the cursors; older items are of no use to anyone.
+
+    def append(self, item: T) -> bool:
+        """Returns False if there are no readers, in which case the item is discarded."""
+        if not self.cursors:
+            return False
+        self._items.append(item)
+        self._unread.append(len(self.cursors))
+        self.tail += 1
+        if len(self._items) > self._limit:
+            for cursor in self.cursors:
+                cursor.trim()
+        if self.listeners:
+            for listener in tuple(self.listeners.values()):
+                listener()
+        return True
+
+    def take(self, position: int) -> T:
+        index = position - self.head
+        item = self._items[index]
+        self._unread[index] -= 1
+        if index == 0:
+            self._collect()
+        return item
+
+    def release(self, start: int, stop: int) -> None:
+        """Mark the items in [start, stop) as passed by one cursor."""
+        unread, head = self._unread, self.head
+        for position in range(start, stop):
+            unread[position - head] -= 1
+        self._collect()
+
+    def _collect(self) -> None:
+        while self._unread and (self._unread[0] == 0):
+            self._unread.popleft()
+            self._items.popleft()
+            self.head += 1
+
+    def attach(self, cursor: FanoutCursor[T]) -> None:
+        self.cursors.append(cursor)
+        self._update_limit()
+
+    def detach(self, cursor: FanoutCursor[T]) -> None:
+        self.cursors.remove(cursor)
+        self.listeners.pop(cursor, None)
+        self._update_limit()
+
+    def _update_limit(self) -> None:
+        caps = [c.capacity for c in self.cursors]
+        self._limit = math.inf if (not caps) or (None in caps) else max(c for c in caps if c is not None)
+
+
+class FanoutCursor(Generic[T]):
+    """
+    Reading position of one consumer in a :class:`FanoutRing`; offers the same interface as :class:`DeliveryQueue`.
+    Items put directly into the cursor are seen only by its consumer, after the ring items that preceded them;
+    unlike ring appends, they do not invoke the listener.
+    """
+
+    def __init__(self, ring: FanoutRing[T], capacity: int | None) -> None:
+        self.ring = ring
+        self.capacity = capacity
+        self.position = ring.tail
+        self.dropped = 0  # Ring items skipped because the consumer fell behind by more than the capacity.
+        self._local: deque[tuple[int, T]] = deque()  # (ring position the item follows, item)
+        self._waiter: asyncio.Future[None] | None = None
+        self._loop = ring.wheel.loop
+        self._liveness = LivenessTimer(ring.wheel, self.wake)
+        self._attached = True
+        ring.attach(self)
+
+    @property
+    def end(self) -> int:
+        """Ring position past the last item readable by this cursor."""
+        return self.ring.tail if self._attached else self.position
+
+    def qsize(self) -> int:
+        lag = self.end - self.position
+        if self.capacity is not None:
+            lag = min(lag, self.capacity)
+        return lag + len(self._local)
+
+    def empty(self) -> bool:
+        return (self.position == self.end) and not self._local
+
+    def put_nowait(self, item: T) -> None:
+        self._local.append((self.end, item))
+        self.wake()
+
+    def get_nowait(self) -> T:
+        if self._local and (self._local[0][0] <= self.position):
+            return self._local.popleft()[1]
+        if self.position == self.end:
+            raise asyncio.QueueEmpty
+        self.trim()
+        item = self.ring.take(self.position)
+        self.position += 1
+        return item
+
+    async def get(self, timeout: float = math.inf) -> T:
+        """Raises asyncio.TimeoutError if nothing arrives within ``timeout``; non-finite timeouts wait forever."""
+        if self.empty():
+            if self._waiter is not None:
+                raise RuntimeError("The queue is already awaited by another consumer")
+            self._waiter = self._loop.create_future()
+            self.listen(self.wake)
+            self._liveness.start(timeout)
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+                self.listen(None)
+                self._liveness.stop()
+            if self.empty():
+                raise asyncio.TimeoutError
+        return self.get_nowait()
+
+    def wake(self) -> None:
+        """Resume the waiting consumer, if any, even if the queue is still empty."""
+        if (self._waiter is not None) and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def listen(self, listener: Callable[[], None] | None) -> None:
+        """Invoke the listener whenever an item becomes available to this cursor; None to stop."""
+        if listener is None:
+            self.ring.listeners.pop(self, None)
+        elif self._attached:
+            self.ring.listeners[self] = listener
+
+    def trim(self) -> None:
+        """Skip the oldest ring items if the consumer has fallen behind by more than the capacity."""
+        if (self.capacity is not None) and ((self.ring.tail - self.position) > self.capacity):
+            start, self.position = self.position, self.ring.tail - self.capacity
+            self.dropped += self.position - start
+            self.ring.release(start, self.position)
+
+    def close(self) -> None:
+        """Stop reading the ring; the items put directly into the cursor remain readable."""
+        self._liveness.close()
+        if self._attached:
+            self._attached = False
+            self.ring.release(self.position, self.ring.tail)
+            self.ring.detach(self)
+            self.position = self.ring.tail
+
+
 @dataclass(frozen=True)
 class _TopicFlyweight(Topic):
     """Short-lived topic view for unknown gossip."""
@@ -375,23 +982,86 @@ class _MonitorHandle(Closable):
         self._node = None
 
 
+class AckScheduler:
+    """
+    Retransmission timing of all pending reliable publications and responses of a node.
+    A sender waits out its ACK window in :meth:`wait` and is resumed either by its tracker once the ACKs are in
+    or when the window expires. Windows are kept in one heap served by a single event loop timer,
+    so a transfer in flight costs no timer handle or helper task of its own.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self._heap: list[tuple[float, int, asyncio.Future[None]]] = []  # (loop time, sequence, waiter)
+        self._sequence = 0
+        self._armed_at = math.inf
+        self._handle: asyncio.TimerHandle | None = None
+
+    def __len__(self) -> int:
+        """Number of windows in the heap, including those whose waiters have already been resumed."""
+        return len(self._heap)
+
+    async def wait(self, tracker: PublishTracker | RespondTracker, deadline_ns: int) -> None:
+        """Return once the tracker is done or the deadline (in the Instant time base) has passed."""
+        delay = (deadline_ns - Instant.now().ns) * 1e-9
+        if tracker.done or (delay <= 0.0):
+            return
+        waiter = self.loop.create_future()
+        when = self.loop.time() + delay
+        self._sequence += 1
+        heapq.heappush(self._heap, (when, self._sequence, waiter))
+        if when < self._armed_at:
+            self._arm(when)
+        tracker.waiter = waiter
+        try:
+            await waiter
+        finally:
+            tracker.waiter = None
+
+    def _arm(self, when: float) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+        self._armed_at = when
+        self._handle = self.loop.call_at(when, self._fire)
+
+    def _fire(self) -> None:
+        self._handle = None
+        self._armed_at = math.inf
+        heap, now = self._heap, self.loop.time()
+        while heap and ((heap[0][0] <= now) or heap[0][2].done()):
+            waiter = heapq.heappop(heap)[2]
+            if not waiter.done():
+                waiter.set_result(None)
+        if heap:
+            self._arm(heap[0][0])
+
+
 @dataclass
 class PublishTracker:
     """Tracks a pending reliable publication awaiting ACKs."""
 
     tag: int
-    ack_event: asyncio.Event
     acknowledged: bool = False
     ack_timeout: float = ACK_BASELINE_DEFAULT_TIMEOUT
     compromised: bool = False
     remaining: set[int] = field(default_factory=set)
     associations: list[Association] = field(default_factory=list)
+    waiter: asyncio.Future[None] | None = None  # Set while the publisher waits in the AckScheduler.
+    sent_ns: int = 0  # When the first transmission went out; the ACKs to it are RTT samples.
+    retransmitted: bool = False
+    window_ticket: int | None = None  # Holds a slot of the publisher's InFlightWindow until released.
+    message: bytes | None = None  # Serialized for the (lage, evictions) in message_key; reused by retransmissions.
+    message_key: tuple[int, int] = (0, 0)
+
+    @property
+    def done(self) -> bool:
+        return self.acknowledged and not self.remaining
 
     def on_ack(self, remote_id: int, positive: bool) -> None:
         self.remaining.discard(remote_id)
         self.acknowledged = self.acknowledged or positive
-        if not self.remaining and self.acknowledged:
-            self.ack_event.set()
+        if self.done and (self.waiter is not None) and not self.waiter.done():
+            self.waiter.set_result(None)
 
 
 # =====================================================================================================================
@@ -406,7 +1076,9 @@ class TopicImpl(Topic):
         self._name = name
         self._topic_hash = rapidhash(name)
         self._evictions = evictions
-        self.ts_origin = now
+        self._ts_origin = now
+        self._lage_span = (0.0, 0.0)  # [lo, hi) of (now - ts_origin) over which the cached lage holds.
+        self._lage = -1
         self.ts_animated = now
         self._pub_tag_baseline = int.from_bytes(os.urandom(8), "little")
         self._pub_seqno = 0
@@ -414,15 +1086,22 @@ class TopicImpl(Topic):
         self.pub_writer: SubjectWriter | None = None
         self.sub_listener: Closable | None = None
         self.couplings: list[Coupling] = []
+        self._delivery_plan: DeliveryPlan | None = None
         self.is_implicit = True
         self.associations: dict[int, Association] = {}
         self.dedup: dict[int, DedupState] = {}
         self.publish_futures: dict[int, PublishTracker] = {}
         self.request_futures: dict[int, ResponseStreamImpl] = {}  # tag -> ResponseStreamImpl
-        self.gossip_task: asyncio.Task[None] | None = None
-        self.gossip_deadline: float | None = None
-        self.gossip_task_is_periodic = False
+        self.gossip_deadline: float | None = None  # None if no gossip is scheduled.
+        self.gossip_ticket = 0  # Identifies the live entry in the node's gossip heap; older entries are stale.
+        self.gossip_is_periodic = False
         self.gossip_counter = 0
+        # Serialized gossip: the header is patched in place when its variable fields change, and the immutable
+        # snapshot handed to the transport is reused until then.
+        self._gossip_buf = bytearray(HEADER_SIZE) + name.encode("utf-8")
+        self._gossip_lage: int | None = None
+        self._gossip_evictions: int | None = None
+        self._gossip_message = b""
 
     # -- Topic ABC --
     @property
@@ -447,18 +1126,51 @@ class TopicImpl(Topic):
         return match_pattern(pattern, self._name)
 
     # -- Internal --
+    @property
+    def ts_origin(self) -> float:
+        return self._ts_origin
+
+    @ts_origin.setter
+    def ts_origin(self, value: float) -> None:
+        self._ts_origin = value
+        self._lage_span = (0.0, 0.0)
+
     def lage(self, now: float) -> int:
-        return log_age(self.ts_origin, now)
+        """The log-age only changes at power-of-two age boundaries, so it is cached until the next one."""
+        age = now - self._ts_origin
+        lo, hi = self._lage_span
+        if lo <= age < hi:
+            return self._lage
+        lage = log_age(self._ts_origin, now)
+        self._lage = lage
+        self._lage_span = (-math.inf, 1.0) if lage < 0 else (float(1 << lage), float(2 << lage))
+        return lage
 
     def merge_lage(self, now: float, remote_lage: int) -> None:
         """Shift ts_origin backward if the remote claims an older origin."""
-        self.ts_origin = min(self.ts_origin, now - lage_to_seconds(remote_lage))
+        origin = now - lage_to_seconds(remote_lage)
+        if origin < self._ts_origin:
+            self.ts_origin = origin
 
     def animate(self, ts: float) -> None:
         self.ts_animated = ts
         if self.is_implicit:
             self._node.touch_implicit_topic(self)
 
+    def gossip_message(self, now: float) -> bytes:
+        lage = self.lage(now)
+        if (lage != self._gossip_lage) or (self._evictions != self._gossip_evictions):
+            self._gossip_lage = lage
+            self._gossip_evictions = self._evictions
+            GossipHeader(
+                topic_log_age=lage,
+                topic_hash=self._topic_hash,
+                topic_evictions=self._evictions,
+                name_len=len(self._gossip_buf) - HEADER_SIZE,
+            ).pack_into(self._gossip_buf)
+            self._gossip_message = bytes(self._gossip_buf)
+        return self._gossip_message
+
     def next_tag(self) -> int:
         tag = (self._pub_tag_baseline + self._pub_seqno) & ((1 << 64) - 1)
         self._pub_seqno += 1
@@ -501,6 +1213,22 @@ class TopicImpl(Topic):
             self._node.release_subject_listener(self, sid)
             self.sub_listener = None
 
+    def delivery_plan(self) -> DeliveryPlan:
+        plan = self._delivery_plan
+        if plan is None:
+            subscribers: list[Any] = []
+            rings: list[FanoutRing[Any]] = []
+            for coupling in self.couplings:
+                root = coupling.root
+                subscribers += [sub for sub in root.subscribers if not sub.shared]
+                if (root.ring is not None) and root.ring.cursors:
+                    rings.append(root.ring)
+            plan = self._delivery_plan = DeliveryPlan(tuple(subscribers), tuple(rings))
+        return plan
+
+    def invalidate_delivery_plan(self) -> None:
+        self._delivery_plan = None
+
     def compute_is_implicit(self) -> bool:
         has_verbatim_sub = any(not c.root.is_pattern for c in self.couplings)
         return self.pub_count == 0 and not has_verbatim_sub
@@ -533,7 +1261,17 @@ def left_wins(l_lage: int, l_hash: int, r_lage: int, r_hash: int) -> bool:
 
 
 class NodeImpl(Node):
-    def __init__(self, transport: Transport, *, home: str, namespace: str) -> None:
+    def __init__(
+        self,
+        transport: Transport,
+        *,
+        home: str,
+        namespace: str,
+        gossip_bandwidth: float | None = None,
+        timer_resolution: float | None = None,
+    ) -> None:
+        if gossip_bandwidth is not None and not (math.isfinite(gossip_bandwidth) and gossip_bandwidth > 0):
+            raise ValueError("Gossip bandwidth must be a positive finite number of bytes per second")
         self._transport = transport
         self._home = home
         self._namespace = namespace
@@ -547,13 +1285,17 @@ class NodeImpl(Node):
         self.topics_by_name: dict[str, TopicImpl] = {}
         self.topics_by_hash: dict[int, TopicImpl] = {}
         self.topics_by_subject_id: dict[int, TopicImpl] = {}  # non-pinned only
+        self.topic_index: NameIndex[TopicImpl] = NameIndex()
 
         # Subscriber roots.
         self.sub_roots_verbatim: dict[str, SubscriberRoot] = {}
         self.sub_roots_pattern: dict[str, SubscriberRoot] = {}
+        self.sub_roots_pattern_index: NameIndex[SubscriberRoot] = NameIndex()
 
         # Respond futures for reliable responses.
         self.respond_futures: dict[tuple[int, ...], RespondTracker] = {}
+        # RTT to the remotes we send reliable responses to; those publishing to us are tracked per Association.
+        self.responder_rtt: dict[int, RttEstimator] = {}
 
         # Compute broadcast and gossip shard subject IDs.
         modulus = transport.subject_id_modulus
@@ -584,6 +1326,36 @@ class NodeImpl(Node):
         self._implicit_gc_wakeup = asyncio.Event()
         self._gc_task = self.loop.create_task(self.implicit_gc_loop())
 
+        # Dedup states are dropped lazily when their remote reappears after SESSION_LIFETIME; remotes that never do
+        # are swept periodically, which bounds the dedup memory by the number of recently active publishers.
+        self._dedup_sweep_task = self.loop.create_task(self.dedup_sweep_loop())
+
+        # Gossip scheduler: one task serves all topics from heaps of (deadline, ticket, topic).
+        # Rescheduling pushes a new entry and leaves the old one behind as stale; the task is only woken up
+        # when the earliest deadline moves closer, so suppression-driven postponements cost one heap push.
+        # Periodic gossip is held back by the pacer when over budget; urgent gossip bypasses it (but is still
+        # accounted for), so that collisions are always resolved promptly.
+        self._gossip_heap_urgent: list[tuple[float, int, TopicImpl]] = []
+        self._gossip_heap_periodic: list[tuple[float, int, TopicImpl]] = []
+        self.gossip_pacer = GossipPacer(gossip_bandwidth, time.monotonic())
+        self._gossip_ticket = 0
+        self._gossip_armed_at: float | None = None  # Deadline the task is sleeping until; None if idle.
+        self._gossip_wakeup = asyncio.Event()
+        self._gossip_task = self.loop.create_task(self.gossip_loop())
+
+        # Scout responses are queued per (requester, topic) and streamed by one task within the gossip budget.
+        # A topic already queued for a requester is not queued again, which coalesces repeated/overlapping scouts.
+        self._scout_responses: dict[tuple[int, TopicImpl], Priority] = {}
+        self._scout_wakeup = asyncio.Event()
+        self._scout_task = self.loop.create_task(self.scout_response_loop())
+
+        # Reordering windows and liveness timeouts of all subscribers and response streams share one coarse timer.
+        self.timer_wheel: TimerWheel[Any] = TimerWheel(
+            self.loop, TIMER_RESOLUTION if timer_resolution is None else timer_resolution
+        )
+        # ACK windows are too short to be rounded to the wheel resolution, so they have an exact timer of their own.
+        self.ack_scheduler = AckScheduler(self.loop)
+
         _logger.info(
             "Node init home='%s' ns='%s' broadcast_sid=%d shards=%d",
             home,
@@ -656,10 +1428,26 @@ class NodeImpl(Node):
         )
         return PublisherImpl(self, topic)
 
-    def subscribe(self, name: str, *, reordering_window: float | None = None) -> Subscriber:
+    def subscribe(
+        self,
+        name: str,
+        *,
+        reordering_window: float | None = None,
+        adaptive_reordering: bool = False,
+        capacity: int | None = None,
+        overflow: Overflow = Overflow.DROP_OLDEST,
+        shared: bool = False,
+    ) -> Subscriber:
         from ._subscriber import SubscriberImpl
 
         self._raise_if_closed()
+        capacity = queue_capacity(capacity)
+        if adaptive_reordering and reordering_window is None:
+            raise ValueError("Adaptive reordering requires a reordering window")
+        if shared and reordering_window is not None:
+            raise ValueError("Shared subscriptions cannot be ordered")
+        if shared and overflow is not Overflow.DROP_OLDEST:
+            raise ValueError("Shared subscriptions only support the DROP_OLDEST overflow policy")
         resolved, pin, verbatim = resolve_name(name, self._home, self._namespace, self._remaps)
         if pin is not None and not verbatim:
             raise ValueError("Pattern names cannot be pinned")
@@ -675,9 +1463,21 @@ class NodeImpl(Node):
             if root is None:
                 root = SubscriberRoot(name=resolved, is_pattern=True, needs_scouting=True)
                 self.sub_roots_pattern[resolved] = root
+                self.sub_roots_pattern_index.add(resolved, root)
 
-        subscriber = SubscriberImpl(self, root, resolved, verbatim, reordering_window)
+        subscriber = SubscriberImpl(
+            self,
+            root,
+            resolved,
+            verbatim,
+            reordering_window,
+            capacity,
+            overflow,
+            adaptive=adaptive_reordering,
+            shared=shared,
+        )
         root.subscribers.append(subscriber)
+        root.invalidate_delivery_plans()
 
         if verbatim:
             # Ensure topic exists and couple.
@@ -686,7 +1486,7 @@ class NodeImpl(Node):
             topic.sync_implicit()
         else:
             # Pattern subscriber: couple with all existing matching topics and scout once per root.
-            for topic in list(self.topics_by_name.values()):
+            for topic in self.topic_index.match_pattern(resolved):
                 self.couple_topic_root(topic, root)
                 topic.sync_implicit()
             self._ensure_root_scouting(root)
@@ -737,11 +1537,12 @@ class NodeImpl(Node):
         topic = TopicImpl(self, name, evictions, now)
         self.topics_by_name[name] = topic
         self.topics_by_hash[topic.hash] = topic
+        self.topic_index.add(name, topic)
         self.ensure_gossip_shard(self.gossip_shard_subject_id(topic.hash))
         self.touch_implicit_topic(topic)
         self.topic_allocate(topic, evictions, now)
         # Couple with existing pattern subscriber roots.
-        for root in self.sub_roots_pattern.values():
+        for root in self.sub_roots_pattern_index.match_name(name):
             self.couple_topic_root(topic, root)
         topic.sync_listener()
         self.notify_implicit_gc()
@@ -754,23 +1555,34 @@ class NodeImpl(Node):
         return topic
 
     def topic_allocate(self, topic: TopicImpl, new_evictions: int, now: float) -> None:
-        """Iterative subject-ID allocation with collision resolution. Mirrors topic_allocate() in cy.c."""
-        # Work queue: list of (topic, new_evictions) pairs to process.
+        """
+        Iterative subject-ID allocation with collision resolution. Mirrors topic_allocate() in cy.c.
+        The eviction cascade is resolved in memory first; the transport only sees the net change of each topic
+        in the cascade, so a topic that is displaced several times opens at most one new writer and listener.
+        """
         modulus = self.transport.subject_id_modulus
-        work: list[tuple[TopicImpl, int]] = [(topic, new_evictions)]
+        origin: dict[TopicImpl, int] = {}  # Subject-ID of each affected topic before the allocation.
+        writer: dict[TopicImpl, bool] = {}  # Whether the topic is to hold a writer at its final subject-ID.
+
+        def has_writer(t: TopicImpl) -> bool:
+            return writer[t] if t in writer else (t.pub_writer is not None)
+
+        def keeps_writer(t: TopicImpl, sid: int) -> bool:
+            return (t.pub_writer is not None) and (origin[t] == sid)
+
+        work: deque[tuple[TopicImpl, int]] = deque([(topic, new_evictions)])
         while work:
-            t, ev = work.pop(0)
+            t, ev = work.popleft()
             # Remove from subject-ID index first.
             old_sid = t.subject_id(modulus)
-            if old_sid in self.topics_by_subject_id and self.topics_by_subject_id[old_sid] is t:
+            origin.setdefault(t, old_sid)
+            if self.topics_by_subject_id.get(old_sid) is t:
                 del self.topics_by_subject_id[old_sid]
 
             if ev >= EVICTIONS_PINNED_MIN:
                 # Pinned topic: no collision detection, shared subject-IDs are fine.
-                t.release_transport_handles()
                 t.set_evictions(ev)
-                t.sync_listener()
-                self.schedule_gossip_urgent(t)
+                writer[t] = keeps_writer(t, t.subject_id(modulus))
                 continue
 
             new_sid = compute_subject_id(t.hash, ev, modulus)
@@ -781,27 +1593,52 @@ class NodeImpl(Node):
 
             if collider is None:
                 # No collision, install.
-                t.release_transport_handles()
                 t.set_evictions(ev)
                 self.topics_by_subject_id[new_sid] = t
-                t.sync_listener()
-                self.schedule_gossip_urgent(t)
+                writer[t] = keeps_writer(t, new_sid)
             elif left_wins(t.lage(now), t.hash, collider.lage(now), collider.hash):
-                # Our topic wins: take the slot, evict the collider.
-                t.release_transport_handles()
+                # Our topic wins: take the slot and the collider's writer, evict the collider.
                 t.set_evictions(ev)
-                del self.topics_by_subject_id[new_sid]
                 self.topics_by_subject_id[new_sid] = t
-                if collider.pub_writer is not None:
-                    t.pub_writer = self.acquire_subject_writer(t, new_sid)
-                t.sync_listener()
-                self.schedule_gossip_urgent(t)
-                # Schedule collider for reallocation.
-                collider.release_transport_handles()
+                writer[t] = has_writer(collider) or keeps_writer(t, new_sid)
+                writer[collider] = False
                 work.append((collider, collider.evictions + 1))
             else:
                 # Our topic loses: increment evictions and retry.
                 work.append((t, ev + 1))
+        self._migrate_transport_handles(origin, writer)
+
+    def _migrate_transport_handles(self, origin: dict[TopicImpl, int], writer: dict[TopicImpl, bool]) -> None:
+        """
+        Move the transport handles of reallocated topics from their original subject-IDs to the current ones.
+        All new handles are acquired before any old ones are released, so that a shared handle changing hands
+        between topics within one cascade is never closed and reopened.
+        """
+        modulus = self.transport.subject_id_modulus
+        released: list[tuple[TopicImpl, int, bool, bool]] = []
+        for t, old_sid in origin.items():
+            sid = t.subject_id(modulus)
+            moved = sid != old_sid
+            had_writer, had_listener = t.pub_writer is not None, t.sub_listener is not None
+            want_writer, want_listener = writer[t], bool(t.couplings)
+            if want_writer and (moved or not had_writer):
+                t.pub_writer = self.acquire_subject_writer(t, sid)
+            elif not want_writer:
+                t.pub_writer = None
+            if want_listener and (moved or not had_listener):
+                t.sub_listener = self.acquire_subject_listener(t, sid)
+            elif not want_listener:
+                t.sub_listener = None
+            released.append(
+                (t, old_sid, had_writer and (moved or not want_writer), had_listener and (moved or not want_listener))
+            )
+        for t, old_sid, release_writer, release_listener in released:
+            if release_writer:
+                self.release_subject_writer(t, old_sid)
+            if release_listener:
+                self.release_subject_listener(t, old_sid)
+        for t in origin:
+            self.schedule_gossip_urgent(t)
 
     def sync_topic_lifecycle(self, topic: TopicImpl) -> None:
         implicit = topic.compute_is_implicit()
@@ -813,14 +1650,21 @@ class NodeImpl(Node):
             else:
                 self.discard_implicit_topic(topic)
                 self.schedule_gossip_urgent(topic)
-        elif (not implicit) and (topic.gossip_task is None):
+        elif (not implicit) and (topic.gossip_deadline is None):
             self.schedule_gossip(topic)
         topic.sync_listener()
         self.notify_implicit_gc()
 
     def touch_implicit_topic(self, topic: TopicImpl) -> None:
-        self._implicit_topics[topic] = None
-        self._implicit_topics.move_to_end(topic, last=False)
+        # Touching only postpones the expiry of a topic that is already tracked, which the GC loop discovers on its
+        # own when it wakes up; it needs to be notified only of new topics.
+        implicit = self._implicit_topics
+        if topic in implicit:
+            if next(iter(implicit)) is not topic:
+                implicit.move_to_end(topic, last=False)
+            return
+        implicit[topic] = None
+        implicit.move_to_end(topic, last=False)
         self.notify_implicit_gc()
 
     def discard_implicit_topic(self, topic: TopicImpl) -> None:
@@ -834,6 +1678,8 @@ class NodeImpl(Node):
         from ._subscriber import SubscriberImpl
 
         topic.couplings = [c for c in topic.couplings if c.root is not root]
+        topic.invalidate_delivery_plan()
+        root.topics.pop(topic, None)
         for sub in root.subscribers:
             if isinstance(sub, SubscriberImpl):
                 sub.forget_topic_reordering(topic.hash, silenced=silenced)
@@ -861,10 +1707,7 @@ class NodeImpl(Node):
 
     @staticmethod
     def prepare_publish_tracker(topic: TopicImpl, tag: int) -> PublishTracker:
-        tracker = PublishTracker(
-            tag=tag,
-            ack_event=asyncio.Event(),
-        )
+        tracker = PublishTracker(tag=tag)
         tracker.ack_timeout = ACK_BASELINE_DEFAULT_TIMEOUT
         for assoc in sorted(topic.associations.values(), key=lambda x: x.remote_id):
             if assoc.slack < ASSOC_SLACK_LIMIT:
@@ -876,12 +1719,13 @@ class NodeImpl(Node):
     @staticmethod
     def couple_topic_root(topic: TopicImpl, root: SubscriberRoot) -> None:
         """Create a coupling between a topic and a subscriber root if not already coupled."""
-        for c in topic.couplings:
-            if c.root is root:
-                return  # already coupled
+        if topic in root.topics:
+            return  # already coupled
         subs = match_pattern(root.name, topic.name) if root.is_pattern else ([] if root.name == topic.name else None)
         if subs is not None:
             topic.couplings.append(Coupling(root=root, substitutions=subs))
+            topic.invalidate_delivery_plan()
+            root.topics[topic] = None
             _logger.debug("Coupled '%s' <-> root '%s'", topic.name, root.name)
 
     # -- Gossip --
@@ -949,22 +1793,36 @@ class NodeImpl(Node):
 
     def schedule_gossip(self, topic: TopicImpl) -> None:
         """Start periodic gossip for an explicit topic."""
-        if topic.gossip_task is not None:
+        if topic.gossip_deadline is not None:
             return  # already scheduled
         self._reschedule_gossip_periodic(topic, suppressed=False)
 
     @staticmethod
     def _cancel_gossip(topic: TopicImpl) -> None:
-        if topic.gossip_task is not None:
-            topic.gossip_task.cancel()
-            topic.gossip_task = None
-        topic.gossip_deadline = None
+        topic.gossip_deadline = None  # The heap entry, if any, becomes stale and is skipped when popped.
 
-    def _schedule_gossip_task(self, topic: TopicImpl, deadline: float, *, periodic: bool) -> None:
-        self._cancel_gossip(topic)
-        topic.gossip_task_is_periodic = periodic
+    def _schedule_gossip_at(self, topic: TopicImpl, deadline: float, *, periodic: bool) -> None:
+        self._gossip_ticket += 1
+        topic.gossip_ticket = self._gossip_ticket
+        topic.gossip_is_periodic = periodic
         topic.gossip_deadline = deadline
-        topic.gossip_task = self.loop.create_task(self._gossip_wait(topic, deadline))
+        if (len(self._gossip_heap_urgent) + len(self._gossip_heap_periodic)) > (2 * len(self.topics_by_name) + 64):
+            for heap in (self._gossip_heap_urgent, self._gossip_heap_periodic):
+                heap[:] = [e for e in heap if self._gossip_entry_is_live(e)]
+                heapq.heapify(heap)
+        heap = self._gossip_heap_periodic if periodic else self._gossip_heap_urgent
+        heapq.heappush(heap, (deadline, self._gossip_ticket, topic))
+        if (self._gossip_armed_at is None) or (deadline < self._gossip_armed_at):
+            self._gossip_wakeup.set()
+
+    @staticmethod
+    def _gossip_entry_is_live(entry: tuple[float, int, TopicImpl]) -> bool:
+        _, ticket, topic = entry
+        return (topic.gossip_deadline is not None) and (topic.gossip_ticket == ticket)
+
+    @staticmethod
+    def _gossip_cost(topic: TopicImpl) -> int:
+        return HEADER_SIZE + len(topic.name)
 
     def _reschedule_gossip_periodic(self, topic: TopicImpl, *, suppressed: bool) -> None:
         if topic.is_implicit:
@@ -980,67 +1838,89 @@ class NodeImpl(Node):
             if topic.gossip_counter < GOSSIP_BROADCAST_RATIO:
                 delay_min /= 16
         delay = random.uniform(max(0.0, delay_min), max(delay_min, delay_max))
-        self._schedule_gossip_task(topic, time.monotonic() + delay, periodic=True)
+        self._schedule_gossip_at(topic, time.monotonic() + delay, periodic=True)
 
     def schedule_gossip_urgent(self, topic: TopicImpl) -> None:
         """Schedule an urgent gossip, preserving an earlier pending deadline when possible."""
         at = time.monotonic() + (random.random() * GOSSIP_URGENT_DELAY_MAX)
-        if (topic.gossip_task is None) or (topic.gossip_deadline is None) or (at < topic.gossip_deadline):
-            self._schedule_gossip_task(topic, at, periodic=False)
-        else:
-            topic.gossip_task_is_periodic = False
+        if (topic.gossip_deadline is None) or (at < topic.gossip_deadline):
+            self._schedule_gossip_at(topic, at, periodic=False)
+        elif topic.gossip_is_periodic:
+            self._schedule_gossip_at(topic, topic.gossip_deadline, periodic=False)  # Keep the earlier deadline.
+
+    def _gossip_head(self, heap: list[tuple[float, int, TopicImpl]]) -> tuple[float, int, TopicImpl] | None:
+        while heap and not self._gossip_entry_is_live(heap[0]):
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def _pop_due_gossip(self, now: float) -> TopicImpl | None:
+        """
+        Unschedule and return the topic whose gossip is due now, if any; urgent gossip first.
+        Periodic gossip is only returned if the pacer admits it.
+        """
+        head = self._gossip_head(self._gossip_heap_urgent)
+        if (head is not None) and (head[0] <= now):
+            topic = heapq.heappop(self._gossip_heap_urgent)[2]
+            self.gossip_pacer.consume(self._gossip_cost(topic), now, force=True)
+            topic.gossip_deadline = None
+            return topic
+        head = self._gossip_head(self._gossip_heap_periodic)
+        if (head is not None) and (head[0] <= now) and self.gossip_pacer.consume(self._gossip_cost(head[2]), now):
+            topic = heapq.heappop(self._gossip_heap_periodic)[2]
+            topic.gossip_deadline = None
+            return topic
+        return None
 
-    async def _gossip_wait(self, topic: TopicImpl, deadline: float) -> None:
+    def _next_gossip_delay(self, now: float) -> float | None:
+        delays: list[float] = []
+        head = self._gossip_head(self._gossip_heap_urgent)
+        if head is not None:
+            delays.append(head[0] - now)
+        head = self._gossip_head(self._gossip_heap_periodic)
+        if head is not None:
+            delays.append(max(head[0] - now, self.gossip_pacer.delay(self._gossip_cost(head[2]), now)))
+        return max(0.0, min(delays)) if delays else None
+
+    async def gossip_loop(self) -> None:
         try:
-            await asyncio.sleep(max(0.0, deadline - time.monotonic()))
+            while not self._closed:
+                self._gossip_wakeup.clear()
+                now = time.monotonic()
+                topic = self._pop_due_gossip(now)
+                if topic is not None:
+                    if topic.gossip_is_periodic:
+                        broadcast = self._gossip_event_periodic(topic)
+                    else:
+                        broadcast = self._gossip_event_urgent(topic)
+                    # Not awaited, so that a stalled writer does not hold up the gossip of the other topics.
+                    self._spawn_detached(self.send_gossip(topic, broadcast=broadcast), "Gossip")
+                    continue
+                delay = self._next_gossip_delay(now)
+                self._gossip_armed_at = None if delay is None else (now + delay)
+                try:
+                    await asyncio.wait_for(self._gossip_wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
         except asyncio.CancelledError:
-            return
-        if topic.gossip_task is not asyncio.current_task():
-            return
-        topic.gossip_task = None
-        topic.gossip_deadline = None
-        if self._closed:
-            return
-        if topic.gossip_task_is_periodic:
-            await self._gossip_event_periodic(topic)
-        else:
-            await self._gossip_event_urgent(topic)
+            pass
 
-    async def _gossip_event_urgent(self, topic: TopicImpl) -> None:
+    def _gossip_event_urgent(self, topic: TopicImpl) -> bool:
+        """Reschedule the topic after its urgent gossip, which is always broadcast; returns True."""
         self._reschedule_gossip_periodic(topic, suppressed=False)
         topic.gossip_counter = 0
-        await self.send_gossip(topic, broadcast=True)
+        return True
 
-    async def _gossip_event_periodic(self, topic: TopicImpl) -> None:
+    def _gossip_event_periodic(self, topic: TopicImpl) -> bool:
+        """Reschedule the topic after its periodic gossip; returns True if this one is to be broadcast."""
         self._reschedule_gossip_periodic(topic, suppressed=False)
         broadcast = (topic.gossip_counter < GOSSIP_BROADCAST_RATIO) or (
             (topic.gossip_counter % GOSSIP_BROADCAST_RATIO) == 0
         )
         topic.gossip_counter += 1
-        await self.send_gossip(topic, broadcast=broadcast)
+        return broadcast
 
     async def send_gossip(self, topic: TopicImpl, *, broadcast: bool = False) -> None:
-        now = time.monotonic()
-        lage = topic.lage(now)
-        name_bytes = topic.name.encode("utf-8")
-        hdr = GossipHeader(
-            topic_log_age=lage,
-            topic_hash=topic.hash,
-            topic_evictions=topic.evictions,
-            name_len=len(name_bytes),
-        )
-        payload = hdr.serialize() + name_bytes
-        deadline = Instant.now() + 1.0
-        try:
-            if broadcast:
-                await self.broadcast_writer(deadline, Priority.NOMINAL, payload)
-            else:
-                shard_sid = self.gossip_shard_subject_id(topic.hash)
-                writer = self.ensure_gossip_shard(shard_sid)
-                await writer(deadline, Priority.NOMINAL, payload)
-            _logger.debug("Gossip sent '%s' broadcast=%s", topic.name, broadcast)
-        except (SendError, OSError) as e:
-            _logger.warning("Gossip send failed for '%s': %s", topic.name, e)
+        await self._emit_gossip(topic, GossipScope.BROADCAST if broadcast else GossipScope.SHARDED)
 
     async def send_gossip_unicast(
         self,
@@ -1048,21 +1928,28 @@ class NodeImpl(Node):
         remote_id: int,
         priority: Priority = Priority.NOMINAL,
     ) -> None:
-        now = time.monotonic()
-        lage = topic.lage(now)
-        name_bytes = topic.name.encode("utf-8")
-        hdr = GossipHeader(
-            topic_log_age=lage,
-            topic_hash=topic.hash,
-            topic_evictions=topic.evictions,
-            name_len=len(name_bytes),
-        )
-        payload = hdr.serialize() + name_bytes
+        await self._emit_gossip(topic, GossipScope.UNICAST, remote_id=remote_id, priority=priority)
+
+    async def _emit_gossip(
+        self,
+        topic: TopicImpl,
+        scope: GossipScope,
+        *,
+        remote_id: int = 0,
+        priority: Priority = Priority.NOMINAL,
+    ) -> None:
+        message = topic.gossip_message(time.monotonic())
         deadline = Instant.now() + 1.0
         try:
-            await self.transport.unicast(deadline, priority, remote_id, payload)
+            if scope == GossipScope.UNICAST:
+                await self.transport.unicast(deadline, priority, remote_id, message)
+            elif scope == GossipScope.BROADCAST:
+                await self.broadcast_writer(deadline, priority, message)
+            else:
+                await self.ensure_gossip_shard(self.gossip_shard_subject_id(topic.hash))(deadline, priority, message)
+            _logger.debug("Gossip sent '%s' scope=%s", topic.name, scope.name)
         except (SendError, OSError) as e:
-            _logger.warning("Gossip unicast send failed for '%s': %s", topic.name, e)
+            _logger.warning("Gossip %s send failed for '%s': %s", scope.name.lower(), topic.name, e)
 
     # -- Scout --
 
@@ -1107,7 +1994,7 @@ class NodeImpl(Node):
     def dispatch_arrival(self, arrival: TransportArrival, *, subject_id: int | None, unicast: bool) -> None:
         if self._closed:
             return  # Drop late arrivals after close instead of mutating state / spawning sends.
-        msg = arrival.message
+        msg = memoryview(arrival.message)  # The header and the payload are sliced from it without copying.
         if len(msg) < HEADER_SIZE:
             _logger.debug("Drop short msg len=%d", len(msg))
             return
@@ -1144,7 +2031,7 @@ class NodeImpl(Node):
         self,
         arrival: TransportArrival,
         hdr: MsgBeHeader | MsgRelHeader,
-        payload: bytes,
+        payload: bytes | memoryview,
         *,
         subject_id: int | None,
         unicast: bool,
@@ -1170,7 +2057,9 @@ class NodeImpl(Node):
             _logger.debug("MSG drop unknown hash=%016x", hdr.topic_hash)
 
         has_subscribers = (topic is not None) and bool(topic.couplings)
-        if reliable and (accepted or (unicast and not has_subscribers)):
+        if reliable and (
+            accepted or (unicast and not has_subscribers) or ((topic is not None) and self.backpressured(topic))
+        ):
             self.send_msg_ack(arrival.remote_id, hdr.topic_hash, hdr.tag, arrival.timestamp, arrival.priority, accepted)
 
     def accept_message(
@@ -1178,7 +2067,7 @@ class NodeImpl(Node):
         topic: TopicImpl,
         arrival: TransportArrival,
         tag: int,
-        payload: bytes,
+        payload: bytes | memoryview,
         reliable: bool,
     ) -> bool:
         topic.animate(arrival.timestamp.s)
@@ -1203,40 +2092,39 @@ class NodeImpl(Node):
                 _logger.debug("MSG dedup drop hash=%016x tag=%d", topic.hash, tag)
                 return True
 
-        from ._subscriber import BreadcrumbImpl
-
-        breadcrumb = BreadcrumbImpl(
-            node=self,
-            remote_id=arrival.remote_id,
-            topic=topic,
-            message_tag=tag,
-            initial_priority=arrival.priority,
-        )
-        return self.deliver_to_subscribers(topic, arrival, breadcrumb, payload, tag)
+        if self.deliver_to_subscribers(topic, arrival, payload, tag):
+            return True
+        if reliable and self.backpressured(topic):
+            topic.dedup[arrival.remote_id].forget(tag)  # NACK'd for lack of space; a retransmission may fit later.
+        return False
 
-    @staticmethod
     def deliver_to_subscribers(
+        self,
         topic: TopicImpl,
         arrival: TransportArrival,
-        breadcrumb: Breadcrumb,
-        payload: bytes,
+        payload: bytes | memoryview,
         tag: int,
     ) -> bool:
-        from ._api import Arrival
-        from ._subscriber import SubscriberImpl
+        from ._api import _deferred_arrival
+        from ._subscriber import BreadcrumbImpl
 
-        arr = Arrival(
-            timestamp=arrival.timestamp,
-            breadcrumb=breadcrumb,
-            message=payload,
+        # One arrival is shared by all subscribers; its breadcrumb is only built if someone responds.
+        arr = _deferred_arrival(
+            arrival.timestamp, payload, BreadcrumbImpl, self, arrival.remote_id, topic, tag, arrival.priority
         )
+        plan = topic.delivery_plan()
         accepted = False
-        for coupling in topic.couplings:
-            for sub in coupling.root.subscribers:
-                if isinstance(sub, SubscriberImpl) and not sub.closed:
-                    accepted = sub.deliver(arr, tag, arrival.remote_id) or accepted
+        for sub in plan.subscribers:
+            accepted = sub.deliver(arr, tag, arrival.remote_id, topic.hash) or accepted
+        for ring in plan.rings:
+            accepted = ring.append(arr) or accepted
         return accepted
 
+    @staticmethod
+    def backpressured(topic: TopicImpl) -> bool:
+        """True if a subscriber of the topic has rejected a message because its queue is full."""
+        return any(sub.rejecting for sub in topic.delivery_plan().subscribers)  # Shared ones never reject.
+
     def send_msg_ack(
         self,
         remote_id: int,
@@ -1271,13 +2159,18 @@ class NodeImpl(Node):
         positive = isinstance(hdr, MsgAckHeader)
         remote_id = arrival.remote_id
 
+        tracker = topic.publish_futures.get(hdr.tag)
         assoc = topic.associations.get(remote_id)
+        fresh = assoc is None
         if assoc is None:
             if not positive:
                 return
             assoc = Association(remote_id=remote_id, last_seen=arrival.timestamp.s)
             topic.associations[remote_id] = assoc
         assoc.last_seen = arrival.timestamp.s
+        # Time the first ACK from each remote to a transfer sent once; the later ones are duplicates.
+        if (tracker is not None) and (not tracker.retransmitted) and (fresh or (remote_id in tracker.remaining)):
+            assoc.rtt.sample(max(0, arrival.timestamp.ns - tracker.sent_ns) * 1e-9, arrival.timestamp.s)
         if seqno >= assoc.seqno_witness:
             assoc.slack = 0 if positive else ASSOC_SLACK_LIMIT
             assoc.seqno_witness = seqno
@@ -1286,11 +2179,10 @@ class NodeImpl(Node):
                 self.forget_association(topic, assoc)
                 return
 
-        tracker = topic.publish_futures.get(hdr.tag)
         if tracker is not None:
             tracker.on_ack(remote_id, positive)
 
-    def on_rsp(self, arrival: TransportArrival, hdr: RspBeHeader | RspRelHeader, payload: bytes) -> None:
+    def on_rsp(self, arrival: TransportArrival, hdr: RspBeHeader | RspRelHeader, payload: bytes | memoryview) -> None:
         """Handle a response message (for RPC)."""
         ack = False
         topic = self.topics_by_hash.get(hdr.topic_hash)
@@ -1319,6 +2211,11 @@ class NodeImpl(Node):
         key = (arrival.remote_id, hdr.message_tag, hdr.topic_hash, hdr.seqno, hdr.tag)
         future = self.respond_futures.get(key)
         if future is not None:
+            if not (future.done or future.retransmitted):
+                rtt = self.responder_rtt.get(arrival.remote_id)
+                if rtt is None:
+                    rtt = self.responder_rtt[arrival.remote_id] = RttEstimator()
+                rtt.sample(max(0, arrival.timestamp.ns - future.sent_ns) * 1e-9, arrival.timestamp.s)
             positive = isinstance(hdr, RspAckHeader)
             future.on_ack(positive)
 
@@ -1353,14 +2250,14 @@ class NodeImpl(Node):
         self,
         ts: float,
         hdr: GossipHeader,
-        payload: bytes,
+        payload: bytes | memoryview,
         scope: GossipScope,
     ) -> None:
         name = ""
         if hdr.name_len > 0:
             # Best-effort decode for diagnostics/monitoring; an invalid name cannot create a topic because
             # topic_subscribe_if_matching validates the character set before creating one.
-            name = payload[: hdr.name_len].decode("utf-8", errors="replace")
+            name = str(payload[: hdr.name_len], "utf-8", errors="replace")
 
         topic = self.topics_by_hash.get(hdr.topic_hash)
 
@@ -1387,6 +2284,13 @@ class NodeImpl(Node):
     ) -> None:
         topic.animate(now)
         my_lage = topic.lage(now)
+        if (
+            (scope == GossipScope.INLINE)
+            and (topic.evictions == evictions)
+            and (0 <= lage <= my_lage)
+            and ((topic.sub_listener is not None) == bool(topic.couplings))
+        ):
+            return  # Steady state, nothing to merge or sync; this is the path taken by every received message.
         if topic.evictions != evictions:
             win = my_lage > lage or (my_lage == lage and topic.evictions > evictions)
             topic.merge_lage(now, lage)
@@ -1401,7 +2305,7 @@ class NodeImpl(Node):
             suppress = (
                 (scope in {GossipScope.BROADCAST, GossipScope.SHARDED})
                 and (topic.lage(now) == lage)
-                and (topic.gossip_task_is_periodic or scope == GossipScope.BROADCAST)
+                and (topic.gossip_is_periodic or scope == GossipScope.BROADCAST)
             )
             if suppress:
                 self._reschedule_gossip_periodic(topic, suppressed=True)
@@ -1440,12 +2344,13 @@ class NodeImpl(Node):
         if rapidhash(name) != topic_hash:
             _logger.debug("Gossip hash mismatch for '%s': got %016x, expected %016x", name, topic_hash, rapidhash(name))
             return None
-        matches = [root for pattern, root in self.sub_roots_pattern.items() if match_pattern(pattern, name) is not None]
+        matches = self.sub_roots_pattern_index.match_name(name)
         if matches:
             topic = TopicImpl(self, name, evictions, now)
             topic.ts_origin = now - lage_to_seconds(lage)
             self.topics_by_name[name] = topic
             self.topics_by_hash[topic_hash] = topic
+            self.topic_index.add(name, topic)
             self.ensure_gossip_shard(self.gossip_shard_subject_id(topic.hash))
             self.touch_implicit_topic(topic)
             self.topic_allocate(topic, evictions, now)
@@ -1457,18 +2362,40 @@ class NodeImpl(Node):
             return topic
         return None
 
-    def on_scout(self, arrival: TransportArrival, hdr: ScoutHeader, payload: bytes) -> None:
+    def on_scout(self, arrival: TransportArrival, hdr: ScoutHeader, payload: bytes | memoryview) -> None:
         if hdr.pattern_len == 0 or hdr.pattern_len > TOPIC_NAME_MAX or len(payload) < hdr.pattern_len:
             return
         # Best-effort decode; an invalid pattern simply matches no local topic names.
-        pattern = payload[: hdr.pattern_len].decode("utf-8", errors="replace")
+        pattern = str(payload[: hdr.pattern_len], "utf-8", errors="replace")
         _logger.debug("Scout received pattern='%s' from %016x", pattern, arrival.remote_id)
-        for topic in list(self.topics_by_name.values()):
-            subs = match_pattern(pattern, topic.name)
-            if subs is not None:
-                self._spawn_detached(
-                    self.send_gossip_unicast(topic, arrival.remote_id, arrival.priority), "gossip unicast"
-                )
+        for topic in self.topic_index.match_pattern(pattern):
+            self._scout_responses.setdefault((arrival.remote_id, topic), arrival.priority)
+        if self._scout_responses:
+            self._scout_wakeup.set()
+
+    async def scout_response_loop(self) -> None:
+        try:
+            while not self._closed:
+                if not self._scout_responses:
+                    self._scout_wakeup.clear()
+                    await self._scout_wakeup.wait()
+                    continue
+                key = next(iter(self._scout_responses))
+                remote_id, topic = key
+                if self.topics_by_hash.get(topic.hash) is not topic:
+                    del self._scout_responses[key]  # Destroyed while queued; do not spend the budget on it.
+                    continue
+                cost = self._gossip_cost(topic)
+                if not self.gossip_pacer.consume(cost, time.monotonic()):
+                    await asyncio.sleep(self.gossip_pacer.delay(cost, time.monotonic()))
+                    continue
+                priority = self._scout_responses.pop(key)
+                try:
+                    await self.send_gossip_unicast(topic, remote_id, priority)
+                except Exception as ex:
+                    _logger.exception("Scout response to %016x failed for '%s': %s", remote_id, topic.name, ex)
+        except asyncio.CancelledError:
+            pass
 
     # -- Implicit Topic GC --
 
@@ -1493,6 +2420,35 @@ class NodeImpl(Node):
         _logger.info("GC removed implicit topic '%s'", oldest.name)
         return True
 
+    def sweep_dedup(self, now: float) -> int:
+        """Drop the dedup states of remotes idle for longer than SESSION_LIFETIME; returns how many were dropped."""
+        dropped = 0
+        for topic in self.topics_by_name.values():
+            stale = [rid for rid, dedup in topic.dedup.items() if (now - dedup.last_active) > SESSION_LIFETIME]
+            for remote_id in stale:
+                del topic.dedup[remote_id]
+            dropped += len(stale)
+        if dropped:
+            _logger.debug("Dedup sweep dropped %d stale states", dropped)
+        return dropped
+
+    def sweep_responder_rtt(self, now: float) -> int:
+        """Drop the RTT estimates of response recipients not heard from for longer than SESSION_LIFETIME."""
+        stale = [rid for rid, rtt in self.responder_rtt.items() if (now - rtt.last_sample) > SESSION_LIFETIME]
+        for remote_id in stale:
+            del self.responder_rtt[remote_id]
+        return len(stale)
+
+    async def dedup_sweep_loop(self) -> None:
+        try:
+            while not self._closed:
+                await asyncio.sleep(DEDUP_SWEEP_PERIOD)
+                now = Instant.now().s
+                self.sweep_dedup(now)
+                self.sweep_responder_rtt(now)
+        except asyncio.CancelledError:
+            pass
+
     async def implicit_gc_loop(self) -> None:
         try:
             while not self._closed:
@@ -1515,14 +2471,14 @@ class NodeImpl(Node):
         topic = self.topics_by_name.get(name)
         if topic is None:
             return
-        if topic.gossip_task is not None:
-            self._cancel_gossip(topic)
+        self._cancel_gossip(topic)
         self.discard_implicit_topic(topic)
         topic.release_transport_handles()
         while topic.couplings:
             self.decouple_topic_root(topic, topic.couplings[0].root, sync_lifecycle=False)
         self.topics_by_name.pop(name, None)
         self.topics_by_hash.pop(topic.hash, None)
+        self.topic_index.remove(name)
         sid = topic.subject_id(self.transport.subject_id_modulus)
         if self.topics_by_subject_id.get(sid) is topic:
             del self.topics_by_subject_id[sid]
@@ -1546,13 +2502,19 @@ class NodeImpl(Node):
             for sub in list(root.subscribers):
                 sub.close()
         self._gc_task.cancel()
+        self._dedup_sweep_task.cancel()
+        self._gossip_task.cancel()
+        self._gossip_heap_urgent.clear()
+        self._gossip_heap_periodic.clear()
+        self._scout_task.cancel()
+        self._scout_responses.clear()
+        self.timer_wheel.close()
         for root in list(self.sub_roots_pattern.values()):
             if root.scout_task is not None:
                 root.scout_task.cancel()
                 root.scout_task = None
         for topic in list(self.topics_by_name.values()):
-            if topic.gossip_task is not None:
-                self._cancel_gossip(topic)
+            self._cancel_gossip(topic)
             topic.release_transport_handles()
         self.broadcast_writer.close()
         self.broadcast_listener.close()
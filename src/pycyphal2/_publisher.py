@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 import logging
 import math
 from dataclasses import dataclass
 
 from ._api import DeliveryError, Instant, LivenessError, Priority, SendError
-from ._api import Publisher, Topic, ResponseStream, Response
+from ._api import Overflow, Publisher, Topic, ResponseStream, Response
 from ._header import MsgBeHeader, MsgRelHeader, RspBeHeader, RspRelHeader
 from ._node import ACK_BASELINE_DEFAULT_TIMEOUT, NodeImpl, PublishTracker, SESSION_LIFETIME, TopicImpl, ack_window
+from ._node import DeliveryQueue, queue_capacity
 from ._transport import TransportArrival
 
 _logger = logging.getLogger(__name__)
@@ -16,6 +18,9 @@ _logger = logging.getLogger(__name__)
 REQUEST_FUTURE_HISTORY = 192
 REQUEST_FUTURE_HISTORY_MASK = (1 << REQUEST_FUTURE_HISTORY) - 1
 ACK_TIMEOUT_MIN = 1e-6
+IN_FLIGHT_WINDOW_INITIAL = 16
+IN_FLIGHT_WINDOW_MAX_DEFAULT = 256
+UNICAST_RETRANSMIT_RATIO_DEFAULT = 0.25
 
 
 @dataclass
@@ -42,6 +47,12 @@ class ResponseRemoteState:
         self.seqno_acked |= mask
         return True, True
 
+    def forget(self, seqno: int) -> None:
+        """Unrecord a seqno, so that a retransmission of a response that could not be accepted is not a duplicate."""
+        dist = self.seqno_top - seqno
+        if 0 <= dist < REQUEST_FUTURE_HISTORY:
+            self.seqno_acked &= ~(1 << dist)
+
     def accepted_earlier(self, seqno: int) -> bool:
         if seqno > self.seqno_top:
             return False
@@ -49,12 +60,110 @@ class ResponseRemoteState:
         return dist < REQUEST_FUTURE_HISTORY and bool(self.seqno_acked & (1 << dist))
 
 
+class InFlightWindow:
+    """
+    Limits the number of reliable publications in flight, AIMD-style as in TCP congestion control.
+    The window grows by one per acknowledged publication up to the first loss (slow start), then by about one per
+    window's worth of them. A publication that has to be retransmitted is a loss and halves the window, at most once
+    per window of publications, so that a burst of losses from one congestion event is not counted many times over.
+    Callers that find the window full wait for a slot in FIFO order.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, limit: int | None) -> None:
+        self.loop = loop
+        self.limit = limit
+        self.window = float(IN_FLIGHT_WINDOW_INITIAL)
+        self.in_flight = 0
+        self._threshold = math.inf  # Slow start while the window is below it.
+        self._tickets = 0  # Counts the admitted publications.
+        self._recovery_ticket = 0  # Losses of publications admitted before this one were already accounted for.
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def size(self) -> int:
+        """The number of publications that may be in flight at the moment."""
+        if self.limit is None:
+            return 2**63
+        return max(1, min(self.limit, int(self.window)))
+
+    async def acquire(self, deadline: Instant) -> int:
+        """Wait for a slot; returns the ticket of the publication. Raises SendError if the deadline passes first."""
+        waiters = self._waiters
+        while waiters and waiters[0].done():
+            waiters.popleft()
+        if (not waiters) and (self.in_flight < self.size):
+            self.in_flight += 1
+            return self._issue()
+        delay = (deadline.ns - Instant.now().ns) * 1e-9
+        if delay <= 0:
+            raise SendError("Reliable publish not admitted into the in-flight window before deadline")
+        waiter = self.loop.create_future()
+        waiters.append(waiter)
+        timer = self.loop.call_later(delay, self._expire, waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()  # The slot was granted just as the caller was cancelled.
+            raise
+        finally:
+            timer.cancel()
+        return self._issue()
+
+    def set_limit(self, limit: int | None) -> None:
+        self.limit = limit
+        self._admit()
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._admit()
+
+    def on_ack(self) -> None:
+        if self.window < self._threshold:
+            self.window += 1.0
+        else:
+            self.window += 1.0 / self.window
+        if self.limit is not None:
+            self.window = min(self.window, float(self.limit))
+        self._admit()
+
+    def on_loss(self, ticket: int) -> None:
+        if ticket < self._recovery_ticket:
+            return
+        self.window = max(1.0, min(self.window, float(self.size)) * 0.5)
+        self._threshold = self.window
+        self._recovery_ticket = self._tickets
+        _logger.debug("In-flight window reduced to %.1f", self.window)
+
+    def _issue(self) -> int:
+        ticket = self._tickets
+        self._tickets += 1
+        return ticket
+
+    def _admit(self) -> None:
+        waiters = self._waiters
+        while waiters and (self.in_flight < self.size):
+            waiter = waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    @staticmethod
+    def _expire(waiter: asyncio.Future[None]) -> None:
+        if not waiter.done():
+            waiter.set_exception(SendError("Reliable publish not admitted into the in-flight window before deadline"))
+
+
 class PublisherImpl(Publisher):
     def __init__(self, node: NodeImpl, topic: TopicImpl) -> None:
         self._node = node
         self._topic = topic
         self._priority = Priority.NOMINAL
         self._ack_timeout_baseline = ACK_BASELINE_DEFAULT_TIMEOUT
+        self._window = InFlightWindow(node.loop, IN_FLIGHT_WINDOW_MAX_DEFAULT)
+        self._unicast_retransmit_ratio = UNICAST_RETRANSMIT_RATIO_DEFAULT
+        self._retransmissions_multicast = 0
+        self._retransmissions_unicast = 0
         self.closed = False
 
     @property
@@ -82,6 +191,49 @@ class PublisherImpl(Publisher):
             raise ValueError(f"ACK timeout must be less than session lifetime")
         self._ack_timeout_baseline = duration / (1 << int(self._priority))
 
+    @property
+    def max_in_flight(self) -> int | None:
+        return self._window.limit
+
+    @max_in_flight.setter
+    def max_in_flight(self, limit: int | None) -> None:
+        if limit is not None:
+            limit = int(limit)
+            if limit < 1:
+                raise ValueError("In-flight limit must be positive")
+        self._window.set_limit(limit)
+
+    @property
+    def in_flight_window(self) -> int:
+        return self._window.size
+
+    @property
+    def unicast_retransmit_ratio(self) -> float:
+        return self._unicast_retransmit_ratio
+
+    @unicast_retransmit_ratio.setter
+    def unicast_retransmit_ratio(self, ratio: float) -> None:
+        ratio = float(ratio)
+        if not (0.0 <= ratio <= 1.0):
+            raise ValueError("Unicast retransmission ratio must be within [0, 1]")
+        self._unicast_retransmit_ratio = ratio
+
+    @property
+    def retransmissions_multicast(self) -> int:
+        return self._retransmissions_multicast
+
+    @property
+    def retransmissions_unicast(self) -> int:
+        return self._retransmissions_unicast
+
+    @property
+    def round_trip_times(self) -> dict[int, tuple[float, float]]:
+        return {
+            remote_id: (assoc.rtt.srtt, assoc.rtt.rttvar)
+            for remote_id, assoc in self._topic.associations.items()
+            if assoc.rtt.samples > 0
+        }
+
     async def __call__(
         self,
         deadline: Instant,
@@ -92,28 +244,33 @@ class PublisherImpl(Publisher):
         if self.closed:
             raise SendError("Publisher closed")
 
-        tag = self._topic.next_tag()
         payload = bytes(message)
-
-        if not reliable:
-            writer = self._topic.ensure_writer()
-            await writer(deadline, self._priority, self._serialize_message(tag, payload, reliable=False))
-            _logger.debug("Published BE tag=%d topic='%s'", tag, self._topic.name)
+        if reliable:
+            await self._reliable_publish(deadline, payload)
             return
 
-        await self._reliable_publish(deadline, tag, payload)
+        tag = self._topic.next_tag()
+        writer = self._topic.ensure_writer()
+        lage = self._topic.lage(Instant.now().s)
+        await writer(deadline, self._priority, self._serialize_message(lage, tag, payload, reliable=False))
+        _logger.debug("Published BE tag=%d topic='%s'", tag, self._topic.name)
 
     async def request(
         self,
         delivery_deadline: Instant,
         response_timeout: float,
         message: memoryview | bytes,
+        *,
+        capacity: int | None = None,
+        overflow: Overflow = Overflow.DROP_OLDEST,
     ) -> ResponseStream:
         if self.closed:
             raise SendError("Publisher closed")
+        capacity = queue_capacity(capacity)
 
-        tag = self._topic.next_tag()
         payload = bytes(message)
+        ticket = await self._window.acquire(delivery_deadline)  # Tags are taken once admitted to keep them in order.
+        tag = self._topic.next_tag()
 
         # Create response stream before publishing so it's ready to receive.
         stream = ResponseStreamImpl(
@@ -121,12 +278,14 @@ class PublisherImpl(Publisher):
             topic=self._topic,
             message_tag=tag,
             response_timeout=response_timeout,
+            capacity=capacity,
+            overflow=overflow,
         )
         self._topic.request_futures[tag] = stream
 
-        tracker = self._prepare_reliable_publish_tracker(tag)
+        tracker = self._prepare_reliable_publish_tracker(tag, ticket)
         try:
-            initial_window = await self._reliable_publish_start(delivery_deadline, tag, payload, tracker)
+            initial_window = await self._reliable_publish_start(delivery_deadline, payload, tracker)
         except asyncio.CancelledError:
             tracker.compromised = True
             self._topic.request_futures.pop(tag, None)
@@ -173,8 +332,7 @@ class PublisherImpl(Publisher):
     def _ack_window_is_compromised(deadline_ns: int, current_ack_timeout: float) -> bool:
         return Instant.now().ns >= (deadline_ns - round(current_ack_timeout * 1e9))
 
-    def _serialize_message(self, tag: int, payload: bytes, *, reliable: bool) -> bytes:
-        lage = self._topic.lage(Instant.now().s)
+    def _serialize_message(self, lage: int, tag: int, payload: bytes, *, reliable: bool) -> bytes:
         hdr = (MsgRelHeader if reliable else MsgBeHeader)(
             topic_log_age=lage,
             topic_evictions=self._topic.evictions,
@@ -183,37 +341,68 @@ class PublisherImpl(Publisher):
         )
         return hdr.serialize() + payload
 
-    def _prepare_reliable_publish_tracker(self, tag: int) -> PublishTracker:
+    def _reliable_message(self, tracker: PublishTracker, payload: bytes) -> bytes:
+        """
+        The serialized message is kept in the tracker and sent again as the very same object while the header stays
+        valid, so that retransmissions are not reserialized and the transport can reuse its segmentation.
+        """
+        lage = self._topic.lage(Instant.now().s)
+        key = (lage, self._topic.evictions)
+        if (tracker.message is None) or (tracker.message_key != key):
+            tracker.message = self._serialize_message(lage, tracker.tag, payload, reliable=True)
+            tracker.message_key = key
+        return tracker.message
+
+    def _prepare_reliable_publish_tracker(self, tag: int, ticket: int | None = None) -> PublishTracker:
         tracker = self._node.prepare_publish_tracker(self._topic, tag)
-        tracker.ack_timeout = self.ack_timeout
+        tracker.window_ticket = ticket
+        # The window has to fit the slowest subscriber, so the estimates are only usable if every one has some.
+        if tracker.associations and all(assoc.rtt.samples > 0 for assoc in tracker.associations):
+            tracker.ack_timeout = max(assoc.rtt.timeout for assoc in tracker.associations)
+        else:
+            tracker.ack_timeout = self.ack_timeout
         self._topic.publish_futures[tag] = tracker
         return tracker
 
     def _release_reliable_publish_tracker(self, tag: int, tracker: PublishTracker) -> None:
         self._topic.publish_futures.pop(tag, None)
         self._node.publish_tracker_release(self._topic, tracker)
+        if tracker.window_ticket is not None:
+            tracker.window_ticket = None
+            self._window.release()
 
     async def _send_reliable_publish(
         self,
         deadline: Instant,
-        tag: int,
         payload: bytes,
         tracker: PublishTracker,
         *,
         first_attempt: bool,
     ) -> None:
-        data = self._serialize_message(tag, payload, reliable=True)
-        if (not first_attempt) and (len(tracker.remaining) == 1):
-            remote_id = next(iter(tracker.remaining))
-            await self._node.transport.unicast(deadline, self._priority, remote_id, data)
-        else:
-            writer = self._topic.ensure_writer()
-            await writer(deadline, self._priority, data)
+        data = self._reliable_message(tracker, payload)
+        if first_attempt:
+            await self._topic.ensure_writer()(deadline, self._priority, data)
+            return
+        # A multicast is received and deduplicated by every subscriber, including those that have already ACKed.
+        # Unicasts reach only the laggards, which is cheaper overall while they are few.
+        remaining = len(tracker.remaining)
+        if (remaining == 0) or (remaining > max(1.0, self._unicast_retransmit_ratio * len(tracker.associations))):
+            self._retransmissions_multicast += 1
+            await self._topic.ensure_writer()(deadline, self._priority, data)
+            return
+        error: SendError | OSError | None = None
+        for remote_id in sorted(tracker.remaining):
+            self._retransmissions_unicast += 1
+            try:
+                await self._node.transport.unicast(deadline, self._priority, remote_id, data)
+            except (SendError, OSError) as ex:
+                error = error or ex  # Do not let one unreachable remote hold back the others.
+        if error is not None:
+            raise error
 
     async def _reliable_publish_start(
         self,
         deadline: Instant,
-        tag: int,
         payload: bytes,
         tracker: PublishTracker,
     ) -> tuple[int, bool]:
@@ -221,9 +410,9 @@ class PublisherImpl(Publisher):
         if initial_window is None:
             raise DeliveryError("Reliable publish not acknowledged before deadline")
         ack_deadline_ns, _ = initial_window
-        tracker.ack_event.clear()
+        tracker.sent_ns = Instant.now().ns
         try:
-            await self._send_reliable_publish(Instant(ns=ack_deadline_ns), tag, payload, tracker, first_attempt=True)
+            await self._send_reliable_publish(Instant(ns=ack_deadline_ns), payload, tracker, first_attempt=True)
         except SendError:
             tracker.compromised = True
             raise
@@ -244,21 +433,17 @@ class PublisherImpl(Publisher):
         while True:
             if tracker.acknowledged and not tracker.remaining:
                 _logger.debug("Reliable publish ACKed tag=%d topic='%s'", tag, self._topic.name)
+                self._window.on_ack()
                 return
 
-            wait_until_ns = deadline.ns if last_attempt else ack_deadline_ns
-            wait_timeout = max(0.0, (wait_until_ns - Instant.now().ns) * 1e-9)
-            if wait_timeout > 0:
-                try:
-                    await asyncio.wait_for(tracker.ack_event.wait(), timeout=wait_timeout)
-                except asyncio.TimeoutError:
-                    pass
+            await self._node.ack_scheduler.wait(tracker, deadline.ns if last_attempt else ack_deadline_ns)
 
             if (not last_attempt) and self._ack_window_is_compromised(deadline.ns, tracker.ack_timeout):
                 tracker.compromised = True
 
             if tracker.acknowledged and not tracker.remaining:
                 _logger.debug("Reliable publish ACKed tag=%d topic='%s'", tag, self._topic.name)
+                self._window.on_ack()
                 return
             if last_attempt:
                 break
@@ -267,20 +452,23 @@ class PublisherImpl(Publisher):
             if next_window is None:
                 break
             ack_deadline_ns, last_attempt = next_window
-            tracker.ack_event.clear()
+            # Silence from known subscribers is taken for congestion; with none known, nobody is there to ACK yet.
+            if (not tracker.retransmitted) and tracker.associations and (tracker.window_ticket is not None):
+                self._window.on_loss(tracker.window_ticket)
+            tracker.retransmitted = True
             try:
-                await self._send_reliable_publish(
-                    Instant(ns=ack_deadline_ns), tag, payload, tracker, first_attempt=False
-                )
+                await self._send_reliable_publish(Instant(ns=ack_deadline_ns), payload, tracker, first_attempt=False)
             except (SendError, OSError):
                 tracker.compromised = True
 
         raise DeliveryError("Reliable publish not acknowledged before deadline")
 
-    async def _reliable_publish(self, deadline: Instant, tag: int, payload: bytes) -> None:
-        tracker = self._prepare_reliable_publish_tracker(tag)
+    async def _reliable_publish(self, deadline: Instant, payload: bytes) -> None:
+        ticket = await self._window.acquire(deadline)  # Tags are taken once admitted to keep them in order.
+        tag = self._topic.next_tag()
+        tracker = self._prepare_reliable_publish_tracker(tag, ticket)
         try:
-            initial_window = await self._reliable_publish_start(deadline, tag, payload, tracker)
+            initial_window = await self._reliable_publish_start(deadline, payload, tracker)
             await self._reliable_publish_continue(deadline, tag, payload, tracker, initial_window)
         except asyncio.CancelledError:
             tracker.compromised = True
@@ -309,17 +497,26 @@ class ResponseStreamImpl(ResponseStream):
         topic: TopicImpl,
         message_tag: int,
         response_timeout: float,
+        capacity: int | None = None,
+        overflow: Overflow = Overflow.DROP_OLDEST,
     ) -> None:
         self._node = node
         self._topic = topic
         self._message_tag = message_tag
         self._response_timeout = response_timeout
-        self.queue: asyncio.Queue[Response | BaseException] = asyncio.Queue()
+        self.queue: DeliveryQueue[Response | BaseException] = DeliveryQueue(node.timer_wheel)
+        self._capacity = capacity  # Enforced by on_response() rather than the queue so that errors always fit.
+        self._overflow = overflow
+        self._dropped = 0
         self.closed = False
         self._reliable_remote_by_id: dict[int, ResponseRemoteState] = {}
         self._publish_task: asyncio.Task[None] | None = None
         self._cleanup_handle: asyncio.TimerHandle | None = None
 
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
     def __aiter__(self) -> ResponseStreamImpl:
         return self
 
@@ -327,7 +524,7 @@ class ResponseStreamImpl(ResponseStream):
         if self.closed:
             raise StopAsyncIteration
         try:
-            item = await asyncio.wait_for(self.queue.get(), timeout=self._response_timeout)
+            item = await self.queue.get(self._response_timeout)
         except asyncio.TimeoutError:
             raise LivenessError("Response timeout")
         if isinstance(item, StopAsyncIteration):
@@ -365,7 +562,7 @@ class ResponseStreamImpl(ResponseStream):
         self,
         arrival: TransportArrival,
         hdr: RspBeHeader | RspRelHeader,
-        payload: bytes,
+        payload: bytes | memoryview,
     ) -> bool:
         """Called by the node when a response arrives matching our message_tag."""
         reliable = isinstance(hdr, RspRelHeader)
@@ -393,8 +590,17 @@ class ResponseStreamImpl(ResponseStream):
             timestamp=arrival.timestamp,
             remote_id=arrival.remote_id,
             seqno=hdr.seqno,
-            message=payload,
+            message=bytes(payload),
         )
+        if (self._capacity is not None) and (self.queue.qsize() >= self._capacity):
+            self._dropped += 1
+            if self._overflow is Overflow.REJECT:
+                if reliable:  # NACK'd for lack of space; a retransmission may fit later.
+                    self._reliable_remote_by_id[arrival.remote_id].forget(hdr.seqno)
+                return False
+            # Errors are never dropped; if there are only errors queued, the new response goes instead.
+            if (self._overflow is Overflow.DROP_NEWEST) or not self.queue.drop_oldest(Response):
+                return True
         self.queue.put_nowait(response)
         return True
 
@@ -410,4 +616,5 @@ class ResponseStreamImpl(ResponseStream):
         else:
             self._remove_from_topic()
         self.queue.put_nowait(StopAsyncIteration())
+        self.queue.close()
         _logger.debug("Response stream closed for tag=%d", self._message_tag)
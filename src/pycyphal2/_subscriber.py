@@ -3,14 +3,21 @@ from __future__ import annotations
 import asyncio
 import logging
 import math
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from typing import Callable
 
 from ._api import DeliveryError, Instant, LivenessError, NackError, Priority, SendError
-from ._api import Subscriber, Breadcrumb, Topic, Arrival
+from ._api import Subscriber, Breadcrumb, Topic, Arrival, Overflow, Closable
 from ._header import SEQNO48_MASK, RspBeHeader, RspRelHeader
 from ._node import (
     ACK_BASELINE_DEFAULT_TIMEOUT,
     REORDERING_CAPACITY,
+    DeliveryQueue,
+    FanoutCursor,
+    FanoutRing,
+    LivenessTimer,
     SESSION_LIFETIME,
     NodeImpl,
     SubscriberRoot,
@@ -21,6 +28,8 @@ from ._node import (
 
 _logger = logging.getLogger(__name__)
 REORDERING_WINDOW_MAX = SESSION_LIFETIME / 2
+REORDERING_ADAPT_WARMUP = 16
+INLINE_REPORT_INTERVAL = 1.0
 
 
 # =====================================================================================================================
@@ -28,23 +37,120 @@ REORDERING_WINDOW_MAX = SESSION_LIFETIME / 2
 # =====================================================================================================================
 
 
-@dataclass
-class InternedMsg:
-    arrival: Arrival
-    tag: int
-    remote_id: int
-    lin_tag: int
+class ReorderingEstimator:
+    """
+    Adaptive reordering window of one stream, bounded by the configured maximum.
+
+    The window covers the lateness of the reordered messages seen so far plus a margin for arrival jitter.
+    Lateness is measured directly as the time from the arrival of the first later message until the late one shows up,
+    and indirectly as the reorder distance in tags times the mean inter-arrival interval. Both follow increases
+    immediately and decay slowly while the stream is in order. A message that arrives after its gap was already
+    skipped means the window was too short, so it is extended by at least that much.
+    The window stays at the maximum until enough arrivals have been seen to trust the estimate.
+    """
+
+    def __init__(self, maximum: float) -> None:
+        self.maximum = maximum
+        self.window = maximum
+        self._samples = 0
+        self._interval = 0.0  # Smoothed time per tag.
+        self._jitter = 0.0  # Smoothed mean deviation of the above.
+        self._lateness = 0.0
+        self._distance = 0.0
+        self._highest: int | None = None  # Highest linearized tag seen and when it arrived.
+        self._highest_at = 0.0
+        self._skipped = (0, -1, 0.0)  # Linearized tags [lo, hi] ejected past without arriving, and when.
+
+    def restart(self, lin_tag: int, now: float) -> None:
+        """The linearization was reset; the history is kept but the tag references are not."""
+        self._highest, self._highest_at = lin_tag, now
+        self._skipped = (0, -1, 0.0)
+
+    def on_arrival(self, lin_tag: int, now: float, reordered_since: float | None) -> None:
+        """
+        Called for every accepted arrival. ``reordered_since`` is the arrival time of the earliest interned message
+        that follows this one, if any; None if the message is in order.
+        """
+        if (self._highest is None) or (lin_tag > self._highest):
+            if self._highest is not None:
+                step = lin_tag - self._highest
+                interval = max(0.0, now - self._highest_at) / step
+                if self._samples == 0:
+                    self._interval = interval
+                self._jitter += (abs(interval - self._interval) - self._jitter) / 4
+                self._interval += (interval - self._interval) / 8
+                self._lateness -= self._lateness / 64
+                self._distance -= self._distance / 64
+                self._samples += 1
+            self._highest, self._highest_at = lin_tag, now
+        else:
+            distance = float(self._highest - lin_tag)
+            lateness = 0.0 if reordered_since is None else max(0.0, now - reordered_since)
+            self._distance = distance if distance > self._distance else self._distance + (distance - self._distance) / 8
+            self._lateness = lateness if lateness > self._lateness else self._lateness + (lateness - self._lateness) / 8
+        self._update()
+
+    def on_skip(self, lo: int, hi: int, now: float) -> None:
+        self._skipped = (lo, hi, now)
+
+    def on_late(self, lin_tag: int, now: float) -> bool:
+        """Called for a message that arrived after its slot was ejected; True if it was skipped over (not a dup)."""
+        lo, hi, skipped_at = self._skipped
+        if not (lo <= lin_tag <= hi):
+            return False
+        self._lateness = max(self._lateness, self.window + max(0.0, now - skipped_at))
+        self._update()
+        return True
+
+    def _update(self) -> None:
+        if self._samples < REORDERING_ADAPT_WARMUP:
+            self.window = self.maximum
+        else:
+            needed = max(self._lateness, self._distance * self._interval) + (4 * self._jitter)
+            self.window = min(self.maximum, needed)
 
 
-@dataclass
+@dataclass(eq=False)
 class ReorderingState:
-    """Per (remote_id, topic_hash) reordering state for ordered subscriptions."""
+    """
+    Per (remote_id, topic_hash) reordering state for ordered subscriptions.
+    Interned messages always have linearized tags in (last_ejected_lin_tag, last_ejected_lin_tag + capacity],
+    so each one has its own slot in the ring at ``lin_tag % REORDERING_CAPACITY``.
+    """
 
     tag_baseline: int = 0
     last_ejected_lin_tag: int = 0
     last_active_at: float = 0.0
-    interned: dict[int, InternedMsg] = field(default_factory=dict)  # lin_tag -> msg
-    timeout_handle: asyncio.TimerHandle | None = None
+    ring: list[Arrival | None] = field(default_factory=lambda: [None] * REORDERING_CAPACITY)
+    interned: int = 0  # Number of occupied ring slots.
+    armed_head: int | None = None  # Linearized tag whose window closure is scheduled on the node's timer wheel.
+    estimator: ReorderingEstimator | None = None  # Only for adaptive subscriptions.
+
+    def head(self) -> int:
+        """Linearized tag of the earliest interned message; requires at least one."""
+        lin_tag = self.last_ejected_lin_tag + 1
+        while self.ring[lin_tag % REORDERING_CAPACITY] is None:
+            lin_tag += 1
+        return lin_tag
+
+    def take(self, lin_tag: int) -> Arrival:
+        """Remove the interned message from its slot and mark it ejected."""
+        slot = lin_tag % REORDERING_CAPACITY
+        arrival = self.ring[slot]
+        assert arrival is not None
+        self.ring[slot] = None
+        self.interned -= 1
+        self.last_ejected_lin_tag = lin_tag
+        return arrival
+
+    def earliest_after(self, lin_tag: int) -> float | None:
+        """Arrival time of the earliest interned message with a higher linearized tag; None if there is none."""
+        out: float | None = None
+        for later in range(lin_tag + 1, self.last_ejected_lin_tag + REORDERING_CAPACITY + 1):
+            arrival = self.ring[later % REORDERING_CAPACITY]
+            if (arrival is not None) and ((out is None) or (arrival.timestamp.s < out)):
+                out = arrival.timestamp.s
+        return out
 
 
 class SubscriberImpl(Subscriber):
@@ -55,6 +161,11 @@ class SubscriberImpl(Subscriber):
         pattern: str,
         verbatim: bool,
         reordering_window: float | None,
+        capacity: int | None = None,
+        overflow: Overflow = Overflow.DROP_OLDEST,
+        *,
+        adaptive: bool = False,
+        shared: bool = False,
     ) -> None:
         self._node = node
         self._root = root
@@ -62,9 +173,29 @@ class SubscriberImpl(Subscriber):
         self._verbatim = verbatim
         self._timeout = float("inf")
         self._reordering_window = self._normalize_reordering_window(reordering_window)
-        self.queue: asyncio.Queue[Arrival | BaseException] = asyncio.Queue()
-        self._reordering: dict[tuple[int, int], ReorderingState] = {}  # (remote_id, topic_hash)
+        self._adaptive = adaptive and (self._reordering_window is not None)
+        self.queue: DeliveryQueue[Arrival | BaseException] | FanoutCursor[Arrival | BaseException]
+        if shared:
+            if root.ring is None:
+                root.ring = FanoutRing(node.timer_wheel)
+            self.queue = FanoutCursor(root.ring, capacity)
+        else:
+            self.queue = DeliveryQueue(node.timer_wheel)
+        self._capacity = capacity  # Enforced by _enqueue() rather than the queue so that closure always fits.
+        self._overflow = overflow
+        self._dropped = 0
+        # Keyed by (remote_id, topic_hash) and kept in the order of last activity, so stale states are at the front.
+        self._reordering: OrderedDict[tuple[int, int], ReorderingState] = OrderedDict()
+        self._reordering_by_topic: dict[int, set[int]] = {}  # topic_hash -> remote_ids present in _reordering
         self.closed = False
+        # Batch receive: the waiter is woken by the delivery side once enough arrivals are queued or the linger ends.
+        self._batch_waiter: asyncio.Future[None] | None = None
+        self._batch_count = 0
+        self._batch_linger = 0.0
+        self._batch_linger_handle: asyncio.TimerHandle | None = None
+        self._batch_liveness = LivenessTimer(node.timer_wheel, self._on_batch_liveness_timeout)
+        self._deferred: BaseException | None = None  # Raised on the next receive after a partial batch.
+        self.inline: InlineListener | None = None
 
     @staticmethod
     def _normalize_reordering_window(reordering_window: float | None) -> float | None:
@@ -93,6 +224,36 @@ class SubscriberImpl(Subscriber):
     def timeout(self, duration: float) -> None:
         self._timeout = duration
 
+    @property
+    def dropped(self) -> int:
+        if isinstance(self.queue, FanoutCursor):
+            return self._dropped + self.queue.dropped
+        return self._dropped
+
+    @property
+    def shared(self) -> bool:
+        """True if the arrivals are read from the ring shared with the other shared subscribers of the same name."""
+        return isinstance(self.queue, FanoutCursor)
+
+    @property
+    def full(self) -> bool:
+        return (self._capacity is not None) and (self.queue.qsize() >= self._capacity)
+
+    @property
+    def rejecting(self) -> bool:
+        """True if new arrivals are rejected, so that reliable ones should be NACK'd."""
+        return (self._overflow is Overflow.REJECT) and self.full
+
+    @property
+    def reordering_windows(self) -> dict[tuple[int, int], float]:
+        window = self._reordering_window
+        if window is None:
+            return {}
+        return {
+            key: (state.estimator.window if state.estimator is not None else window)
+            for key, state in self._reordering.items()
+        }
+
     def substitutions(self, topic: Topic) -> list[tuple[str, int]] | None:
         return match_pattern(self._pattern, topic.name)
 
@@ -102,9 +263,9 @@ class SubscriberImpl(Subscriber):
     async def __anext__(self) -> Arrival:
         if self.closed:
             raise StopAsyncIteration
-        timeout = self._timeout if self._timeout != float("inf") else None
+        self._raise_deferred()
         try:
-            item = await asyncio.wait_for(self.queue.get(), timeout=timeout)
+            item = await self.queue.get(self._timeout)
         except asyncio.TimeoutError:
             raise LivenessError("No message received within timeout")
         if isinstance(item, StopAsyncIteration):
@@ -113,125 +274,259 @@ class SubscriberImpl(Subscriber):
             raise item
         return item
 
-    def deliver(self, arrival: Arrival, tag: int, remote_id: int) -> bool:
-        """Called by the node to deliver a message to this subscriber."""
+    async def receive_batch(self, max_count: int, max_wait: float = 0.0) -> list[Arrival]:
+        if max_count < 1:
+            raise ValueError("Batch size must be positive")
+        max_wait = float(max_wait)
+        if (max_wait < 0.0) or (not math.isfinite(max_wait)):
+            raise ValueError("Batch linger must be a finite non-negative duration")
+        if self.closed:
+            raise StopAsyncIteration
+        self._raise_deferred()
+        if (self.queue.qsize() < max_count) and (self.queue.empty() or (max_wait > 0.0)):
+            await self._await_batch(max_count, max_wait)
+        return self._drain_batch(max_count)
+
+    async def _await_batch(self, max_count: int, max_wait: float) -> None:
+        loop = self._node.loop
+        waiter = loop.create_future()
+        self._batch_waiter = waiter
+        self._batch_count = max_count if self._capacity is None else min(max_count, self._capacity)
+        self._batch_linger = max_wait
+        if not self.queue.empty():
+            self._batch_linger_handle = loop.call_later(max_wait, self._wake_batch)
+        if isinstance(self.queue, FanoutCursor):
+            self.queue.listen(self._on_queued)
+        self._batch_liveness.start(self._timeout)
+        try:
+            await waiter
+        finally:
+            self._batch_waiter = None
+            if isinstance(self.queue, FanoutCursor):
+                self.queue.listen(None)
+            if self._batch_linger_handle is not None:
+                self._batch_linger_handle.cancel()
+                self._batch_linger_handle = None
+            self._batch_liveness.stop()
+        if self.queue.empty():
+            raise LivenessError("No message received within timeout")
+
+    def _wake_batch(self) -> None:
+        if (self._batch_waiter is not None) and not self._batch_waiter.done():
+            self._batch_waiter.set_result(None)
+
+    def _on_batch_liveness_timeout(self) -> None:
+        if self.queue.empty():  # Once the batch has started, only the linger ends it.
+            self._wake_batch()
+
+    def _drain_batch(self, max_count: int) -> list[Arrival]:
+        out: list[Arrival] = []
+        while len(out) < max_count and not self.queue.empty():
+            item = self.queue.get_nowait()
+            if isinstance(item, BaseException):
+                if not out:
+                    raise item
+                self._deferred = item
+                break
+            out.append(item)
+        return out
+
+    def _raise_deferred(self) -> None:
+        if self._deferred is not None:
+            item, self._deferred = self._deferred, None
+            raise item
+
+    def listen_inline(self, callback: Callable[[Arrival], None], *, budget: float = 0.001) -> Closable:
+        if self.inline is not None:
+            raise ValueError("An inline callback is already installed")
+        budget = float(budget)
+        if (budget <= 0.0) or math.isnan(budget):
+            raise ValueError("Inline callback budget must be positive")
+        listener = InlineListener(self, callback, budget)
+        while not self.queue.empty():
+            item = self.queue.get_nowait()
+            if isinstance(item, BaseException):
+                self._deferred = item
+                break
+            listener(item)
+        if isinstance(self.queue, FanoutCursor):  # Inline delivery is per subscriber, so leave the shared ring.
+            cursor, self.queue = self.queue, DeliveryQueue(self._node.timer_wheel)
+            while not cursor.empty():
+                self.queue.put_nowait(cursor.get_nowait())
+            self._dropped += cursor.dropped
+            cursor.close()
+            self._root.invalidate_delivery_plans()
+        self.inline = listener
+        return listener
+
+    def _enqueue(self, item: Arrival | BaseException) -> None:
+        if (self.inline is not None) and isinstance(item, Arrival):
+            self.inline(item)
+            return
+        if isinstance(item, Arrival) and self.full:
+            self._dropped += 1
+            if self._overflow is not Overflow.DROP_OLDEST:
+                return
+            assert isinstance(self.queue, DeliveryQueue)  # Shared subscribers are fed by the ring, not from here.
+            if not self.queue.drop_oldest(Arrival):  # Errors are never dropped.
+                return
+        self.queue.put_nowait(item)
+        self._on_queued(isinstance(item, BaseException))
+
+    def _on_queued(self, error: bool = False) -> None:
+        if self._batch_waiter is None:
+            return
+        depth = self.queue.qsize()
+        if (depth >= self._batch_count) or error or (self._batch_linger <= 0.0):
+            self._wake_batch()
+        elif self._batch_linger_handle is None:  # The first arrival of the batch starts the linger.
+            self._batch_linger_handle = self._node.loop.call_later(self._batch_linger, self._wake_batch)
+
+    def deliver(self, arrival: Arrival, tag: int, remote_id: int, topic_hash: int | None = None) -> bool:
+        """
+        Called by the node to deliver a message to this subscriber.
+        The topic hash is only needed for ordered subscriptions; it is taken from the breadcrumb if not given.
+        """
         if self.closed:
             return False
+        if self.rejecting:
+            self._dropped += 1
+            return False
         if self._reordering_window is None:
-            self.queue.put_nowait(arrival)
+            self._enqueue(arrival)
             return True
         # Reordering enabled.
-        self._drop_stale_reordering(arrival.timestamp.s)
-        topic_hash = arrival.breadcrumb.topic.hash
+        now = arrival.timestamp.s
+        self._drop_stale_reordering(now)
+        if topic_hash is None:
+            topic_hash = arrival.breadcrumb.topic.hash
         key = (remote_id, topic_hash)
         state = self._reordering.get(key)
+        if (state is not None) and (state.last_active_at + SESSION_LIFETIME) < now:
+            self._force_eject_all(self._pop_reordering(key))  # Stale but not at the front due to timestamp jitter.
+            state = None
         if state is None:
-            state = ReorderingState(
-                tag_baseline=tag - (REORDERING_CAPACITY // 2),
-                last_ejected_lin_tag=0,
-                last_active_at=arrival.timestamp.s,
-            )
+            state = ReorderingState(tag_baseline=tag - (REORDERING_CAPACITY // 2), last_active_at=now)
+            if self._adaptive:
+                assert self._reordering_window is not None
+                state.estimator = ReorderingEstimator(self._reordering_window)
             self._reordering[key] = state
-        state.last_active_at = arrival.timestamp.s
+            self._reordering_by_topic.setdefault(topic_hash, set()).add(remote_id)
+        else:
+            self._reordering.move_to_end(key)
+        state.last_active_at = now
         lin_tag = (tag - state.tag_baseline) & ((1 << 64) - 1)
 
         # Detect wraparound / very late messages.
         if lin_tag > ((1 << 63) - 1):
             _logger.debug("Reorder drop late tag=%d lin=%d", tag, lin_tag)
             return False
+        est = state.estimator
         if lin_tag <= state.last_ejected_lin_tag:
-            _logger.debug("Reorder drop dup/late tag=%d lin=%d last=%d", tag, lin_tag, state.last_ejected_lin_tag)
+            if (est is not None) and est.on_late(lin_tag, now):
+                _logger.debug("Reorder drop late tag=%d lin=%d; window now %.6f", tag, lin_tag, est.window)
+            else:
+                _logger.debug("Reorder drop dup/late tag=%d lin=%d last=%d", tag, lin_tag, state.last_ejected_lin_tag)
             return False
 
         while state.interned and lin_tag > (state.last_ejected_lin_tag + REORDERING_CAPACITY):
             self._scan_reordering(state, force_first=True)
 
-        expected = state.last_ejected_lin_tag + 1
-        if lin_tag == expected:
-            # In-order: eject immediately and scan for consecutive.
-            self.queue.put_nowait(arrival)
-            state.last_ejected_lin_tag = lin_tag
-            self._scan_reordering(state, force_first=False)
-            return True
-
         if lin_tag > (state.last_ejected_lin_tag + REORDERING_CAPACITY):
             state.tag_baseline = tag - (REORDERING_CAPACITY // 2)
             state.last_ejected_lin_tag = 0
             lin_tag = (tag - state.tag_baseline) & ((1 << 64) - 1)
             _logger.debug("Reorder resequence tag=%d lin=%d", tag, lin_tag)
+            if est is not None:
+                est.restart(lin_tag, now)
+        elif est is not None:
+            est.on_arrival(lin_tag, now, state.earliest_after(lin_tag) if state.interned else None)
+
+        expected = state.last_ejected_lin_tag + 1
+        if lin_tag == expected:
+            # In-order: eject immediately and scan for consecutive.
+            self._enqueue(arrival)
+            state.last_ejected_lin_tag = lin_tag
+            if state.interned:
+                self._scan_reordering(state, force_first=False)
+            return True
 
         # Out-of-order but within capacity: intern.
-        if lin_tag in state.interned:
+        slot = lin_tag % REORDERING_CAPACITY
+        if state.ring[slot] is not None:
             return True
-        state.interned[lin_tag] = InternedMsg(arrival=arrival, tag=tag, remote_id=remote_id, lin_tag=lin_tag)
+        state.ring[slot] = arrival
+        state.interned += 1
         self._rearm_reorder_timeout(state)
         return True
 
     def _scan_reordering(self, state: ReorderingState, force_first: bool) -> None:
-        while True:
-            if not state.interned:
-                if state.timeout_handle is not None:
-                    state.timeout_handle.cancel()
-                    state.timeout_handle = None
-                break
-
-            lin_tag = min(state.interned)
-            if force_first or ((state.last_ejected_lin_tag + 1) == lin_tag):
-                force_first = False
-                interned = state.interned.pop(lin_tag)
-                self.queue.put_nowait(interned.arrival)
-                state.last_ejected_lin_tag = lin_tag
-                continue
-
-            self._rearm_reorder_timeout(state)
-            break
+        ring = state.ring
+        while state.interned:
+            lin_tag = state.last_ejected_lin_tag + 1
+            if ring[lin_tag % REORDERING_CAPACITY] is None:
+                if not force_first:
+                    self._rearm_reorder_timeout(state)
+                    return
+                lin_tag = state.head()
+                if state.estimator is not None:
+                    state.estimator.on_skip(state.last_ejected_lin_tag + 1, lin_tag - 1, Instant.now().s)
+            force_first = False
+            self._enqueue(state.take(lin_tag))
+        self._disarm_reorder_timeout(state)
 
     def _force_eject_all(self, state: ReorderingState, *, silenced: bool = False) -> None:
         """Force-eject all interned messages in tag order."""
         while state.interned:
-            lin_tag = min(state.interned)
-            interned = state.interned.pop(lin_tag)
-            state.last_ejected_lin_tag = lin_tag
+            arrival = state.take(state.head())
             if not silenced:
-                self.queue.put_nowait(interned.arrival)
-        if state.timeout_handle is not None:
-            state.timeout_handle.cancel()
-            state.timeout_handle = None
+                self._enqueue(arrival)
+        self._disarm_reorder_timeout(state)
 
     def _rearm_reorder_timeout(self, state: ReorderingState) -> None:
-        """Arm or rearm the reordering timeout against the current head-of-line slot."""
+        """Arm or rearm the reordering timeout against the current head-of-line slot if it has changed."""
         if self._reordering_window is None:
             return
         if not state.interned:
-            if state.timeout_handle is not None:
-                state.timeout_handle.cancel()
-                state.timeout_handle = None
+            self._disarm_reorder_timeout(state)
             return
-
-        lin_tag = min(state.interned)
-        delay = max(0.0, (state.interned[lin_tag].arrival.timestamp.s + self._reordering_window) - Instant.now().s)
-
-        loop = self._node.loop
-        if state.timeout_handle is not None:
-            state.timeout_handle.cancel()
-
-        def on_timeout() -> None:
-            state.timeout_handle = None
-            self._scan_reordering(state, force_first=True)
-
-        state.timeout_handle = loop.call_later(delay, on_timeout)
+        lin_tag = state.head()
+        if lin_tag == state.armed_head:
+            return
+        head = state.ring[lin_tag % REORDERING_CAPACITY]
+        assert head is not None
+        window = self._reordering_window if state.estimator is None else state.estimator.window
+        delay = max(0.0, (head.timestamp.s + window) - Instant.now().s)
+        state.armed_head = lin_tag
+        self._node.timer_wheel.schedule(state, self._node.loop.time() + delay, self._on_reorder_timeout)
+
+    def _disarm_reorder_timeout(self, state: ReorderingState) -> None:
+        if state.armed_head is not None:
+            state.armed_head = None
+            self._node.timer_wheel.cancel(state)
+
+    def _on_reorder_timeout(self, state: ReorderingState) -> None:
+        state.armed_head = None
+        self._scan_reordering(state, force_first=True)
+
+    def _pop_reordering(self, key: tuple[int, int]) -> ReorderingState:
+        state = self._reordering.pop(key)
+        remote_ids = self._reordering_by_topic[key[1]]
+        remote_ids.discard(key[0])
+        if not remote_ids:
+            del self._reordering_by_topic[key[1]]
+        return state
 
     def _drop_stale_reordering(self, now: float) -> None:
-        stale = [key for key, state in self._reordering.items() if (state.last_active_at + SESSION_LIFETIME) < now]
-        for key in stale:
-            state = self._reordering.pop(key)
-            self._force_eject_all(state)
+        while self._reordering:
+            key, state = next(iter(self._reordering.items()))
+            if (state.last_active_at + SESSION_LIFETIME) >= now:
+                break
+            self._force_eject_all(self._pop_reordering(key))
 
     def forget_topic_reordering(self, topic_hash: int, *, silenced: bool = True) -> None:
-        keys = [key for key in self._reordering if key[1] == topic_hash]
-        for key in keys:
-            state = self._reordering.pop(key)
-            self._force_eject_all(state, silenced=silenced)
+        for remote_id in self._reordering_by_topic.pop(topic_hash, ()):
+            self._force_eject_all(self._reordering.pop((remote_id, topic_hash)), silenced=silenced)
 
     def close(self) -> None:
         if self.closed:
@@ -240,22 +535,64 @@ class SubscriberImpl(Subscriber):
         for state in self._reordering.values():
             self._force_eject_all(state)
         self._reordering.clear()
+        self._reordering_by_topic.clear()
+        self.inline = None
         if self in self._root.subscribers:
             self._root.subscribers.remove(self)
+            self._root.invalidate_delivery_plans()
         if not self._root.subscribers:
             if self._root.scout_task is not None:
                 self._root.scout_task.cancel()
                 self._root.scout_task = None
             if self._root.is_pattern:
                 self._node.sub_roots_pattern.pop(self._root.name, None)
+                self._node.sub_roots_pattern_index.remove(self._root.name)
             else:
                 self._node.sub_roots_verbatim.pop(self._root.name, None)
-            for topic in list(self._node.topics_by_name.values()):
+            for topic in list(self._root.topics):
                 self._node.decouple_topic_root(topic, self._root)
-        self.queue.put_nowait(StopAsyncIteration())
+        self._enqueue(StopAsyncIteration())
+        self.queue.close()
+        self._batch_liveness.close()
         _logger.info("Subscriber closed for '%s'", self._pattern)
 
 
+class InlineListener(Closable):
+    """Synchronous callback invoked from the dispatch path; see Subscriber.listen_inline()."""
+
+    def __init__(self, subscriber: SubscriberImpl, callback: Callable[[Arrival], None], budget: float) -> None:
+        self._subscriber = subscriber
+        self._callback = callback
+        self._budget = budget
+        self.overruns = 0
+        self.failures = 0
+        self._reported_at = -math.inf
+
+    def __call__(self, arrival: Arrival) -> None:
+        started = time.perf_counter()
+        try:
+            self._callback(arrival)
+        except Exception:
+            self.failures += 1
+            _logger.exception("Inline callback for '%s' failed", self._subscriber.pattern)
+        elapsed = time.perf_counter() - started
+        if elapsed > self._budget:
+            self.overruns += 1
+            if (started - self._reported_at) >= INLINE_REPORT_INTERVAL:  # Do not flood the log at high rates.
+                self._reported_at = started
+                _logger.warning(
+                    "Inline callback for '%s' took %.3f ms, over its %.3f ms budget (%d overruns so far)",
+                    self._subscriber.pattern,
+                    elapsed * 1e3,
+                    self._budget * 1e3,
+                    self.overruns,
+                )
+
+    def close(self) -> None:
+        if self._subscriber.inline is self:
+            self._subscriber.inline = None
+
+
 # =====================================================================================================================
 # Breadcrumb
 # =====================================================================================================================
@@ -289,6 +626,11 @@ class BreadcrumbImpl(Breadcrumb):
     def tag(self) -> int:
         return self._message_tag
 
+    @property
+    def round_trip_time(self) -> tuple[float, float] | None:
+        rtt = self._node.responder_rtt.get(self._remote_id)
+        return None if rtt is None else (rtt.srtt, rtt.rttvar)
+
     async def __call__(
         self,
         deadline: Instant,
@@ -333,14 +675,15 @@ class BreadcrumbImpl(Breadcrumb):
         key = tracker.key
         self._node.respond_futures[key] = tracker
 
-        ack_timeout = ACK_BASELINE_DEFAULT_TIMEOUT * (1 << int(self._priority))
+        rtt = self._node.responder_rtt.get(self._remote_id)
+        ack_timeout = rtt.timeout if rtt is not None else ACK_BASELINE_DEFAULT_TIMEOUT * (1 << int(self._priority))
         try:
             initial_window = ack_window(deadline.ns, ack_timeout)
             if initial_window is None:
                 raise DeliveryError("Reliable response not acknowledged before deadline")
 
             ack_deadline_ns, last_attempt = initial_window
-            tracker.ack_event.clear()
+            tracker.sent_ns = Instant.now().ns
             try:
                 await self._node.transport.unicast(Instant(ns=ack_deadline_ns), self._priority, self._remote_id, data)
             except SendError:
@@ -354,12 +697,7 @@ class BreadcrumbImpl(Breadcrumb):
                         raise NackError("Response NACK'd by remote")
                     return
 
-                wait_until_ns = deadline.ns if last_attempt else ack_deadline_ns
-                wait_time = max(0.0, (wait_until_ns - Instant.now().ns) * 1e-9)
-                try:
-                    await asyncio.wait_for(tracker.ack_event.wait(), timeout=wait_time)
-                except asyncio.TimeoutError:
-                    pass
+                await self._node.ack_scheduler.wait(tracker, deadline.ns if last_attempt else ack_deadline_ns)
 
                 if tracker.done:
                     if tracker.nacked:
@@ -373,7 +711,7 @@ class BreadcrumbImpl(Breadcrumb):
                 if next_window is None:
                     break
                 ack_deadline_ns, last_attempt = next_window
-                tracker.ack_event.clear()
+                tracker.retransmitted = True
                 try:
                     await self._node.transport.unicast(
                         Instant(ns=ack_deadline_ns), self._priority, self._remote_id, data
@@ -404,11 +742,14 @@ class RespondTracker:
         self.seqno = seqno
         self.tag = tag
         self.key = (remote_id, message_tag, topic_hash, seqno, tag)
-        self.ack_event = asyncio.Event()
+        self.waiter: asyncio.Future[None] | None = None  # Set while the responder waits in the AckScheduler.
+        self.sent_ns = 0  # When the first transmission went out; the ACK to it is an RTT sample.
+        self.retransmitted = False
         self.done = False
         self.nacked = False
 
     def on_ack(self, positive: bool) -> None:
         self.done = True
         self.nacked = not positive
-        self.ack_event.set()
+        if (self.waiter is not None) and not self.waiter.done():
+            self.waiter.set_result(None)
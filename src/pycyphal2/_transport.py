@@ -23,17 +23,21 @@ class SubjectWriter(Closable):
         raise NotImplementedError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransportArrival:
     """
     Arrival of a transfer from the underlying transport.
     The session layer (this library) will parse the header and process the message.
+
+    The message may be a memoryview of the transport's receive buffer to avoid copying the transfer payload;
+    the session layer passes slices of it on to the application without copying, so the transport must not
+    modify or reuse that buffer afterwards.
     """
 
     timestamp: Instant
     priority: Priority
     remote_id: int
-    message: bytes
+    message: bytes | memoryview
 
 
 class Transport(Closable):
@@ -11,7 +11,7 @@ CAN_EXT_ID_MASK = (1 << 29) - 1
 CAN_STD_ID_MASK = (1 << 11) - 1
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Frame:
     """29-bit extended data frame."""
 
@@ -21,13 +21,15 @@ class Frame:
     def __post_init__(self) -> None:
         if not isinstance(self.id, int) or not (0 <= self.id <= CAN_EXT_ID_MASK):
             raise ValueError(f"Invalid CAN identifier: {self.id!r}")
-        data = bytes(self.data)
+        data = self.data
+        if type(data) is not bytes:  # Frames are usually built from bytes already, which need no conversion.
+            data = bytes(data)
+            object.__setattr__(self, "data", data)
         if len(data) > 64:
             raise ValueError(f"Invalid CAN data length: {len(data)}")
-        object.__setattr__(self, "data", data)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TimestampedFrame(Frame):
     timestamp: Instant
 
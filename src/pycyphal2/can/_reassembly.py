@@ -56,7 +56,7 @@ class RxSession:
 class Endpoint:
     kind: TransferKind
     port_id: int
-    on_transfer: Callable[[Instant, int, Priority, bytes], None]
+    on_transfer: Callable[[Instant, int, Priority, bytes | memoryview], None]
     sessions: dict[int, RxSession] = field(default_factory=dict)
 
 
@@ -119,8 +119,12 @@ class Reassembler:
         if parsed.end_of_transfer:
             session.slots[parsed.priority] = None
             if len(slot.data) >= 2 and slot.crc == 0:
+                # The slot is discarded, so its buffer is handed over as a view without the CRC instead of a copy.
                 endpoint.on_transfer(
-                    Instant(ns=slot.start_ts_ns), parsed.source_id, Priority(parsed.priority), bytes(slot.data[:-2])
+                    Instant(ns=slot.start_ts_ns),
+                    parsed.source_id,
+                    Priority(parsed.priority),
+                    memoryview(slot.data)[:-2],
                 )
             else:
                 _logger.debug(
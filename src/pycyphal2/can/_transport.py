@@ -50,7 +50,7 @@ class _PinnedSubjectState:
         buf[8:16] = pack_u64_le(rapidhash(str(subject_id)))
         return _PinnedSubjectState(subject_id=subject_id, header_prefix=bytes(buf[:16]))
 
-    def wrap(self, payload: bytes) -> bytes:
+    def wrap(self, payload: bytes | memoryview) -> bytes:
         self.next_tag += 1
         return self.header_prefix + pack_u64_le(self.next_tag) + payload
 
@@ -213,7 +213,7 @@ class _CANTransportImpl(CANTransport):
             raise ValueError(f"Subject {subject_id} already has an active listener")
         self._subject_handlers[subject_id] = handler
 
-        def on_transfer_16(timestamp: Instant, remote_id: int, priority: Priority, payload: bytes) -> None:
+        def on_transfer_16(timestamp: Instant, remote_id: int, priority: Priority, payload: bytes | memoryview) -> None:
             handler(TransportArrival(timestamp, priority, remote_id, payload))
 
         self._endpoints[(TransferKind.MESSAGE_16, subject_id)] = Endpoint(
@@ -224,7 +224,9 @@ class _CANTransportImpl(CANTransport):
         if subject_id <= SUBJECT_ID_PINNED_MAX:
             pinned = self._pinned_subjects.setdefault(subject_id, _PinnedSubjectState.new(subject_id))
 
-            def on_transfer_13(timestamp: Instant, remote_id: int, priority: Priority, payload: bytes) -> None:
+            def on_transfer_13(
+                timestamp: Instant, remote_id: int, priority: Priority, payload: bytes | memoryview
+            ) -> None:
                 handler(TransportArrival(timestamp, priority, remote_id, pinned.wrap(payload)))
 
             self._endpoints[(TransferKind.MESSAGE_13, subject_id)] = Endpoint(
@@ -384,7 +386,9 @@ class _CANTransportImpl(CANTransport):
             on_transfer=self._on_unicast_transfer,
         )
 
-    def _on_unicast_transfer(self, timestamp: Instant, remote_id: int, priority: Priority, payload: bytes) -> None:
+    def _on_unicast_transfer(
+        self, timestamp: Instant, remote_id: int, priority: Priority, payload: bytes | memoryview
+    ) -> None:
         handler = self._unicast_handler
         if handler is not None:
             handler(TransportArrival(timestamp, priority, remote_id, payload))
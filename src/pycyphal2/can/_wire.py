@@ -65,7 +65,7 @@ class TransferKind(Enum):
     V0_RESPONSE = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParsedFrame:
     kind: TransferKind
     priority: int
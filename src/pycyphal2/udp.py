@@ -56,6 +56,8 @@ _SIOCGIFMTU = 0x8921
 _CYPHAL_OVERHEAD_MAX = 100
 _CYPHAL_MTU_LINK_MIN = 576
 _RX_SESSION_LIFETIME_NS = round(30.0 * 1e9)
+_TX_SEGMENT_CACHE_BYTES = 4 * 1024 * 1024
+_TX_SEGMENT_CACHE_ENTRY_OVERHEAD = 256  # Charged per entry so that many tiny messages cannot bloat the cache.
 _RX_SLOT_COUNT = 8
 _RX_TRANSFER_HISTORY_COUNT = 32
 _SUBJECT_ID_MODULUS_MAX = IPv4_SUBJECT_ID_MAX - SUBJECT_ID_PINNED_MAX
@@ -66,7 +68,7 @@ _SUBJECT_ID_MODULUS_MAX = IPv4_SUBJECT_ID_MAX - SUBJECT_ID_PINNED_MAX
 # =====================================================================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _FrameHeader:
     priority: int
     transfer_id: int
@@ -132,28 +134,80 @@ def _header_deserialize(data: bytes | memoryview) -> _FrameHeader | None:
 # =====================================================================================================================
 
 
-def _segment_transfer(
-    priority: int, transfer_id: int, sender_uid: int, payload: bytes | memoryview, mtu: int
-) -> list[bytes]:
-    """Segment a transfer payload into wire-format frames (header + chunk each).
-
-    The ``mtu`` parameter is the max Cyphal frame payload size per frame (mtu_cyphal).
-    """
-    payload = bytes(payload)
+def _segment_payload(payload: bytes, mtu: int) -> list[tuple[int, bytes, int]]:
+    """Split a transfer payload into (offset, chunk, prefix CRC) triples; this part does not depend on the transfer."""
     size = len(payload)
-    frames: list[bytes] = []
+    segments: list[tuple[int, bytes, int]] = []
     offset = 0
     running_crc = CRC32C_INITIAL
     while True:
         progress = min(size - offset, mtu)
         chunk = payload[offset : offset + progress]
         running_crc = crc32c_add(running_crc, chunk)
-        header = _header_serialize(priority, transfer_id, sender_uid, offset, size, running_crc ^ CRC32C_OUTPUT_XOR)
-        frames.append(header + chunk)
+        segments.append((offset, chunk, running_crc ^ CRC32C_OUTPUT_XOR))
         offset += progress
         if offset >= size:
             break
-    return frames
+    return segments
+
+
+def _segment_transfer(
+    priority: int,
+    transfer_id: int,
+    sender_uid: int,
+    payload: bytes | memoryview,
+    mtu: int,
+    segments: list[tuple[int, bytes, int]] | None = None,
+) -> list[bytes]:
+    """Segment a transfer payload into wire-format frames (header + chunk each).
+
+    The ``mtu`` parameter is the max Cyphal frame payload size per frame (mtu_cyphal).
+    The ``segments`` of the payload are computed unless given, see :class:`_TxSegmentCache`.
+    """
+    if segments is None:
+        segments = _segment_payload(bytes(payload), mtu)
+    size = len(payload)
+    return [
+        _header_serialize(priority, transfer_id, sender_uid, offset, size, prefix_crc) + chunk
+        for offset, chunk, prefix_crc in segments
+    ]
+
+
+class _TxSegmentCache:
+    """
+    Segmentation of the recently sent messages, keyed by the identity of the message object, up to a total size.
+    The session layer retransmits reliable messages by passing the very same bytes object again, so a retransmission
+    only rebuilds the frame headers, which differ in the transfer-ID, instead of recomputing the CRC of the whole
+    payload. Only immutable messages are cached; each entry keeps its message alive, so no other object can get its id.
+    """
+
+    def __init__(self, capacity: int = _TX_SEGMENT_CACHE_BYTES) -> None:
+        self._capacity = capacity
+        self._size = 0
+        self._entries: OrderedDict[tuple[int, int], tuple[bytes, list[tuple[int, bytes, int]]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def segment(
+        self, priority: int, transfer_id: int, sender_uid: int, message: bytes | memoryview, mtu: int
+    ) -> list[bytes]:
+        if type(message) is not bytes:
+            return _segment_transfer(priority, transfer_id, sender_uid, message, mtu)
+        key = (id(message), mtu)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return _segment_transfer(priority, transfer_id, sender_uid, message, mtu, entry[1])
+        segments = _segment_payload(message, mtu)
+        cost = len(message) + _TX_SEGMENT_CACHE_ENTRY_OVERHEAD
+        if cost <= self._capacity:
+            self._entries[key] = (message, segments)
+            self._size += cost
+            while self._size > self._capacity:
+                evicted, _ = self._entries.popitem(last=False)[1]
+                self._size -= len(evicted) + _TX_SEGMENT_CACHE_ENTRY_OVERHEAD
+        return _segment_transfer(priority, transfer_id, sender_uid, message, mtu, segments)
 
 
 # =====================================================================================================================
@@ -168,21 +222,21 @@ def _frame_is_valid(header: _FrameHeader, payload_chunk: bytes | memoryview) ->
     return (header.frame_payload_offset + len(payload_chunk)) <= header.transfer_payload_size
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _Fragment:
     offset: int
-    data: bytes
+    data: bytes | memoryview
 
     @property
     def end(self) -> int:
         return self.offset + len(self.data)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _RxTransfer:
     sender_uid: int
     priority: int
-    payload: bytes
+    payload: bytes | memoryview
     timestamp_ns: int
 
 
@@ -208,7 +262,9 @@ class _TransferSlot:
             ts_max_ns=timestamp_ns,
         )
 
-    def update(self, timestamp_ns: int, header: _FrameHeader, payload_chunk: bytes) -> bytes | None:
+    def update(
+        self, timestamp_ns: int, header: _FrameHeader, payload_chunk: bytes | memoryview
+    ) -> bytes | memoryview | None:
         if self._accept_fragment(header.frame_payload_offset, payload_chunk):
             self.ts_max_ns = max(self.ts_max_ns, timestamp_ns)
             self.ts_min_ns = min(self.ts_min_ns, timestamp_ns)
@@ -220,7 +276,7 @@ class _TransferSlot:
             return None
         return self._finalize_payload()
 
-    def _accept_fragment(self, offset: int, data: bytes) -> bool:
+    def _accept_fragment(self, offset: int, data: bytes | memoryview) -> bool:
         left = offset
         right = offset + len(data)
         for frag in self.fragments:
@@ -273,9 +329,9 @@ class _TransferSlot:
             covered = max(covered, frag.end)
         return covered
 
-    def _finalize_payload(self) -> bytes | None:
+    def _finalize_payload(self) -> bytes | memoryview | None:
         offset = 0
-        parts: list[bytes] = []
+        parts: list[bytes | memoryview] = []
         for frag in self.fragments:
             if frag.offset > offset:
                 return None
@@ -285,7 +341,8 @@ class _TransferSlot:
             view = frag.data[trim:]
             parts.append(view)
             offset += len(view)
-        payload = b"".join(parts)
+        # A single-frame transfer is passed on as a view of the datagram; only multi-frame transfers are joined.
+        payload = parts[0] if len(parts) == 1 else b"".join(parts)
         if len(payload) != self.total_size:
             return None
         if crc32c_full(payload) != self.crc:
@@ -350,7 +407,7 @@ class _RxReassembler:
     def accept(
         self,
         header: _FrameHeader,
-        payload_chunk: bytes,
+        payload_chunk: bytes | memoryview,
         *,
         timestamp_ns: int | None = None,
         frame_validated: bool = False,
@@ -512,7 +569,7 @@ class _UDPSubjectWriter(SubjectWriter):
         success_count = 0
         for i, iface in enumerate(self._transport.interfaces):
             mtu = iface.mtu_cyphal
-            frames = _segment_transfer(priority, transfer_id, self._transport.uid, message, mtu)
+            frames = self._transport.segment_cache.segment(priority, transfer_id, self._transport.uid, message, mtu)
             try:
                 for frame in frames:
                     await self._transport.async_sendto(self._transport.tx_socks[i], frame, (mcast_ip, port), deadline)
@@ -690,6 +747,7 @@ class _UDPTransportImpl(UDPTransport):
         self._unicast_reassembler = _RxReassembler()
         self._remote_endpoints: dict[tuple[int, int], tuple[str, int]] = {}
         self._next_unicast_transfer_id = int.from_bytes(os.urandom(6), "little")
+        self._segment_cache = _TxSegmentCache()
 
         # Async RX tasks (platform-agnostic, replaces add_reader)
         self._unicast_rx_tasks: list[asyncio.Task[None]] = []
@@ -755,6 +813,10 @@ class _UDPTransportImpl(UDPTransport):
     def tx_socks(self) -> list[socket.socket]:
         return self._tx_socks
 
+    @property
+    def segment_cache(self) -> _TxSegmentCache:
+        return self._segment_cache
+
     def __repr__(self) -> str:
         addrs = ", ".join(str(i.address) for i in self._interfaces)
         return f"UDPTransport(uid=0x{self._uid:016x}, interfaces=[{addrs}], modulus={self._subject_id_modulus_val})"
@@ -837,7 +899,7 @@ class _UDPTransportImpl(UDPTransport):
             if ep is None:
                 _logger.debug("Unicast tx skip rid=%016x iface=%d reason=no-endpoint", remote_id, i)
                 continue
-            frames = _segment_transfer(priority, transfer_id, self._uid, message, iface.mtu_cyphal)
+            frames = self._segment_cache.segment(priority, transfer_id, self._uid, message, iface.mtu_cyphal)
             try:
                 for frame in frames:
                     await self.async_sendto(self._tx_socks[i], frame, ep, deadline)
@@ -940,7 +1002,7 @@ class _UDPTransportImpl(UDPTransport):
             if header is None:
                 _logger.debug("Unicast rx drop bad-header iface=%d len=%d", iface_idx, len(data))
                 return
-            payload_chunk = data[HEADER_SIZE:]
+            payload_chunk = memoryview(data)[HEADER_SIZE:]
             if not _frame_is_valid(header, payload_chunk):
                 _logger.debug("Unicast rx drop bad-frame iface=%d rid=%016x", iface_idx, header.sender_uid)
                 return
@@ -987,7 +1049,7 @@ class _UDPTransportImpl(UDPTransport):
             if header is None:
                 _logger.debug("Subject rx drop bad-header sid=%d iface=%d len=%d", subject_id, iface_idx, len(data))
                 return
-            payload_chunk = data[HEADER_SIZE:]
+            payload_chunk = memoryview(data)[HEADER_SIZE:]
             if not _frame_is_valid(header, payload_chunk):
                 _logger.debug(
                     "Subject rx drop bad-frame sid=%d iface=%d rid=%016x", subject_id, iface_idx, header.sender_uid
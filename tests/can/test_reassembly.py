@@ -5,7 +5,7 @@ from pycyphal2.can._wire import TransferKind
 
 
 def test_cleanup_drops_session_after_30_seconds() -> None:
-    received: list[bytes] = []
+    received: list[bytes | memoryview] = []
     endpoint = Endpoint(
         kind=TransferKind.MESSAGE_16,
         port_id=7,
@@ -34,7 +34,7 @@ def _parsed(
 
 
 def test_anonymous_single_frame_is_accepted_but_multiframe_is_rejected() -> None:
-    received: list[tuple[int, Priority, bytes]] = []
+    received: list[tuple[int, Priority, bytes | memoryview]] = []
     endpoint = Endpoint(
         kind=TransferKind.MESSAGE_13,
         port_id=55,
@@ -66,7 +66,7 @@ def test_cleanup_retains_fresh_session_while_dropping_stale_slots() -> None:
 
 
 def test_start_replaces_existing_slot_and_cleans_stale_slots() -> None:
-    received: list[bytes] = []
+    received: list[bytes | memoryview] = []
     endpoint = Endpoint(
         kind=TransferKind.MESSAGE_16,
         port_id=7,
@@ -172,7 +172,7 @@ def test_admission_cases(
 
 
 def test_multiframe_crc_failure_clears_slot_without_delivery() -> None:
-    received: list[bytes] = []
+    received: list[bytes | memoryview] = []
     endpoint = Endpoint(
         kind=TransferKind.MESSAGE_16,
         port_id=99,
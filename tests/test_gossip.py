@@ -5,11 +5,16 @@ from __future__ import annotations
 import asyncio
 import time
 
+import pytest
+
 import pycyphal2
 from pycyphal2._node import (
+    TOPIC_NAME_MAX,
+    GossipPacer,
+    TopicImpl,
     compute_subject_id,
 )
-from pycyphal2._header import GossipHeader, MsgRelHeader
+from pycyphal2._header import HEADER_SIZE, GossipHeader, MsgRelHeader
 from pycyphal2._transport import TransportArrival
 from tests.mock_transport import MockTransport, MockNetwork
 from tests.typing_helpers import expect_arrival, expect_mock_writer, new_node, subscribe_impl
@@ -438,3 +443,198 @@ async def test_rsp_ack_sent_for_reliable_response():
     stream.close()
     pub.close()
     node.close()
+
+
+async def test_gossip_scheduler_uses_one_task_for_all_topics():
+    """Scheduling gossip for many topics must not create a task per topic; urgent gossip still goes out."""
+    net = MockNetwork()
+    tr = MockTransport(node_id=1, network=net)
+    node = new_node(tr, home="n1")
+    loop = asyncio.get_running_loop()
+    tasks_before = len(asyncio.all_tasks(loop))
+
+    pubs = [node.advertise(f"/topic/{i}") for i in range(200)]
+    topics = [node.topics_by_name[f"topic/{i}"] for i in range(200)]
+    assert all(t.gossip_deadline is not None for t in topics)
+    assert len(asyncio.all_tasks(loop)) == tasks_before
+
+    # Suppression postpones the deadline; the stale heap entry left behind is skipped.
+    for t in topics:
+        node._reschedule_gossip_periodic(t, suppressed=True)
+    heap_size = len(node._gossip_heap_urgent) + len(node._gossip_heap_periodic)
+    assert heap_size <= (2 * len(node.topics_by_name) + 64) + 1
+
+    broadcast = expect_mock_writer(node.broadcast_writer)
+    sent_before = broadcast.send_count
+    node.schedule_gossip_urgent(topics[7])
+    await asyncio.sleep(0.05)
+    assert broadcast.send_count == sent_before + 1
+    assert topics[7].gossip_deadline is not None  # Rescheduled as periodic after the urgent one.
+    assert topics[7].gossip_is_periodic
+
+    for p in pubs:
+        p.close()
+    node.close()
+
+
+async def test_gossip_scheduler_survives_failing_event():
+    net = MockNetwork()
+    tr = MockTransport(node_id=1, network=net)
+    node = new_node(tr, home="n1")
+    pub_a = node.advertise("/a")
+    pub_b = node.advertise("/b")
+    topic_a = node.topics_by_name["a"]
+    topic_b = node.topics_by_name["b"]
+    sent: list[str] = []
+
+    async def fake_send_gossip(topic: TopicImpl, *, broadcast: bool = False) -> None:
+        if topic is topic_a:
+            raise RuntimeError("boom")
+        sent.append(topic.name)
+
+    node.send_gossip = fake_send_gossip  # type: ignore[assignment]
+    node._cancel_gossip(topic_a)
+    node._cancel_gossip(topic_b)
+    node.schedule_gossip_urgent(topic_a)
+    await asyncio.sleep(0.03)
+    node.schedule_gossip_urgent(topic_b)
+    await asyncio.sleep(0.03)
+    assert sent == ["b"]
+    assert not node._gossip_task.done()
+
+    pub_a.close()
+    pub_b.close()
+    node.close()
+
+
+async def test_gossip_scheduler_not_held_up_by_stalled_send():
+    """A gossip send that does not complete must not delay the gossip of the other topics."""
+    net = MockNetwork()
+    tr = MockTransport(node_id=1, network=net)
+    node = new_node(tr, home="n1")
+    pub_a = node.advertise("/a")
+    pub_b = node.advertise("/b")
+    topic_a = node.topics_by_name["a"]
+    topic_b = node.topics_by_name["b"]
+    stall = asyncio.get_running_loop().create_future()
+    sent: list[str] = []
+
+    async def stalling_send_gossip(topic: TopicImpl, *, broadcast: bool = False) -> None:
+        if topic is topic_a:
+            await stall
+        sent.append(topic.name)
+
+    node.send_gossip = stalling_send_gossip  # type: ignore[assignment]
+    node._cancel_gossip(topic_a)
+    node._cancel_gossip(topic_b)
+    node.schedule_gossip_urgent(topic_a)
+    await asyncio.sleep(0.03)
+    node.schedule_gossip_urgent(topic_b)
+    await asyncio.sleep(0.03)
+    assert sent == ["b"]
+    assert topic_a.gossip_is_periodic and topic_b.gossip_is_periodic  # Both rescheduled without waiting for sends.
+
+    stall.set_result(None)
+    await asyncio.sleep(0.01)
+    assert sent == ["b", "a"]
+
+    pub_a.close()
+    pub_b.close()
+    node.close()
+
+
+def test_gossip_pacer_token_bucket():
+    pacer = GossipPacer(1000.0, now=0.0)
+    assert pacer.capacity == HEADER_SIZE + TOPIC_NAME_MAX  # The burst is never smaller than one gossip.
+    assert pacer.consume(200, 0.0)
+    assert not pacer.consume(100, 0.0)
+    assert pacer.delay(100, 0.0) == pytest.approx(0.076)
+    assert pacer.consume(100, 0.08)
+    # Forced consumption always succeeds and puts the bucket into bounded debt.
+    assert pacer.consume(10000, 0.08, force=True)
+    assert pacer.delay(50, 0.08) == pytest.approx((pacer.capacity + 50) / 1000.0)
+
+    unlimited = GossipPacer(None, now=0.0)
+    assert unlimited.consume(10**9, 0.0)
+    assert unlimited.delay(10**9, 0.0) == 0.0
+
+
+async def test_gossip_bandwidth_validation():
+    for bad in (0.0, -1.0, float("inf"), float("nan")):
+        with pytest.raises(ValueError):
+            new_node(MockTransport(node_id=1), home="n1", gossip_bandwidth=bad)
+
+
+async def test_gossip_bandwidth_paces_periodic_but_not_urgent():
+    net = MockNetwork()
+    tr = MockTransport(node_id=1, network=net)
+    bandwidth = 2000.0
+    node = new_node(tr, home="n1", gossip_bandwidth=bandwidth)
+    sent: list[tuple[str, bool]] = []
+
+    async def fake_send_gossip(topic: TopicImpl, *, broadcast: bool = False) -> None:
+        sent.append((topic.name, topic.gossip_counter == 0))
+
+    node.send_gossip = fake_send_gossip  # type: ignore[assignment]
+    pubs = [node.advertise(f"/topic/{i:03}") for i in range(100)]  # 33 bytes per gossip
+    topics = [node.topics_by_name[f"topic/{i:03}"] for i in range(100)]
+
+    # The creation-time urgent gossip is not held back even though it far exceeds the budget.
+    await asyncio.sleep(0.05)
+    assert len(sent) == 100
+    sent.clear()
+
+    # Force every topic to be due for periodic gossip right away; the pacer spreads them out.
+    for t in topics:
+        node._schedule_gossip_at(t, time.monotonic(), periodic=True)
+    await asyncio.sleep(0.5)
+    cost = HEADER_SIZE + len(topics[0].name)
+    assert 0 < len(sent) <= ((bandwidth * 0.5) / cost) + 2
+    assert len(sent) < len(topics)
+
+    # Urgent gossip overtakes the paced backlog.
+    sent.clear()
+    node.schedule_gossip_urgent(topics[-1])
+    await asyncio.sleep(0.03)
+    assert ("topic/099", True) in sent
+
+    for p in pubs:
+        p.close()
+    node.close()
+
+
+async def test_gossip_message_cached_until_fields_change():
+    net = MockNetwork()
+    tr = MockTransport(node_id=1, network=net)
+    node = new_node(tr, home="n1")
+    pub = node.advertise("/cached/topic")
+    topic = node.topics_by_name["cached/topic"]
+
+    def expected(now: float) -> bytes:
+        name = topic.name.encode()
+        hdr = GossipHeader(topic.lage(now), topic.hash, topic.evictions, len(name))
+        return hdr.serialize() + name
+
+    now = time.monotonic()
+    first = topic.gossip_message(now)
+    assert first == expected(now)
+    assert topic.gossip_message(now) is first  # No re-serialization while nothing changed.
+
+    topic.set_evictions(topic.evictions + 1)
+    second = topic.gossip_message(now)
+    assert second is not first
+    assert second == expected(now)
+
+    topic.ts_origin = now - 1000
+    third = topic.gossip_message(now)
+    assert third == expected(now)
+    assert GossipHeader.deserialize(third) == GossipHeader(9, topic.hash, topic.evictions, len(topic.name))
+
+    # All emission paths share the cached message.
+    await node.send_gossip(topic, broadcast=True)
+    await node.send_gossip(topic, broadcast=False)
+    await node.send_gossip_unicast(topic, 42)
+    assert tr.unicast_log[-1] == (42, third)
+
+    pub.close()
+    node.close()
@@ -1,5 +1,9 @@
 import struct
+
+import pytest
+
 from pycyphal2._header import *
+from pycyphal2._header import _Codec
 
 # =====================================================================================================================
 # MsgBeHeader (TYPE=0) and MsgRelHeader (TYPE=1)
@@ -397,3 +401,42 @@ def test_deserialize_header_short_buffer() -> None:
     assert deserialize_header(b"") is None
     assert deserialize_header(b"\x00") is None
     assert deserialize_header(b"\x00" * (HEADER_SIZE - 1)) is None
+
+
+def test_pack_into_matches_serialize() -> None:
+    headers = [
+        MsgBeHeader(topic_log_age=-1, topic_evictions=0xFFFFFFFF, topic_hash=U64_MASK, tag=1),
+        MsgNackHeader(topic_hash=789, tag=U64_MASK),
+        RspRelHeader(tag=0xFF, seqno=SEQNO48_MASK, topic_hash=2, message_tag=3),
+        GossipHeader(topic_log_age=35, topic_hash=0xDEADBEEF, topic_evictions=7, name_len=255),
+        ScoutHeader(pattern_len=50),
+    ]
+    for hdr in headers:
+        buf = bytearray(b"\xaa" * (HEADER_SIZE + 8))
+        hdr.pack_into(buf, 4)
+        assert buf[4 : 4 + HEADER_SIZE] == hdr.serialize()
+        assert buf[:4] == b"\xaa" * 4
+        assert buf[4 + HEADER_SIZE :] == b"\xaa" * 4
+        assert deserialize_header(memoryview(buf)[4:]) == hdr
+
+
+def test_headers_are_slotted() -> None:
+    for hdr in [MsgBeHeader(0, 0, 0, 0), MsgAckHeader(0, 0), RspBeHeader(0, 0, 0, 0), GossipHeader(0, 0, 0, 0)]:
+        assert not hasattr(hdr, "__dict__")
+    assert not hasattr(ScoutHeader(0), "__dict__")
+
+
+def test_codec_requires_layout_and_wire() -> None:
+    with pytest.raises(TypeError):
+
+        class NoWire(_Codec):
+            __slots__ = ()
+            _LAYOUT = struct.Struct("<Q")
+
+    with pytest.raises(TypeError):
+
+        class NoLayout(_Codec):
+            __slots__ = ()
+
+            def _wire(self) -> tuple[int, ...]:
+                return (0,)
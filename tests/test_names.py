@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import itertools
+import random
+
 import pytest
 
 from pycyphal2 import SUBJECT_ID_PINNED_MAX
 from pycyphal2._node import (
     TOPIC_NAME_MAX,
+    NameIndex,
     _name_consume_pin_suffix,
     _name_normalize,
     match_pattern,
@@ -505,6 +509,82 @@ def test_match_second_chevron_is_literal() -> None:
     assert match_pattern("a/>/>/c", "a/>/d/c") is None
 
 
+# =====================================================================================================================
+# NameIndex -- must agree with match_pattern in both directions
+# =====================================================================================================================
+
+
+def _random_keys(rng: random.Random, alphabet: list[str], count: int) -> list[str]:
+    return ["/".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(count)]
+
+
+def test_name_index_agrees_with_match_pattern() -> None:
+    rng = random.Random(1234)
+    names = sorted(set(_random_keys(rng, ["a", "b", "c", ">"], 300)))
+    patterns = sorted(set(_random_keys(rng, ["a", "b", "*", ">"], 300)))
+
+    by_name: NameIndex[str] = NameIndex()
+    for n in names:
+        by_name.add(n, n)
+    by_pattern: NameIndex[str] = NameIndex()
+    for p in patterns:
+        by_pattern.add(p, p)
+    assert len(by_name) == len(names)
+    assert len(by_pattern) == len(patterns)
+
+    for p in patterns:
+        assert by_name.match_pattern(p) == [n for n in names if match_pattern(p, n) is not None], p
+    for n in names:
+        assert by_pattern.match_name(n) == [p for p in patterns if match_pattern(p, n) is not None], n
+
+
+def test_name_index_zero_segment_chevron_and_literal_star() -> None:
+    index: NameIndex[str] = NameIndex()
+    for key in ("a", "a/b", "a/b/c", "x/*"):
+        index.add(key, key)
+    assert index.match_pattern("a/>") == ["a", "a/b", "a/b/c"]
+    assert index.match_pattern("*/>") == ["a", "a/b", "a/b/c", "x/*"]
+    assert index.match_pattern("*/*") == ["a/b", "x/*"]
+    assert index.match_pattern("a/b") == ["a/b"]
+    assert index.match_pattern("a/b/c/d") == []
+    assert index.match_pattern("") == []
+
+
+def test_name_index_remove_prunes_and_preserves_order() -> None:
+    index: NameIndex[int] = NameIndex()
+    keys = ["a/b/c", "a/b", "a/>", "*/b", "z"]
+    for i, key in enumerate(keys):
+        index.add(key, i)
+    assert index.match_name("a/b") == [1, 2, 3]
+
+    index.remove("a/b")
+    index.remove("a/b")  # Idempotent.
+    index.remove("a/q")  # Unknown keys are ignored.
+    assert len(index) == 4
+    assert index.match_name("a/b") == [2, 3]
+    assert index.match_pattern("a/>") == [0, 2]
+
+    for key in keys:
+        index.remove(key)
+    assert len(index) == 0
+    assert not index._root.children  # The trie is fully pruned.
+
+    # Re-adding places the key at the end of the iteration order.
+    index.add("a/>", 10)
+    index.add("*/b", 11)
+    index.add("a/>", 12)
+    assert index.match_name("a/b") == [11, 12]
+
+
+def test_name_index_large_table() -> None:
+    index: NameIndex[str] = NameIndex()
+    for i, j in itertools.product(range(100), range(100)):
+        index.add(f"n{i}/m{j}", f"n{i}/m{j}")
+    assert index.match_pattern("n7/>") == [f"n7/m{j}" for j in range(100)]
+    assert index.match_pattern("n7/m42") == ["n7/m42"]
+    assert index.match_pattern("*/m42") == [f"n{i}/m42" for i in range(100)]
+
+
 # =====================================================================================================================
 # resolve_name -- remapping
 # =====================================================================================================================
@@ -96,7 +96,6 @@ async def test_association_slack_nack_capped():
     tracker = PublishTracker(
         tag=tag,
         remaining={42},
-        ack_event=asyncio.Event(),
     )
     topic.publish_futures[tag] = tracker
 
@@ -136,7 +135,6 @@ async def test_association_ack_resets_slack():
     tracker = PublishTracker(
         tag=tag,
         remaining={42},
-        ack_event=asyncio.Event(),
     )
     topic.publish_futures[tag] = tracker
 
@@ -272,15 +272,11 @@ async def test_reliable_publish_scheduler_lag_does_not_penalize_association() ->
     now_ns = 0
     wait_count = 0
 
-    async def fake_wait_for(awaitable: object, timeout: float) -> None:
+    async def fake_wait(_tracker: object, deadline_ns: int) -> None:
         nonlocal now_ns, wait_count
-        del timeout
-        close = getattr(awaitable, "close", None)
-        if callable(close):
-            close()
+        del deadline_ns
         wait_count += 1
         now_ns = 800_000_000 if wait_count == 1 else deadline.ns
-        raise asyncio.TimeoutError
 
     async def fake_send(*_: object, **__: object) -> None:
         return None
@@ -289,7 +285,7 @@ async def test_reliable_publish_scheduler_lag_does_not_penalize_association() ->
         return pycyphal2.Instant(ns=now_ns)
 
     with patch("pycyphal2._publisher.Instant.now", side_effect=fake_now):
-        with patch("pycyphal2._publisher.asyncio.wait_for", side_effect=fake_wait_for):
+        with patch.object(node.ack_scheduler, "wait", side_effect=fake_wait):
             with patch.object(pub, "_send_reliable_publish", side_effect=fake_send):
                 with pytest.raises(pycyphal2.DeliveryError):
                     await pub._reliable_publish_continue(deadline, tag, b"data", tracker, (200_000_000, False))
@@ -423,7 +419,7 @@ async def test_accept_message_without_subscribers_cleans_stale_dedup_state() ->
     pub = node.advertise("/topic")
     topic = node.topics_by_name["topic"]
 
-    topic.dedup[42] = DedupState(tag_frontier=123, bitmap=1, last_active=0.0)
+    topic.dedup[42] = DedupState(tag_frontier=123, last_active=0.0)
     arrival = TransportArrival(
         timestamp=pycyphal2.Instant.now() + SESSION_LIFETIME + 1.0,
         priority=pycyphal2.Priority.NOMINAL,
@@ -685,15 +681,17 @@ async def test_subscriber_wraparound_drop_and_head_of_line_rearm() -> None:
 
     key = (42, topic.hash)
     state = sub._reordering[key]
-    first_handle = state.timeout_handle
-    assert first_handle is not None
+    first_head = state.armed_head
+    assert first_head is not None
+    assert state in node.timer_wheel
 
     await asyncio.sleep(0.15)
     gap = pycyphal2.Arrival(timestamp=pycyphal2.Instant.now(), breadcrumb=bc, message=b"gap")
     assert sub.deliver(gap, 999, 42)
-    second_handle = state.timeout_handle
-    assert second_handle is not None
-    assert second_handle is not first_handle
+    second_head = state.armed_head
+    assert second_head is not None
+    assert second_head != first_head
+    assert state in node.timer_wheel
 
     await asyncio.sleep(0.15)
     assert sub.queue.empty()
@@ -872,14 +870,7 @@ async def test_gossip_scheduler_first_periodic_is_broadcast_and_suppression_dela
 
     node._cancel_gossip(topic)
     topic.gossip_counter = 0
-    seen: list[bool] = []
-
-    async def fake_send_gossip(_topic: object, *, broadcast: bool = False) -> None:
-        seen.append(broadcast)
-
-    node.send_gossip = fake_send_gossip  # type: ignore[assignment]
-    await node._gossip_event_periodic(topic)
-    assert seen == [True]
+    assert node._gossip_event_periodic(topic) is True
 
     pub.close()
     node.close()
@@ -893,7 +884,7 @@ async def test_topic_demotion_cancels_gossip_and_listener_release_tracks_couplin
     sub = subscribe_impl(node, "/topic")
     topic = node.topics_by_name["topic"]
 
-    assert topic.gossip_task is not None
+    assert topic.gossip_deadline is not None
     assert topic.sub_listener is not None
 
     sent: list[bool] = []
@@ -909,7 +900,7 @@ async def test_topic_demotion_cancels_gossip_and_listener_release_tracks_couplin
 
     pub.close()
     assert topic.is_implicit
-    assert topic.gossip_task is None
+    assert topic.gossip_deadline is None
 
     await asyncio.sleep(0.02)
     assert sent == []
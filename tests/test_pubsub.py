@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 
 import pytest
 
 import pycyphal2
 from pycyphal2 import Arrival, Error, LivenessError, SendError
+from pycyphal2._header import HEADER_SIZE, MsgBeHeader, MsgNackHeader, deserialize_header
 from pycyphal2._node import resolve_name
 from tests.mock_transport import MockTransport, MockNetwork
 from tests.typing_helpers import new_node, subscribe_impl
@@ -156,6 +158,31 @@ async def test_arrival_has_breadcrumb():
     node.close()
 
 
+async def test_arrival_view_shares_transport_buffer():
+    """The arrival payload is a view of the transport buffer; the bytes copy is made only when asked for."""
+    tr = MockTransport(node_id=1)
+    node = new_node(tr, home="test_node")
+    sub = subscribe_impl(node, "my/topic")
+    topic = node.topics_by_name[resolve_name("my/topic", "test_node", "")[0]]
+    buf = bytearray(MsgBeHeader(0, topic.evictions, topic.hash, 1).serialize() + b"large payload")
+    transport_arrival = pycyphal2.TransportArrival(
+        timestamp=pycyphal2.Instant.now(), priority=pycyphal2.Priority.NOMINAL, remote_id=42, message=memoryview(buf)
+    )
+    node.dispatch_arrival(transport_arrival, subject_id=None, unicast=True)
+
+    arrival = sub.queue.get_nowait()
+    assert isinstance(arrival, Arrival)
+    assert arrival.view.obj is buf
+    assert arrival.view.readonly
+    assert bytes(arrival.view) == b"large payload"
+    assert arrival.message == b"large payload"
+    assert isinstance(arrival.message, bytes)
+    assert arrival.message is arrival.message
+
+    sub.close()
+    node.close()
+
+
 # =====================================================================================================================
 # Multiple subscribers on same topic
 # =====================================================================================================================
@@ -378,6 +405,356 @@ async def test_subscriber_timeout_resets_on_message():
     node.close()
 
 
+async def test_subscriber_timeout_served_by_timer_wheel():
+    """A stream of messages under a finite timeout keeps at most one wheel entry, which is gone once closed."""
+    net = MockNetwork()
+    tr = MockTransport(node_id=1, network=net)
+    node = new_node(tr, home="test_node")
+
+    pub = node.advertise("my/topic")
+    sub = node.subscribe("my/topic")
+    sub.timeout = 0.2
+    entries = len(node.timer_wheel)
+
+    for i in range(10):
+        await pub(pycyphal2.Instant.now() + 1.0, bytes([i]))
+        arrival = await asyncio.wait_for(sub.__anext__(), timeout=1.0)
+        assert arrival.message == bytes([i])
+        assert len(node.timer_wheel) <= entries + 1
+
+    # The entry scheduled by the first wait is moved forward rather than firing early.
+    started = asyncio.get_running_loop().time()
+    with pytest.raises(LivenessError):
+        await sub.__anext__()
+    assert asyncio.get_running_loop().time() - started >= 0.2 - node.timer_wheel.resolution
+
+    sub.close()
+    assert len(node.timer_wheel) == entries
+    pub.close()
+    node.close()
+
+
+# =====================================================================================================================
+# Batch receive
+# =====================================================================================================================
+
+
+async def test_receive_batch_drains_queued_arrivals_in_order():
+    net = MockNetwork()
+    tr = MockTransport(node_id=1, network=net)
+    node = new_node(tr, home="test_node")
+
+    pub = node.advertise("my/topic")
+    sub = node.subscribe("my/topic")
+    for i in range(5):
+        await pub(pycyphal2.Instant.now() + 1.0, f"msg{i}".encode())
+
+    first = await sub.receive_batch(3)
+    rest = await sub.receive_batch(10)
+    assert [a.message for a in first + rest] == [f"msg{i}".encode() for i in range(5)]
+    assert len(first) == 3
+
+    with pytest.raises(ValueError):
+        await sub.receive_batch(0)
+    with pytest.raises(ValueError):
+        await sub.receive_batch(1, -1.0)
+
+    pub.close()
+    sub.close()
+    node.close()
+
+
+async def test_receive_batch_coalesces_until_count_or_linger():
+    net = MockNetwork()
+    tr = MockTransport(node_id=1, network=net)
+    node = new_node(tr, home="test_node")
+
+    pub = node.advertise("my/topic")
+    sub = node.subscribe("my/topic")
+
+    # The count threshold ends the batch long before the linger.
+    task = asyncio.create_task(sub.receive_batch(3, 10.0))
+    for i in range(3):
+        await asyncio.sleep(0.01)
+        assert not task.done()
+        await pub(pycyphal2.Instant.now() + 1.0, f"a{i}".encode())
+    batch = await asyncio.wait_for(task, timeout=1.0)
+    assert [a.message for a in batch] == [b"a0", b"a1", b"a2"]
+
+    # The linger ends the batch when the count is not reached; it starts with the first arrival.
+    task = asyncio.create_task(sub.receive_batch(100, 0.05))
+    await asyncio.sleep(0.1)
+    assert not task.done()
+    await pub(pycyphal2.Instant.now() + 1.0, b"b0")
+    await pub(pycyphal2.Instant.now() + 1.0, b"b1")
+    batch = await asyncio.wait_for(task, timeout=1.0)
+    assert [a.message for a in batch] == [b"b0", b"b1"]
+
+    pub.close()
+    sub.close()
+    node.close()
+
+
+async def test_receive_batch_liveness_error_per_batch():
+    net = MockNetwork()
+    tr = MockTransport(node_id=1, network=net)
+    node = new_node(tr, home="test_node")
+
+    pub = node.advertise("my/topic")
+    sub = node.subscribe("my/topic")
+    sub.timeout = 0.05
+
+    with pytest.raises(LivenessError):
+        await sub.receive_batch(10, 1.0)
+
+    # The linger does not count towards the liveness timeout once the first arrival is in.
+    task = asyncio.create_task(sub.receive_batch(10, 0.2))
+    await pub(pycyphal2.Instant.now() + 1.0, b"ok")
+    batch = await asyncio.wait_for(task, timeout=1.0)
+    assert [a.message for a in batch] == [b"ok"]
+
+    with pytest.raises(LivenessError):
+        await sub.receive_batch(10)
+
+    pub.close()
+    sub.close()
+    node.close()
+
+
+async def test_batches_iteration_ends_on_close():
+    net = MockNetwork()
+    tr = MockTransport(node_id=1, network=net)
+    node = new_node(tr, home="test_node")
+
+    pub = node.advertise("my/topic")
+    sub = node.subscribe("my/topic")
+    received: list[bytes] = []
+
+    async def consume() -> None:
+        async for batch in sub.batches(4, 10.0):
+            received.extend(a.message for a in batch)
+
+    task = asyncio.create_task(consume())
+    for i in range(6):
+        await pub(pycyphal2.Instant.now() + 1.0, f"msg{i}".encode())
+    await asyncio.sleep(0.01)
+    assert received == [f"msg{i}".encode() for i in range(4)]
+
+    sub.close()  # The partial batch is returned before the iteration ends.
+    await asyncio.wait_for(task, timeout=1.0)
+    assert received == [f"msg{i}".encode() for i in range(6)]
+    with pytest.raises(StopAsyncIteration):
+        await sub.receive_batch(1)
+
+    pub.close()
+    node.close()
+
+
+# =====================================================================================================================
+# Bounded queues
+# =====================================================================================================================
+
+
+@pytest.mark.parametrize(
+    "overflow, kept",
+    [
+        (pycyphal2.Overflow.DROP_OLDEST, [b"msg2", b"msg3", b"msg4"]),
+        (pycyphal2.Overflow.DROP_NEWEST, [b"msg0", b"msg1", b"msg2"]),
+        (pycyphal2.Overflow.REJECT, [b"msg0", b"msg1", b"msg2"]),
+    ],
+)
+async def test_subscriber_capacity_overflow(overflow: pycyphal2.Overflow, kept: list[bytes]) -> None:
+    net = MockNetwork()
+    tr = MockTransport(node_id=1, network=net)
+    node = new_node(tr, home="test_node")
+
+    pub = node.advertise("my/topic")
+    sub = node.subscribe("my/topic", capacity=3, overflow=overflow)
+    for i in range(5):
+        await pub(pycyphal2.Instant.now() + 1.0, f"msg{i}".encode())
+
+    assert sub.dropped == 2
+    assert [a.message for a in await sub.receive_batch(10)] == kept
+
+    with pytest.raises(ValueError):
+        node.subscribe("my/topic", capacity=0)
+
+    pub.close()
+    sub.close()
+    node.close()
+
+
+async def test_subscriber_drop_oldest_keeps_errors() -> None:
+    """DROP_OLDEST evicts the oldest arrival, never a queued error; with only errors queued, the new arrival goes."""
+    tr = MockTransport(node_id=1)
+    node = new_node(tr, home="test_node")
+    pub = node.advertise("my/topic")
+    sub = subscribe_impl(node, "my/topic", capacity=2)
+
+    sub._enqueue(pycyphal2.LivenessError("stalled"))
+    for i in range(2):
+        await pub(pycyphal2.Instant.now() + 1.0, f"msg{i}".encode())
+    assert (sub.queue.qsize(), sub.dropped) == (2, 1)
+    with pytest.raises(LivenessError):
+        await sub.__anext__()
+    assert (await sub.__anext__()).message == b"msg1"
+
+    sub._enqueue(pycyphal2.LivenessError("first"))
+    sub._enqueue(pycyphal2.LivenessError("second"))
+    await pub(pycyphal2.Instant.now() + 1.0, b"msg2")
+    assert (sub.queue.qsize(), sub.dropped) == (2, 2)
+
+    pub.close()
+    sub.close()
+    node.close()
+
+
+async def test_subscriber_capacity_reject_nacks_reliable():
+    """A full subscriber with the REJECT policy NACKs reliable messages instead of silently dropping them."""
+    net = MockNetwork()
+    tr_pub = MockTransport(node_id=1, network=net)
+    tr_sub = MockTransport(node_id=2, network=net)
+    node_pub = new_node(tr_pub, home="pub")
+    node_sub = new_node(tr_sub, home="sub")
+
+    sub = node_sub.subscribe("my/topic", capacity=1, overflow=pycyphal2.Overflow.REJECT)
+    pub = node_pub.advertise("my/topic")
+
+    await pub(pycyphal2.Instant.now() + 1.0, b"fits", reliable=True)
+    with pytest.raises(pycyphal2.DeliveryError):
+        await pub(pycyphal2.Instant.now() + 0.2, b"rejected", reliable=True)
+    assert sub.dropped >= 1
+    replies = [deserialize_header(message[:HEADER_SIZE]) for _, message in tr_sub.unicast_log]
+    assert any(isinstance(hdr, MsgNackHeader) for hdr in replies)
+
+    # Once the consumer catches up, reliable messages are accepted again.
+    assert (await sub.__anext__()).message == b"fits"
+    await pub(pycyphal2.Instant.now() + 1.0, b"again", reliable=True)
+    assert (await sub.__anext__()).message == b"again"
+
+    pub.close()
+    sub.close()
+    node_pub.close()
+    node_sub.close()
+
+
+async def test_reliable_dedup_forgets_only_rejected_messages() -> None:
+    """A message NACK'd by a full REJECT queue is new when retransmitted; one dropped as late stays a duplicate."""
+    tr = MockTransport(node_id=1)
+    node = new_node(tr, home="n1")
+    pub = node.advertise("my/topic")
+    topic = node.topics_by_name["my/topic"]
+
+    def arrival(remote_id: int) -> pycyphal2.TransportArrival:
+        return pycyphal2.TransportArrival(
+            timestamp=pycyphal2.Instant.now(), priority=pycyphal2.Priority.NOMINAL, remote_id=remote_id, message=b""
+        )
+
+    full = node.subscribe("my/topic", capacity=1, overflow=pycyphal2.Overflow.REJECT)
+    assert node.accept_message(topic, arrival(10), 1, b"fits", reliable=True)
+    assert not node.accept_message(topic, arrival(10), 2, b"rejected", reliable=True)
+    assert (await full.__anext__()).message == b"fits"
+    assert node.accept_message(topic, arrival(10), 2, b"rejected", reliable=True)
+    assert (await full.__anext__()).message == b"rejected"
+    full.close()
+
+    ordered = node.subscribe("my/topic", reordering_window=1.0)
+    assert node.accept_message(topic, arrival(20), 100, b"first", reliable=True)
+    assert not node.accept_message(topic, arrival(20), 50, b"late", reliable=True)
+    assert node.accept_message(topic, arrival(20), 50, b"late", reliable=True)  # Duplicate, ACK'd without delivery.
+    ordered.close()
+
+    pub.close()
+    node.close()
+
+
+# =====================================================================================================================
+# Shared subscriptions
+# =====================================================================================================================
+
+
+async def test_shared_subscribers_read_one_ring():
+    """Shared subscribers of one name see every arrival at their own pace; each arrival is stored once."""
+    net = MockNetwork()
+    tr = MockTransport(node_id=1, network=net)
+    node = new_node(tr, home="test_node")
+
+    pub = node.advertise("my/topic")
+    sub_a = subscribe_impl(node, "my/topic", shared=True)
+    sub_b = subscribe_impl(node, "my/topic", shared=True)
+    private = subscribe_impl(node, "my/topic")
+    topic = node.topics_by_name["my/topic"]
+    root = node.sub_roots_verbatim["my/topic"]
+    assert root.ring is not None
+    assert sub_a.shared and not private.shared
+    assert topic.delivery_plan().subscribers == (private,)
+    assert topic.delivery_plan().rings == (root.ring,)
+
+    for i in range(3):
+        await pub(pycyphal2.Instant.now() + 1.0, f"msg{i}".encode())
+    assert [a.message for a in await sub_a.receive_batch(10)] == [b"msg0", b"msg1", b"msg2"]
+    assert root.ring.head == 0  # Still needed by sub_b.
+    assert (await asyncio.wait_for(sub_b.__anext__(), timeout=1.0)).message == b"msg0"
+    assert root.ring.head == 1
+
+    # A late subscriber starts at the end of the ring and is picked up by the cached plan.
+    sub_c = subscribe_impl(node, "my/topic", shared=True)
+    task = asyncio.create_task(sub_c.__anext__())
+    await asyncio.sleep(0)
+    await pub(pycyphal2.Instant.now() + 1.0, b"late")
+    assert (await asyncio.wait_for(task, timeout=1.0)).message == b"late"
+    assert [a.message for a in await sub_b.receive_batch(10)] == [b"msg1", b"msg2", b"late"]
+
+    # Closing releases whatever the subscriber has not read yet.
+    sub_a.close()
+    sub_c.close()
+    assert root.ring.head == root.ring.tail
+    with pytest.raises(StopAsyncIteration):
+        await sub_a.__anext__()
+
+    pub.close()
+    sub_b.close()
+    private.close()
+    node.close()
+
+
+async def test_shared_subscriber_capacity_and_inline():
+    """A lagging shared subscriber skips the oldest arrivals; an inline callback takes it off the ring."""
+    net = MockNetwork()
+    tr = MockTransport(node_id=1, network=net)
+    node = new_node(tr, home="test_node")
+
+    pub = node.advertise("my/topic")
+    sub_a = subscribe_impl(node, "my/topic", shared=True, capacity=2)
+    sub_b = subscribe_impl(node, "my/topic", shared=True, capacity=4)
+    root = node.sub_roots_verbatim["my/topic"]
+    assert root.ring is not None
+    for i in range(5):
+        await pub(pycyphal2.Instant.now() + 1.0, f"msg{i}".encode())
+    assert root.ring.tail - root.ring.head == 4  # Nobody needs more than the greatest capacity.
+    assert sub_a.full
+    assert [a.message for a in await sub_a.receive_batch(10)] == [b"msg3", b"msg4"]
+    assert sub_a.dropped == 3
+
+    received: list[bytes] = []
+    sub_b.listen_inline(lambda arrival: received.append(arrival.message))
+    assert received == [b"msg1", b"msg2", b"msg3", b"msg4"]
+    assert (sub_b.dropped, sub_b.shared) == (1, False)
+    await pub(pycyphal2.Instant.now() + 1.0, b"msg5")
+    assert received[-1] == b"msg5"
+    assert (await asyncio.wait_for(sub_a.__anext__(), timeout=1.0)).message == b"msg5"
+
+    with pytest.raises(ValueError):
+        node.subscribe("my/topic", shared=True, reordering_window=0.1)
+    with pytest.raises(ValueError):
+        node.subscribe("my/topic", shared=True, overflow=pycyphal2.Overflow.REJECT)
+
+    pub.close()
+    sub_a.close()
+    sub_b.close()
+    node.close()
+
+
 # =====================================================================================================================
 # Publisher close
 # =====================================================================================================================
@@ -538,6 +915,35 @@ async def test_subscriber_close_pattern_cleans_up():
     node.close()
 
 
+async def test_pattern_root_tracks_coupled_topics():
+    """Each root knows its coupled topics, so coupling and decoupling need not scan the topic table."""
+    net = MockNetwork()
+    tr = MockTransport(node_id=1, network=net)
+    node = new_node(tr, home="n")
+
+    pubs = [node.advertise(f"/sensor/{i}/data") for i in range(3)]
+    other = node.advertise("/actuator/0/data")
+    sub = node.subscribe("/sensor/*/data")
+    root = node.sub_roots_pattern["sensor/*/data"]
+    assert [t.name for t in root.topics] == [f"sensor/{i}/data" for i in range(3)]
+
+    late = node.advertise("/sensor/9/data")
+    assert node.topics_by_name["sensor/9/data"] in root.topics
+    assert node.sub_roots_pattern_index.match_name("sensor/9/data") == [root]
+
+    node.destroy_topic("sensor/0/data")
+    assert "sensor/0/data" not in {t.name for t in root.topics}
+
+    sub.close()
+    assert not root.topics
+    assert not node.sub_roots_pattern_index.match_name("sensor/9/data")
+    assert all(not t.couplings for t in node.topics_by_name.values())
+
+    for p in [*pubs, other, late]:
+        p.close()
+    node.close()
+
+
 # =====================================================================================================================
 # Two-node publish/subscribe
 # =====================================================================================================================
@@ -807,3 +1213,89 @@ async def test_listen_callback_exception_fails_task(caplog: pytest.LogCaptureFix
     pub.close()
     sub.close()
     node.close()
+
+
+async def test_listen_inline_bypasses_queue():
+    """Inline callbacks are invoked at dispatch time, after the arrivals that were already queued."""
+    net = MockNetwork()
+    tr = MockTransport(node_id=1, network=net)
+    node = new_node(tr, home="test_node")
+
+    pub = node.advertise("my/topic")
+    sub = node.subscribe("my/topic")
+    received: list[bytes] = []
+
+    await pub(pycyphal2.Instant.now() + 1.0, b"queued")
+    handle = sub.listen_inline(lambda arrival: received.append(arrival.message))
+    assert received == [b"queued"]
+    with pytest.raises(ValueError):
+        sub.listen_inline(lambda _: None)
+
+    await pub(pycyphal2.Instant.now() + 1.0, b"inline")
+    assert received == [b"queued", b"inline"]  # No task switch was needed.
+
+    handle.close()
+    await pub(pycyphal2.Instant.now() + 1.0, b"after")
+    assert received == [b"queued", b"inline"]
+    assert (await asyncio.wait_for(sub.__anext__(), timeout=1.0)).message == b"after"
+
+    pub.close()
+    sub.close()
+    node.close()
+
+
+async def test_listen_inline_isolates_errors_and_reports_overruns(caplog: pytest.LogCaptureFixture) -> None:
+    net = MockNetwork()
+    tr = MockTransport(node_id=1, network=net)
+    node = new_node(tr, home="test_node")
+
+    pub = node.advertise("my/topic")
+    sub = node.subscribe("my/topic")
+    received: list[bytes] = []
+
+    def cb(arrival: Arrival) -> None:
+        if arrival.message == b"bad":
+            raise ValueError("callback bug")
+        if arrival.message == b"slow":
+            time.sleep(0.01)
+        received.append(arrival.message)
+
+    sub.listen_inline(cb, budget=0.005)
+    with caplog.at_level(logging.WARNING, logger="pycyphal2._subscriber"):
+        for message in (b"bad", b"slow", b"good"):
+            await pub(pycyphal2.Instant.now() + 1.0, message)
+
+    assert received == [b"slow", b"good"]
+    assert any("failed" in rec.message for rec in caplog.records)
+    assert any("over its" in rec.message for rec in caplog.records)
+
+    pub.close()
+    sub.close()
+    node.close()
+
+
+async def test_breadcrumb_built_lazily_and_shared():
+    """The breadcrumb is only built on access, and subscribers of the same message share one instance."""
+    net = MockNetwork()
+    tr = MockTransport(node_id=1, network=net)
+    node = new_node(tr, home="test_node")
+
+    pub = node.advertise("my/topic")
+    sub_a = node.subscribe("my/topic")
+    sub_b = node.subscribe("my/*")
+
+    await pub(pycyphal2.Instant.now() + 1.0, b"hello")
+    arr_a = await asyncio.wait_for(sub_a.__anext__(), timeout=1.0)
+    arr_b = await asyncio.wait_for(sub_b.__anext__(), timeout=1.0)
+    assert arr_a is arr_b
+    assert arr_a._breadcrumb is None
+
+    bc = arr_a.breadcrumb
+    assert bc is arr_b.breadcrumb
+    assert bc.remote_id == 1
+    assert bc.topic.name == "my/topic"
+
+    pub.close()
+    sub_a.close()
+    sub_b.close()
+    node.close()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import random
 
 import pytest
 
@@ -10,13 +11,16 @@ import pycyphal2
 from pycyphal2._hash import rapidhash
 from pycyphal2._node import (
     Association,
+    ACK_RTT_TIMEOUT_MIN,
     DedupState,
     GossipScope,
     PublishTracker,
+    RttEstimator,
     compute_subject_id,
     DEDUP_HISTORY,
+    SESSION_LIFETIME,
 )
-from pycyphal2._publisher import ResponseStreamImpl
+from pycyphal2._publisher import IN_FLIGHT_WINDOW_INITIAL, InFlightWindow, ResponseStreamImpl
 from pycyphal2._subscriber import BreadcrumbImpl, RespondTracker
 from pycyphal2._header import (
     HEADER_SIZE,
@@ -34,7 +38,7 @@ from pycyphal2._header import (
 )
 from pycyphal2._transport import TransportArrival
 from tests.mock_transport import MockTransport, MockNetwork
-from tests.typing_helpers import expect_mock_writer, expect_response, new_node, subscribe_impl
+from tests.typing_helpers import advertise_impl, expect_mock_writer, expect_response, new_node, subscribe_impl
 
 
 class _CountingFailingWriter(pycyphal2.SubjectWriter):
@@ -119,9 +123,7 @@ async def test_reliable_publish_with_ack():
 
         # Find the tracker and simulate ACK.
         for tag, tracker in topic.publish_futures.items():
-            tracker.remaining.discard(42)
-            tracker.acknowledged = True
-            tracker.ack_event.set()
+            tracker.on_ack(42, True)
             break
 
         await pub_task  # Should succeed now.
@@ -296,6 +298,192 @@ async def test_publisher_priority_and_ack_timeout():
     node.close()
 
 
+async def test_in_flight_window_aimd():
+    """The window grows by one per ACK in slow start, halves once per loss event, then grows additively."""
+    window = InFlightWindow(asyncio.get_running_loop(), 64)
+    assert window.size == IN_FLIGHT_WINDOW_INITIAL
+    for _ in range(8):
+        window.on_ack()
+    assert window.size == IN_FLIGHT_WINDOW_INITIAL + 8
+
+    tickets = [await window.acquire(pycyphal2.Instant.now() + 1.0) for _ in range(4)]
+    window.on_loss(tickets[0])
+    assert window.size == (IN_FLIGHT_WINDOW_INITIAL + 8) // 2
+    window.on_loss(tickets[3])  # Admitted before the reduction, so part of the same loss event.
+    assert window.size == (IN_FLIGHT_WINDOW_INITIAL + 8) // 2
+
+    for _ in range(window.size + 1):
+        window.on_ack()
+    assert window.size == (IN_FLIGHT_WINDOW_INITIAL + 8) // 2 + 1  # Congestion avoidance: one per window.
+
+    for _ in range(3000):
+        window.on_ack()
+    assert window.size == 64  # Capped by the limit.
+    for _ in tickets:
+        window.release()
+    for _ in range(7):  # Every loss event in a row halves the window, down to one.
+        ticket = await window.acquire(pycyphal2.Instant.now() + 1.0)
+        window.release()
+        window.on_loss(ticket)
+    assert window.size == 1
+    assert window.in_flight == 0
+
+
+async def test_in_flight_window_waiters():
+    """Callers beyond the window wait in FIFO order, give up at their deadline, and never leak a slot."""
+    window = InFlightWindow(asyncio.get_running_loop(), 2)
+    now = pycyphal2.Instant.now()
+    await window.acquire(now + 1.0)
+    await window.acquire(now + 1.0)
+    assert window.in_flight == 2
+
+    with pytest.raises(pycyphal2.SendError):
+        await window.acquire(now + 0.01)
+    with pytest.raises(pycyphal2.SendError):
+        await window.acquire(now)
+
+    first = asyncio.create_task(window.acquire(now + 1.0))
+    cancelled = asyncio.create_task(window.acquire(now + 1.0))
+    last = asyncio.create_task(window.acquire(now + 1.0))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    window.release()
+    assert await first == 2
+    window.release()
+    assert await last == 3
+    assert cancelled.cancelled()
+    assert window.in_flight == 2
+
+    # A slot granted to a caller that is cancelled before resuming goes back to the window.
+    granted = asyncio.create_task(window.acquire(now + 1.0))
+    await asyncio.sleep(0)
+    window.release()
+    granted.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await granted
+    assert window.in_flight == 1
+
+    window.set_limit(None)
+    assert window.size > 1_000_000
+    window.release()
+    assert window.in_flight == 0
+
+
+async def test_reliable_publish_waits_for_in_flight_slot():
+    """Reliable publications beyond max_in_flight are held back until one in flight completes."""
+    tr = MockTransport(node_id=1)
+    node = new_node(tr, home="n1")
+    pub = node.advertise("/topic")
+    topic = node.topics_by_name["topic"]
+    topic.associations[42] = Association(remote_id=42, last_seen=0.0)
+    with pytest.raises(ValueError):
+        pub.max_in_flight = 0
+    pub.max_in_flight = 2
+    assert pub.in_flight_window == 2
+
+    tasks = [asyncio.create_task(pub(pycyphal2.Instant.now() + 1.0, b"data", reliable=True)) for _ in range(3)]
+    await asyncio.sleep(0.001)
+    assert len(topic.publish_futures) == 2
+    first = min(topic.publish_futures)
+    topic.publish_futures[first].on_ack(42, True)
+    await tasks[0]
+    await asyncio.sleep(0.001)
+    assert len(topic.publish_futures) == 2  # The third one took the freed slot.
+    for tracker in list(topic.publish_futures.values()):
+        tracker.on_ack(42, True)
+    await asyncio.gather(*tasks)
+    assert topic.publish_futures == {}
+
+    pub.max_in_flight = None
+    assert pub.max_in_flight is None
+    pub.close()
+    node.close()
+
+
+async def test_retransmission_unicasts_to_few_laggards():
+    """Retransmissions go by unicast to each remaining subscriber while they are few, by multicast otherwise."""
+    net = MockNetwork()
+    tr = MockTransport(node_id=1, network=net)
+    node = new_node(tr, home="n1")
+    pub = advertise_impl(node, "/topic")
+    topic = node.topics_by_name["topic"]
+    topic.associations = {rid: Association(remote_id=rid, last_seen=0.0) for rid in range(10, 18)}
+    writer = expect_mock_writer(topic.ensure_writer())
+    tracker = pub._prepare_reliable_publish_tracker(topic.next_tag())
+    deadline = pycyphal2.Instant.now() + 1.0
+
+    async def retransmit() -> None:
+        await pub._send_reliable_publish(deadline, b"data", tracker, first_attempt=False)
+
+    assert pub.unicast_retransmit_ratio == 0.25
+    for rid in range(10, 16):
+        tracker.on_ack(rid, True)
+    await retransmit()  # 2 of 8 left.
+    assert [rid for rid, _ in tr.unicast_log] == [16, 17]
+    assert writer.send_count == 0
+    assert (pub.retransmissions_multicast, pub.retransmissions_unicast) == (0, 2)
+
+    tracker.remaining = {13, 14, 15, 16, 17}
+    await retransmit()
+    assert writer.send_count == 1
+    assert (pub.retransmissions_multicast, pub.retransmissions_unicast) == (1, 2)
+
+    pub.unicast_retransmit_ratio = 1.0
+    await retransmit()
+    assert (pub.retransmissions_multicast, pub.retransmissions_unicast) == (1, 7)
+
+    pub.unicast_retransmit_ratio = 0.0
+    tracker.remaining = {17}
+    await retransmit()  # A single laggard is always unicast.
+    tracker.remaining = {16, 17}
+    await retransmit()
+    tracker.remaining = set()
+    await retransmit()
+    assert (pub.retransmissions_multicast, pub.retransmissions_unicast) == (3, 8)
+    assert writer.send_count == 3
+
+    with pytest.raises(ValueError):
+        pub.unicast_retransmit_ratio = 1.5
+
+    pub._release_reliable_publish_tracker(tracker.tag, tracker)
+    pub.close()
+    node.close()
+
+
+async def test_retransmission_reuses_serialized_message_until_header_changes(monkeypatch: pytest.MonkeyPatch) -> None:
+    tr = MockTransport(node_id=1)
+    node = new_node(tr, home="n1")
+    pub = advertise_impl(node, "/topic")
+    topic = node.topics_by_name["topic"]
+    topic.associations = {42: Association(remote_id=42, last_seen=0.0)}
+    tracker = pub._prepare_reliable_publish_tracker(topic.next_tag())
+    deadline = pycyphal2.Instant.now() + 1.0
+    sent: list[bytes | memoryview] = []
+
+    async def unicast(
+        deadline: pycyphal2.Instant, priority: pycyphal2.Priority, remote_id: int, message: bytes | memoryview
+    ) -> None:
+        del deadline, priority, remote_id
+        sent.append(message)
+
+    monkeypatch.setattr(tr, "unicast", unicast)
+    for _ in range(3):
+        await pub._send_reliable_publish(deadline, b"data", tracker, first_attempt=False)
+    assert sent[0] is sent[1] is sent[2] is tracker.message
+
+    topic.set_evictions(topic.evictions + 1)  # A reallocation changes the header, so the message is rebuilt.
+    await pub._send_reliable_publish(deadline, b"data", tracker, first_attempt=False)
+    assert sent[3] is not sent[0]
+    hdr = MsgRelHeader.deserialize(bytes(sent[3][:HEADER_SIZE]))
+    assert hdr is not None and hdr.topic_evictions == topic.evictions
+    assert bytes(sent[3][HEADER_SIZE:]) == b"data"
+
+    topic.set_evictions(topic.evictions - 1)
+    pub._release_reliable_publish_tracker(tracker.tag, tracker)
+    pub.close()
+    node.close()
+
+
 # =====================================================================================================================
 # Request / Response
 # =====================================================================================================================
@@ -377,6 +565,9 @@ def test_dedup_state_basic():
     assert ds.check_and_record(100, 1.0) is False  # duplicate
     assert ds.check_and_record(101, 1.0) is True
     assert ds.check_and_record(102, 1.0) is True
+    ds.forget(101)  # Not accepted by the application after all, so its retransmission is new.
+    assert ds.check_and_record(101, 1.0) is True
+    assert ds.check_and_record(101, 1.0) is False
 
 
 def test_dedup_state_frontier_prune():
@@ -391,6 +582,63 @@ def test_dedup_state_frontier_prune():
     assert ds.check_and_record(0, 1.0) is True
 
 
+def test_dedup_state_ring_reuses_slots():
+    """Slots reused by newer tags must not report the older tags that used to occupy them."""
+    ds = DedupState()
+    assert ds.check_and_record(5, 1.0) is True
+    assert ds.check_and_record(3, 1.0) is True
+    assert ds.check(3) and ds.check(5) and not ds.check(4)
+    # Jump ahead so that the slots of 3 and 5 are taken by 3 + DEDUP_HISTORY and 5 + DEDUP_HISTORY.
+    assert ds.check_and_record(4 + DEDUP_HISTORY, 1.0) is True
+    assert not ds.check(3)
+    assert ds.check(5)  # Still within the history.
+    assert not ds.check(3 + DEDUP_HISTORY)
+    assert ds.check_and_record(3 + DEDUP_HISTORY, 1.0) is True
+    assert ds.check_and_record(3 + DEDUP_HISTORY, 1.0) is False
+    assert ds.check_and_record(5 + DEDUP_HISTORY, 1.0) is True
+    assert not ds.check(5)
+
+
+def test_dedup_state_forward_jumps_match_reference():
+    """Jumps of any length clear exactly the skipped tags, including across the end of the ring and of the tag space."""
+    rng = random.Random(1)
+    for origin in (0, (1 << 64) - 300):
+        ds = DedupState(tag_frontier=origin)
+        seen: set[int] = set()
+        frontier = origin
+        for _ in range(2000):
+            step = rng.choice([1, 2, 7, 8, 9, 63, 64, 65, rng.randrange(DEDUP_HISTORY + 10), -rng.randrange(20)])
+            tag = (frontier + step) & ((1 << 64) - 1)
+            behind = (frontier - tag) & ((1 << 64) - 1)
+            expected = tag not in seen if behind < DEDUP_HISTORY else True
+            assert ds.check_and_record(tag, 1.0) is expected
+            if behind >= DEDUP_HISTORY:
+                frontier = tag
+            seen.add(tag)
+            seen = {t for t in seen if ((frontier - t) & ((1 << 64) - 1)) < DEDUP_HISTORY}
+            assert ds.tag_frontier == frontier
+            assert {t for t in range(frontier - DEDUP_HISTORY + 1, frontier + 1) if ds.check(t & ((1 << 64) - 1))} == {
+                t if t <= frontier else t - (1 << 64) for t in seen
+            }
+
+
+async def test_dedup_sweep_drops_idle_remotes():
+    net = MockNetwork()
+    tr = MockTransport(node_id=1, network=net)
+    node = new_node(tr, home="n1")
+    pub = node.advertise("/topic")
+    topic = node.topics_by_name["topic"]
+
+    for remote_id in range(100):
+        topic.dedup[remote_id] = DedupState(tag_frontier=1, last_active=float(remote_id))
+    assert node.sweep_dedup(50.0 + SESSION_LIFETIME) == 50
+    assert sorted(topic.dedup) == list(range(50, 100))
+    assert node.sweep_dedup(50.0 + SESSION_LIFETIME) == 0
+
+    pub.close()
+    node.close()
+
+
 # =====================================================================================================================
 # Gossip Handling via Transport Message
 # =====================================================================================================================
@@ -533,7 +781,6 @@ async def test_msg_ack_dispatch():
     tracker = PublishTracker(
         tag=tag,
         remaining={42},
-        ack_event=asyncio.Event(),
     )
     topic.publish_futures[tag] = tracker
 
@@ -551,7 +798,7 @@ async def test_msg_ack_dispatch():
     # Tracker should be updated.
     assert tracker.acknowledged is True
     assert 42 not in tracker.remaining
-    assert tracker.ack_event.is_set()
+    assert tracker.done
 
     # Association should be created.
     assert 42 in topic.associations
@@ -573,7 +820,6 @@ async def test_msg_nack_dispatch():
     tracker = PublishTracker(
         tag=tag,
         remaining={42},
-        ack_event=asyncio.Event(),
     )
     topic.publish_futures[tag] = tracker
 
@@ -709,7 +955,6 @@ async def test_respond_tracker_ack():
     tracker.on_ack(True)
     assert tracker.done
     assert not tracker.nacked
-    assert tracker.ack_event.is_set()
 
 
 async def test_respond_tracker_nack():
@@ -720,6 +965,151 @@ async def test_respond_tracker_nack():
     assert tracker.nacked
 
 
+async def test_ack_scheduler_wakes_on_ack_or_window_expiry():
+    """The AckScheduler resumes a waiter on its last ACK or at its deadline, whichever comes first."""
+    tr = MockTransport(node_id=1)
+    node = new_node(tr, home="n1")
+    scheduler = node.ack_scheduler
+
+    acked = PublishTracker(tag=1, remaining={42})
+    expiring = RespondTracker(remote_id=1, message_tag=2, topic_hash=3, seqno=4, tag=5)
+    started = pycyphal2.Instant.now()
+    acked_task = asyncio.create_task(scheduler.wait(acked, (started + 10.0).ns))
+    expiring_task = asyncio.create_task(scheduler.wait(expiring, (started + 0.05).ns))
+    await asyncio.sleep(0.01)
+    assert len(scheduler) == 2
+    assert acked.waiter is not None and expiring.waiter is not None
+
+    acked.on_ack(42, True)
+    await asyncio.wait_for(acked_task, timeout=1.0)
+    assert acked.waiter is None
+    assert not expiring_task.done()
+
+    await asyncio.wait_for(expiring_task, timeout=1.0)
+    assert pycyphal2.Instant.now().ns - started.ns >= 50_000_000
+    assert expiring.waiter is None and not expiring.done
+    assert len(scheduler) == 0  # The ACKed window was dropped lazily once it reached the heap top.
+
+    # A done tracker or an elapsed deadline returns at once without touching the heap.
+    await scheduler.wait(acked, (pycyphal2.Instant.now() + 10.0).ns)
+    await scheduler.wait(expiring, started.ns)
+    assert len(scheduler) == 0
+    node.close()
+
+
+def test_rtt_estimator_smoothing():
+    rtt = RttEstimator()
+    rtt.sample(0.010, 1.0)
+    assert (rtt.srtt, rtt.rttvar) == pytest.approx((0.010, 0.005))
+    assert rtt.timeout == pytest.approx(0.030)
+    rtt.sample(0.002, 2.0)
+    assert rtt.srtt == pytest.approx(0.009)
+    assert rtt.rttvar == pytest.approx(0.00575)
+    assert rtt.samples == 2 and rtt.last_sample == 2.0
+    for _ in range(100):
+        rtt.sample(0.0, 3.0)
+    assert rtt.timeout == ACK_RTT_TIMEOUT_MIN
+
+
+async def test_reliable_publish_initial_ack_timeout_follows_rtt():
+    """Once every subscriber has been timed, the initial ACK window comes from the RTT instead of the baseline."""
+    net = MockNetwork()
+    tr_pub = MockTransport(node_id=1, network=net)
+    tr_sub = MockTransport(node_id=2, network=net)
+    node_pub = new_node(tr_pub, home="pub")
+    node_sub = new_node(tr_sub, home="sub")
+    sub = node_sub.subscribe("my/topic")
+    pub = advertise_impl(node_pub, "my/topic")
+    topic = node_pub.topics_by_name["my/topic"]
+
+    tracker = pub._prepare_reliable_publish_tracker(topic.next_tag())
+    assert tracker.ack_timeout == pub.ack_timeout  # Nothing measured yet.
+    pub._release_reliable_publish_tracker(tracker.tag, tracker)
+
+    await pub(pycyphal2.Instant.now() + 1.0, b"data", reliable=True)
+    assert set(pub.round_trip_times) == {2}
+    srtt, rttvar = pub.round_trip_times[2]
+    assert srtt < pub.ack_timeout
+    tracker = pub._prepare_reliable_publish_tracker(topic.next_tag())
+    assert tracker.ack_timeout == topic.associations[2].rtt.timeout
+    assert tracker.ack_timeout == pytest.approx(max(ACK_RTT_TIMEOUT_MIN, srtt + 4 * rttvar))
+    pub._release_reliable_publish_tracker(tracker.tag, tracker)
+
+    # A subscriber not timed yet brings back the baseline, since the window must fit all of them.
+    topic.associations[3] = Association(remote_id=3, last_seen=0.0)
+    tracker = pub._prepare_reliable_publish_tracker(topic.next_tag())
+    assert tracker.ack_timeout == pub.ack_timeout
+    pub._release_reliable_publish_tracker(tracker.tag, tracker)
+
+    pub.close()
+    sub.close()
+    node_pub.close()
+    node_sub.close()
+
+
+async def test_ack_to_retransmission_is_not_timed():
+    tr = MockTransport(node_id=1)
+    node = new_node(tr, home="n1")
+    pub = node.advertise("/topic")
+    topic = node.topics_by_name["topic"]
+
+    def ack(tag: int, remote_id: int) -> None:
+        message = MsgAckHeader(topic_hash=topic.hash, tag=tag).serialize()
+        arrival = TransportArrival(pycyphal2.Instant.now(), pycyphal2.Priority.NOMINAL, remote_id, message)
+        node.on_unicast_arrival(arrival)
+
+    retransmitted = PublishTracker(tag=topic.next_tag(), remaining={42}, retransmitted=True)
+    topic.publish_futures[retransmitted.tag] = retransmitted
+    ack(retransmitted.tag, 42)
+    assert retransmitted.done
+    assert topic.associations[42].rtt.samples == 0
+
+    once = PublishTracker(tag=topic.next_tag(), remaining={42}, sent_ns=pycyphal2.Instant.now().ns)
+    topic.publish_futures[once.tag] = once
+    ack(once.tag, 42)
+    ack(once.tag, 42)  # A duplicate is not a second sample.
+    assert topic.associations[42].rtt.samples == 1
+
+    topic.publish_futures.clear()
+    pub.close()
+    node.close()
+
+
+async def test_reliable_response_rtt_is_tracked_per_remote():
+    net = MockNetwork()
+    tr = MockTransport(node_id=1, network=net)
+    node = new_node(tr, home="n1")
+    node.advertise("/rpc")
+    topic = list(node.topics_by_name.values())[0]
+    bc = BreadcrumbImpl(
+        node=node,
+        remote_id=42,
+        topic=topic,
+        message_tag=100,
+        initial_priority=pycyphal2.Priority.NOMINAL,
+    )
+    assert bc.round_trip_time is None
+
+    async def ack_later() -> None:
+        await asyncio.sleep(0.01)
+        (tracker,) = node.respond_futures.values()
+        message = RspAckHeader(tag=tracker.tag, seqno=tracker.seqno, topic_hash=topic.hash, message_tag=100).serialize()
+        node.on_unicast_arrival(TransportArrival(pycyphal2.Instant.now(), pycyphal2.Priority.NOMINAL, 42, message))
+
+    acker = asyncio.create_task(ack_later())
+    await bc(pycyphal2.Instant.now() + 5.0, b"response", reliable=True)  # The first window is the baseline.
+    await acker
+    assert bc.round_trip_time is not None
+    srtt, _ = bc.round_trip_time
+    assert 0.01 <= srtt < 0.5
+
+    last_sample = node.responder_rtt[42].last_sample
+    assert node.sweep_responder_rtt(last_sample + SESSION_LIFETIME - 1.0) == 0
+    assert node.sweep_responder_rtt(last_sample + SESSION_LIFETIME + 1.0) == 1
+    assert bc.round_trip_time is None
+    node.close()
+
+
 # =====================================================================================================================
 # Reliable message reception and dedup via node dispatch
 # =====================================================================================================================
@@ -999,7 +1389,6 @@ async def test_multicast_msg_ack_ignored():
     tracker = PublishTracker(
         tag=tag,
         remaining={42},
-        ack_event=asyncio.Event(),
     )
     topic.publish_futures[tag] = tracker
 
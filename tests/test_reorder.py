@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import asyncio
 
+import pytest
+
 import pycyphal2
-from pycyphal2._node import REORDERING_CAPACITY, SESSION_LIFETIME
-from pycyphal2._subscriber import BreadcrumbImpl, SubscriberImpl
+from pycyphal2._node import REORDERING_CAPACITY, SESSION_LIFETIME, TimerWheel
+from pycyphal2._subscriber import REORDERING_ADAPT_WARMUP, BreadcrumbImpl, ReorderingEstimator, SubscriberImpl
 from tests.mock_transport import MockTransport, MockNetwork
 from tests.typing_helpers import expect_arrival, new_node, subscribe_impl
 
@@ -287,3 +289,188 @@ async def test_reorder_state_expires_after_session_lifetime():
 
     sub.close()
     node.close()
+
+
+async def test_reorder_stale_states_expire_in_activity_order():
+    """Idle streams are swept from the front of the activity order; forgetting a topic only touches its streams."""
+    net = MockNetwork()
+    tr = MockTransport(node_id=1, network=net)
+    node = new_node(tr, home="n1")
+    sub = subscribe_impl(node, "test/topic", reordering_window=ORDERED_WINDOW)
+
+    topic = list(node.topics_by_name.values())[0]
+    bcs = {
+        rid: BreadcrumbImpl(
+            node=node, remote_id=rid, topic=topic, message_tag=1, initial_priority=pycyphal2.Priority.NOMINAL
+        )
+        for rid in (10, 20, 30)
+    }
+    for rid, bc in bcs.items():
+        await _bootstrap_ordered(sub, bc, 100, rid, b"m0")
+
+    # Stream 20 becomes the most recently active one; 10 and 30 go idle.
+    sub._reordering[(10, topic.hash)].last_active_at -= SESSION_LIFETIME + 1.0
+    sub._reordering[(30, topic.hash)].last_active_at -= SESSION_LIFETIME + 1.0
+    sub.deliver(_make_arrival(0.0, bcs[20], b"m1"), 101, 20)
+    assert expect_arrival(sub.queue.get_nowait()).message == b"m1"
+    assert list(sub._reordering) == [(30, topic.hash), (20, topic.hash)]  # The sweep stops at the first live one.
+
+    sub.deliver(_make_arrival(0.0, bcs[20], b"m3"), 103, 20)
+    assert sub.queue.empty()
+    assert list(sub._reordering) == [(20, topic.hash)]
+    sub.forget_topic_reordering(0xDEADBEEF, silenced=False)
+    assert list(sub._reordering) == [(20, topic.hash)]
+    sub.forget_topic_reordering(topic.hash, silenced=False)
+    assert not sub._reordering
+    assert expect_arrival(sub.queue.get_nowait()).message == b"m3"
+
+    sub.close()
+    node.close()
+
+
+async def test_timer_wheel_rounds_up_and_reschedules():
+    """Deadlines fire no earlier than requested; rescheduling and cancelling replace the entry of the key."""
+    loop = asyncio.get_running_loop()
+    wheel: TimerWheel[str] = TimerWheel(loop, 0.02)
+    fired: list[tuple[str, float]] = []
+
+    def on_fire(key: str) -> None:
+        fired.append((key, loop.time()))
+        if key == "again":
+            wheel.schedule("chained", 0.0, on_fire)  # Already due: handled within the same wakeup.
+
+    start = loop.time()
+    wheel.schedule("a", start + 0.03, on_fire)
+    wheel.schedule("b", start + 0.01, on_fire)
+    wheel.schedule("b", start + 0.05, on_fire)  # Rescheduled later.
+    wheel.schedule("c", start + 0.01, on_fire)
+    wheel.cancel("c")
+    wheel.schedule("again", start + 0.01, on_fire)
+    assert len(wheel) == 3
+    assert "c" not in wheel
+
+    await asyncio.sleep(0.15)
+    assert [k for k, _ in fired] == ["again", "chained", "a", "b"]
+    assert fired[2][1] >= start + 0.03
+    assert fired[3][1] >= start + 0.05
+    assert len(wheel) == 0
+    wheel.close()
+
+    for bad in (0.0, -1.0, float("inf"), float("nan")):
+        with pytest.raises(ValueError):
+            TimerWheel(loop, bad)
+
+
+async def test_reorder_timeout_rescheduled_only_on_head_change():
+    """Interning behind the current head-of-line does not touch the timer wheel."""
+    net = MockNetwork()
+    tr = MockTransport(node_id=1, network=net)
+    node = new_node(tr, home="n1")
+    sub = subscribe_impl(node, "test/topic", reordering_window=ORDERED_WINDOW)
+
+    topic = list(node.topics_by_name.values())[0]
+    bc = BreadcrumbImpl(
+        node=node, remote_id=99, topic=topic, message_tag=1, initial_priority=pycyphal2.Priority.NOMINAL
+    )
+    base_tag = 1000
+    await _bootstrap_ordered(sub, bc, base_tag, 99, b"m0")
+    state = sub._reordering[(99, topic.hash)]
+
+    scheduled: list[object] = []
+    schedule = node.timer_wheel.schedule
+
+    def spy(key: object, deadline: float, callback: object) -> None:
+        scheduled.append(key)
+        schedule(key, deadline, callback)  # type: ignore[arg-type]
+
+    node.timer_wheel.schedule = spy  # type: ignore[method-assign]
+    sub.deliver(_make_arrival(0.0, bc, b"m3"), base_tag + 3, 99)
+    sub.deliver(_make_arrival(0.0, bc, b"m4"), base_tag + 4, 99)
+    sub.deliver(_make_arrival(0.0, bc, b"m5"), base_tag + 5, 99)
+    assert len(scheduled) == 1
+    sub.deliver(_make_arrival(0.0, bc, b"m2"), base_tag + 2, 99)
+    assert len(scheduled) == 2
+    assert sub.queue.empty()
+
+    await asyncio.sleep(ORDERED_WINDOW + 0.05)
+    items = []
+    while not sub.queue.empty():
+        items.append(expect_arrival(sub.queue.get_nowait()).message)
+    assert items == [b"m2", b"m3", b"m4", b"m5"]
+    assert state.armed_head is None
+    assert len(node.timer_wheel) == 0
+
+    sub.close()
+    node.close()
+
+
+def test_reordering_estimator_adapts_within_bounds():
+    est = ReorderingEstimator(0.5)
+    now = 100.0
+    lin = 8
+    for _ in range(REORDERING_ADAPT_WARMUP):
+        assert est.window == 0.5  # Not trusted until warmed up.
+        est.on_arrival(lin, now, None)
+        lin += 1
+        now += 0.01
+    for _ in range(50):
+        est.on_arrival(lin, now, None)
+        lin += 1
+        now += 0.01
+    assert est.window < 0.01  # A steady in-order stream needs almost no window.
+
+    # Tag lin arrives 30 ms after lin+1.
+    est.on_arrival(lin + 1, now, None)
+    est.on_arrival(lin, now + 0.03, now)
+    assert 0.03 <= est.window < 0.5
+
+    # A message that arrives after its gap was skipped stretches the window at once, up to the maximum.
+    est.on_skip(lin + 2, lin + 3, now)
+    assert not est.on_late(lin + 4, now + 0.1)
+    assert est.on_late(lin + 3, now + 0.1)
+    assert est.window >= 0.13
+    est.on_skip(lin + 5, lin + 5, now)
+    assert est.on_late(lin + 5, now + 10.0)
+    assert est.window == 0.5
+
+
+async def test_reorder_adaptive_windows_per_stream():
+    """A well-behaved stream converges to a short window while a reordering one keeps a longer window."""
+    net = MockNetwork()
+    tr = MockTransport(node_id=1, network=net)
+    node = new_node(tr, home="n1")
+    with pytest.raises(ValueError):
+        node.subscribe("test/topic", adaptive_reordering=True)
+    sub = subscribe_impl(node, "test/topic", reordering_window=0.5, adaptive_reordering=True)
+    topic = list(node.topics_by_name.values())[0]
+    bcs = {
+        rid: BreadcrumbImpl(
+            node=node, remote_id=rid, topic=topic, message_tag=1, initial_priority=pycyphal2.Priority.NOMINAL
+        )
+        for rid in (10, 20)
+    }
+
+    start = pycyphal2.Instant.now().s - 10.0
+    for i in range(100):
+        ts = start + i * 0.01
+        sub.deliver(_make_arrival(ts - pycyphal2.Instant.now().s, bcs[10]), 1000 + i, 10)
+        # Stream 20 swaps every fourth pair of messages, delivering the earlier one 20 ms late.
+        tag = 1000 + i
+        if i % 4 == 1:
+            tag += 1
+        elif i % 4 == 2:
+            tag -= 1
+            ts += 0.02
+        sub.deliver(_make_arrival(ts - pycyphal2.Instant.now().s, bcs[20]), tag, 20)
+
+    windows = sub.reordering_windows
+    assert set(windows) == {(10, topic.hash), (20, topic.hash)}
+    assert windows[(10, topic.hash)] < 0.01
+    assert 0.02 <= windows[(20, topic.hash)] < 0.5
+
+    ordered = subscribe_impl(node, "test/topic", reordering_window=0.5)
+    ordered.deliver(_make_arrival(0.0, bcs[10]), 1000, 10)
+    assert ordered.reordering_windows == {(10, topic.hash): 0.5}
+    assert subscribe_impl(node, "test/topic").reordering_windows == {}
+
+    node.close()
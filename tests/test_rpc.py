@@ -232,6 +232,83 @@ async def test_response_stream_reliable_dedup():
     node.close()
 
 
+async def test_response_stream_capacity_overflow():
+    """A bounded stream drops or NACKs responses that do not fit, depending on the overflow policy."""
+    net = MockNetwork()
+    tr = MockTransport(node_id=1, network=net)
+    node = new_node(tr, home="n1")
+    pub = node.advertise("test/req")
+    topic = list(node.topics_by_name.values())[0]
+
+    def respond(stream: ResponseStreamImpl, seqno: int) -> bool:
+        hdr = RspRelHeader(tag=0xAA, seqno=seqno, topic_hash=topic.hash, message_tag=stream_tag)
+        arrival = TransportArrival(
+            timestamp=pycyphal2.Instant.now(),
+            priority=pycyphal2.Priority.NOMINAL,
+            remote_id=42,
+            message=hdr.serialize() + bytes([seqno]),
+        )
+        return stream.on_response(arrival, hdr, bytes([seqno]))
+
+    expected = {
+        pycyphal2.Overflow.DROP_OLDEST: ([True, True, True], [1, 2]),
+        pycyphal2.Overflow.DROP_NEWEST: ([True, True, True], [0, 1]),
+        pycyphal2.Overflow.REJECT: ([True, True, False], [0, 1]),
+    }
+    for overflow, (acks, seqnos) in expected.items():
+        stream_tag = topic.next_tag()
+        stream = ResponseStreamImpl(
+            node=node, topic=topic, message_tag=stream_tag, response_timeout=1.0, capacity=2, overflow=overflow
+        )
+        assert [respond(stream, seqno) for seqno in range(3)] == acks
+        assert stream.dropped == 1
+        assert [(await stream.__anext__()).seqno for _ in range(stream.queue.qsize())] == seqnos
+        stream.close()
+
+    # Errors are never evicted: the oldest response goes, or the new one if only errors are queued.
+    stream_tag = topic.next_tag()
+    stream = ResponseStreamImpl(node=node, topic=topic, message_tag=stream_tag, response_timeout=1.0, capacity=2)
+    stream.on_publish_error(pycyphal2.SendError("first"))
+    assert respond(stream, 0) and respond(stream, 1)
+    assert (stream.queue.qsize(), stream.dropped) == (2, 1)
+    import pytest
+
+    with pytest.raises(pycyphal2.SendError):
+        await stream.__anext__()
+    assert (await stream.__anext__()).seqno == 1
+    stream.on_publish_error(pycyphal2.SendError("second"))
+    stream.on_publish_error(pycyphal2.SendError("third"))
+    assert respond(stream, 2)
+    assert (stream.queue.qsize(), stream.dropped) == (2, 2)
+    stream.close()
+
+    # A response NACK'd by REJECT is not recorded, so its retransmission is queued once there is room.
+    stream_tag = topic.next_tag()
+    stream = ResponseStreamImpl(
+        node=node,
+        topic=topic,
+        message_tag=stream_tag,
+        response_timeout=1.0,
+        capacity=1,
+        overflow=pycyphal2.Overflow.REJECT,
+    )
+    assert respond(stream, 0)
+    assert not respond(stream, 1)
+    assert (await stream.__anext__()).seqno == 0
+    assert respond(stream, 1)
+    assert stream.queue.qsize() == 1
+    assert not respond(stream, 2)
+    assert (await stream.__anext__()).seqno == 1
+    assert respond(stream, 1)  # A true duplicate is still ACK'd without being queued.
+    assert stream.queue.empty()
+    stream.close()
+    assert respond(stream, 1)
+    assert not respond(stream, 2)  # Never accepted, so not ACK'd after the close either.
+
+    pub.close()
+    node.close()
+
+
 async def test_response_stream_multiple_remotes():
     """Responses from different remotes should all be delivered."""
     net = MockNetwork()
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 import pycyphal2
@@ -74,3 +76,82 @@ async def test_public_scout_send_failure_raises_send_error() -> None:
         await node.scout("sensor/*")
 
     node.close()
+
+
+def _scout_arrival(pattern: str, remote_id: int = 99) -> TransportArrival:
+    return TransportArrival(
+        timestamp=pycyphal2.Instant.now(),
+        priority=pycyphal2.Priority.LOW,
+        remote_id=remote_id,
+        message=ScoutHeader(pattern_len=len(pattern)).serialize() + pattern.encode(),
+    )
+
+
+async def test_scout_responses_are_streamed_by_one_task_and_coalesced() -> None:
+    net = MockNetwork()
+    requester = MockTransport(node_id=99, network=net)
+    responses: list[TransportArrival] = []
+    requester.unicast_listen(responses.append)
+    tr = MockTransport(node_id=1, network=net)
+    node = new_node(tr, home="n1")
+    pubs = [node.advertise(f"/sensor/{i}") for i in range(300)]
+    loop = asyncio.get_running_loop()
+    tasks_before = len(asyncio.all_tasks(loop))
+
+    # The same requester scouts twice with overlapping patterns before the responses have gone out.
+    node.dispatch_arrival(_scout_arrival("sensor/>"), subject_id=node.broadcast_subject_id, unicast=False)
+    node.dispatch_arrival(_scout_arrival("sensor/7"), subject_id=node.broadcast_subject_id, unicast=False)
+    assert len(asyncio.all_tasks(loop)) == tasks_before
+    await asyncio.sleep(0.1)
+
+    names = [bytes(r.message[HEADER_SIZE:]).decode() for r in responses]
+    assert names == [f"sensor/{i}" for i in range(300)]
+    assert all(r.priority == pycyphal2.Priority.LOW for r in responses)
+
+    # Once the responses are out, a repeated scout is answered again.
+    node.dispatch_arrival(_scout_arrival("sensor/7"), subject_id=node.broadcast_subject_id, unicast=False)
+    await asyncio.sleep(0.02)
+    assert len(responses) == 301
+
+    for p in pubs:
+        p.close()
+    node.close()
+    requester.close()
+
+
+async def test_scout_responses_respect_gossip_bandwidth() -> None:
+    net = MockNetwork()
+    requester = MockTransport(node_id=99, network=net)
+    responses: list[TransportArrival] = []
+    requester.unicast_listen(responses.append)
+    tr = MockTransport(node_id=1, network=net)
+    bandwidth = 2000.0
+    node = new_node(tr, home="n1", gossip_bandwidth=bandwidth)
+    pubs = [node.advertise(f"/sensor/{i:02}") for i in range(50)]
+    await asyncio.sleep(0.05)
+    for topic in node.topics_by_name.values():
+        node._cancel_gossip(topic)  # Keep the periodic gossip out of the budget for this test.
+
+    node.dispatch_arrival(_scout_arrival("sensor/>"), subject_id=node.broadcast_subject_id, unicast=False)
+    await asyncio.sleep(0.25)
+    cost = HEADER_SIZE + len("sensor/00")
+    assert len(responses) <= ((node.gossip_pacer.capacity + (bandwidth * 0.25)) / cost) + 1
+    assert len(responses) < 50
+
+    # A topic destroyed while queued is skipped.
+    node.destroy_topic("sensor/49")
+    await asyncio.sleep(1.0)
+    assert len(responses) == 49
+
+    # Nor does it take from the budget, so that the live topics queued behind it are not held back.
+    node.dispatch_arrival(_scout_arrival("sensor/>"), subject_id=node.broadcast_subject_id, unicast=False)
+    for i in range(48):
+        node.destroy_topic(f"sensor/{i:02}")
+    await asyncio.sleep(0.05)
+    assert bytes(responses[-1].message[HEADER_SIZE:]) == b"sensor/48"
+    assert len(responses) == 50
+
+    for p in pubs:
+        p.close()
+    node.close()
+    requester.close()
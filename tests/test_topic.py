@@ -5,7 +5,7 @@ from __future__ import annotations
 import time
 
 from pycyphal2 import SUBJECT_ID_PINNED_MAX
-from pycyphal2._node import left_wins
+from pycyphal2._node import left_wins, log_age
 from pycyphal2._hash import rapidhash
 from pycyphal2._node import (
     EVICTIONS_PINNED_MIN,
@@ -15,7 +15,7 @@ from pycyphal2._node import (
     resolve_name,
 )
 from tests.mock_transport import MockTransport, MockNetwork, DEFAULT_MODULUS
-from tests.typing_helpers import new_node
+from tests.typing_helpers import expect_mock_writer, new_node
 
 # =====================================================================================================================
 # compute_subject_id
@@ -229,6 +229,71 @@ async def test_collision_allocator_iterates():
     node.close()
 
 
+async def test_collision_cascade_leaves_consistent_transport_handles():
+    """After a storm of cascading reallocations, every topic holds exactly the handles of its final subject-ID."""
+    tr = MockTransport(node_id=1, modulus=67)
+    node = new_node(tr, home="test_node")
+    subs = [node.subscribe(f"storm/{i}") for i in range(60)]
+    pubs = [node.advertise(f"storm/{i}") for i in range(0, 60, 3)]
+    topics = list(node.topics_by_name.values())
+    for topic in topics[::3]:
+        topic.ensure_writer()
+    now = time.monotonic()
+    for i, topic in enumerate(topics):
+        topic.ts_origin = now - float((i * 7919) % 100000)
+    for topic in topics:
+        node.on_gossip_known(topic, topic.evictions + 1, topic.lage(now) + 1, now, GossipScope.SHARDED)
+
+    modulus = tr.subject_id_modulus
+    sids = {t.subject_id(modulus): t for t in topics}
+    assert len(sids) == len(topics)
+    assert node.topics_by_subject_id == sids
+    assert set(node.shared_subject_listeners) == set(sids)
+    assert set(sids) <= set(tr.subject_handlers)
+    for sid, entry in node.shared_subject_listeners.items():
+        assert entry.owners == {sids[sid]}
+        assert sids[sid].sub_listener is entry.handle
+    for sid, w_entry in node.shared_subject_writers.items():
+        assert w_entry.owners == {sids[sid]}
+        assert sids[sid].pub_writer is w_entry.handle
+        assert tr.writers[sid] is expect_mock_writer(w_entry.handle)
+    assert all(t.pub_writer is None for t in topics if t.subject_id(modulus) not in node.shared_subject_writers)
+
+    for p in pubs:
+        p.close()
+    for s in subs:
+        s.close()
+    node.close()
+
+
+async def test_reallocation_to_same_subject_keeps_transport_handles():
+    """A reallocation that lands on the subject-ID the topic already has does not reopen its transport handles."""
+    tr = MockTransport(node_id=1, modulus=3)
+    node = new_node(tr, home="test_node")
+    sub = node.subscribe("my/topic")
+    pub = node.advertise("my/topic")
+    resolved, _, _ = resolve_name("my/topic", "test_node", "")
+    topic = node.topics_by_name[resolved]
+    now = time.monotonic()
+    node.on_gossip_known(topic, 1, 40, now, GossipScope.SHARDED)
+    writer = topic.ensure_writer()
+    listener = topic.sub_listener
+    sid = topic.subject_id(tr.subject_id_modulus)
+    assert compute_subject_id(topic.hash, 2, tr.subject_id_modulus) == sid  # 1 and 4 are congruent modulo 3.
+
+    node.on_gossip_known(topic, 2, 41, now, GossipScope.SHARDED)
+
+    assert topic.evictions == 2
+    assert topic.pub_writer is writer
+    assert topic.sub_listener is listener
+    assert tr.subject_listener_creations[sid] == 1
+    assert tr.subject_writer_creations[sid] == 1
+
+    pub.close()
+    sub.close()
+    node.close()
+
+
 # =====================================================================================================================
 # Gossip handling
 # =====================================================================================================================
@@ -255,7 +320,7 @@ async def test_gossip_known_divergent_evictions_we_win():
     # We won, so evictions should remain the same (our value stays).
     assert topic.evictions == old_evictions
     # Gossip should have been rescheduled urgently.
-    assert topic.gossip_task is not None
+    assert topic.gossip_deadline is not None
 
     pub.close()
     node.close()
@@ -309,6 +374,59 @@ async def test_gossip_known_same_evictions_merges_lage():
     node.close()
 
 
+async def test_lage_cache_matches_log_age_across_boundaries():
+    net = MockNetwork()
+    tr = MockTransport(node_id=1, network=net)
+    node = new_node(tr, home="test_node")
+    pub = node.advertise("my/topic")
+    topic = node.topics_by_name["my/topic"]
+
+    origin = 1000.0
+    topic.ts_origin = origin
+    for age in [-5.0, 0.0, 0.5, 0.999, 1.0, 1.5, 2.0, 3.999, 4.0, 7.0, 8.0, 1000.0, 1023.9, 1024.0, 2.0, 0.2]:
+        assert topic.lage(origin + age) == log_age(origin, origin + age), age
+
+    # Moving the origin invalidates the cache.
+    assert topic.lage(origin + 3.0) == 1
+    topic.merge_lage(origin + 3.0, 5)
+    assert topic.ts_origin == origin + 3.0 - 32
+    assert topic.lage(origin + 3.0) == 5
+
+    pub.close()
+    node.close()
+
+
+async def test_inline_gossip_fast_path_matches_slow_path():
+    """Inline gossip in the steady state has no effect beyond animating the topic."""
+    net = MockNetwork()
+    tr = MockTransport(node_id=1, network=net)
+    node = new_node(tr, home="test_node")
+    sub = node.subscribe("/implicit/>")
+    pub = node.advertise("/implicit/topic")
+    pub.close()  # The topic remains, implicit, coupled to the pattern subscriber.
+    other = node.advertise("/other")
+    topic = node.topics_by_name["implicit/topic"]
+    assert topic.is_implicit
+    now = time.monotonic()
+    topic.ts_origin = now - 100
+    origin = topic.ts_origin
+    deadline = topic.gossip_deadline
+
+    node.on_gossip_known(topic, topic.evictions, 3, now + 1, GossipScope.INLINE)
+    assert topic.ts_origin == origin
+    assert topic.ts_animated == now + 1
+    assert topic.gossip_deadline == deadline
+    assert next(iter(node._implicit_topics)) is topic
+
+    # An older remote origin still takes the slow path and is merged.
+    node.on_gossip_known(topic, topic.evictions, 10, now + 2, GossipScope.INLINE)
+    assert topic.ts_origin == now + 2 - 1024
+
+    other.close()
+    sub.close()
+    node.close()
+
+
 async def test_gossip_unknown_collision_we_win():
     """Gossip for an unknown topic that collides with ours: if we win, reschedule urgent gossip."""
     net = MockNetwork()
@@ -40,6 +40,7 @@ from pycyphal2.udp import (
     _header_serialize,
     _make_subject_endpoint,
     _segment_transfer,
+    _TxSegmentCache,
     _UDPTransportImpl,
 )
 
@@ -208,6 +209,39 @@ class TestTXSegmentation:
         assert len(frames) == 1
         assert frames[0][HEADER_SIZE:] == payload
 
+    def test_segment_cache_reuses_payload_segmentation(self):
+        """Sending the same message object again only rebuilds the headers, for the new transfer-ID."""
+        cache = _TxSegmentCache()
+        payload = os.urandom(350)
+        assert cache.segment(2, 1, 200, payload, mtu=100) == _segment_transfer(2, 1, 200, payload, mtu=100)
+        assert len(cache) == 1
+        expected = _segment_transfer(3, 2, 200, payload, mtu=100)
+        with patch("pycyphal2.udp._segment_payload", side_effect=AssertionError("recomputed")):
+            assert cache.segment(3, 2, 200, payload, mtu=100) == expected
+        assert len(cache) == 1
+
+        # Another MTU is another segmentation; an equal but distinct object is not looked at.
+        cache.segment(2, 3, 200, payload, mtu=300)
+        cache.segment(2, 4, 200, bytes(bytearray(payload)), mtu=100)
+        assert len(cache) == 3
+        # Mutable messages are never cached.
+        cache.segment(2, 5, 200, memoryview(bytearray(payload)), mtu=100)
+        assert len(cache) == 3
+
+    def test_segment_cache_evicts_least_recently_used(self):
+        cache = _TxSegmentCache(capacity=3 * (1000 + 256))
+        messages = [os.urandom(1000) for _ in range(4)]
+        for message in messages[:3]:
+            cache.segment(0, 0, 0, message, mtu=1400)
+        cache.segment(0, 0, 0, messages[0], mtu=1400)  # Refresh the oldest.
+        cache.segment(0, 0, 0, messages[3], mtu=1400)
+        assert len(cache) == 3
+        with patch("pycyphal2.udp._segment_payload", side_effect=AssertionError("recomputed")):
+            for message in (messages[0], messages[2], messages[3]):
+                cache.segment(0, 0, 0, message, mtu=1400)
+        cache.segment(0, 0, 0, os.urandom(4 * 1000), mtu=1400)  # Larger than the whole cache; not kept.
+        assert len(cache) == 3
+
 
 # =====================================================================================================================
 # RX Reassembly Tests
@@ -239,6 +273,17 @@ class TestRXReassembly:
         assert result.sender_uid == 1000
         assert result.priority == 4
 
+    def test_single_frame_payload_is_view_of_datagram(self):
+        payload = b"zero copy"
+        datagram = _segment_transfer(4, 77, 1000, payload, 1400)[0]
+        hdr = _header_deserialize(datagram[:HEADER_SIZE])
+        assert hdr is not None
+        result = _RxReassembler().accept(hdr, memoryview(datagram)[HEADER_SIZE:])
+        assert result is not None
+        assert isinstance(result.payload, memoryview)
+        assert result.payload.obj is datagram
+        assert result.payload == payload
+
     def test_multi_frame_in_order(self):
         payload = os.urandom(300)
         reasm = _RxReassembler()
@@ -1234,7 +1279,7 @@ async def test_raising_subject_handler_does_not_kill_rx_loop() -> None:
     pub = UDPTransport.new_loopback()
     sub = UDPTransport.new_loopback()
     try:
-        received: list[bytes] = []
+        received: list[bytes | memoryview] = []
 
         def handler(arrival: TransportArrival) -> None:
             received.append(arrival.message)
@@ -1292,7 +1337,7 @@ async def test_raising_unicast_handler_does_not_kill_rx() -> None:
     t = UDPTransport.new_loopback()
     assert isinstance(t, _UDPTransportImpl)
     try:
-        received: list[bytes] = []
+        received: list[bytes | memoryview] = []
 
         def handler(arrival: TransportArrival) -> None:
             received.append(arrival.message)
@@ -11,8 +11,10 @@ from pycyphal2._subscriber import SubscriberImpl
 from tests.mock_transport import MockSubjectWriter
 
 
-def new_node(transport: pycyphal2.Transport, *, home: str = "", namespace: str = "") -> NodeImpl:
-    node = pycyphal2.Node.new(transport, home=home, namespace=namespace)
+def new_node(
+    transport: pycyphal2.Transport, *, home: str = "", namespace: str = "", gossip_bandwidth: float | None = None
+) -> NodeImpl:
+    node = pycyphal2.Node.new(transport, home=home, namespace=namespace, gossip_bandwidth=gossip_bandwidth)
     assert isinstance(node, NodeImpl)
     return node
 
@@ -29,8 +31,24 @@ def advertise_impl(node: NodeImpl, name: str) -> PublisherImpl:
     return pub
 
 
-def subscribe_impl(node: NodeImpl, name: str, *, reordering_window: float | None = None) -> SubscriberImpl:
-    sub = node.subscribe(name, reordering_window=reordering_window)
+def subscribe_impl(
+    node: NodeImpl,
+    name: str,
+    *,
+    reordering_window: float | None = None,
+    adaptive_reordering: bool = False,
+    capacity: int | None = None,
+    overflow: pycyphal2.Overflow = pycyphal2.Overflow.DROP_OLDEST,
+    shared: bool = False,
+) -> SubscriberImpl:
+    sub = node.subscribe(
+        name,
+        reordering_window=reordering_window,
+        adaptive_reordering=adaptive_reordering,
+        capacity=capacity,
+        overflow=overflow,
+        shared=shared,
+    )
     assert isinstance(sub, SubscriberImpl)
     return sub
 